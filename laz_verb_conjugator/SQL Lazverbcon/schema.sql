@@ -113,4 +113,93 @@ CREATE TABLE IF NOT EXISTS verb_form (
 CREATE INDEX IF NOT EXISTS idx_verb_dialect_id     ON verb(dialect_id);
 CREATE INDEX IF NOT EXISTS idx_verb_category_id   ON verb(verb_category_id);
 CREATE INDEX IF NOT EXISTS idx_verb_form_verb_id  ON verb_form(verb_id);
-CREATE INDEX IF NOT EXISTS idx_verb_category_code ON verb_category(code);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_verb_category_code ON verb_category(code);
+
+-- =========================
+-- DATA VERSION
+-- =========================
+-- Single-row counter bumped by every write to the seeded tables. The backend
+-- polls it to invalidate its in-process caches (see db_query.get_dataset_version).
+CREATE TABLE IF NOT EXISTS data_version (
+  id         BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+  version    BIGINT NOT NULL DEFAULT 1,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+INSERT INTO data_version (id) VALUES (TRUE) ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_data_version() RETURNS trigger AS $$
+BEGIN
+  UPDATE data_version SET version = version + 1, updated_at = now();
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS verb_form_bump_data_version ON verb_form;
+CREATE TRIGGER verb_form_bump_data_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON verb_form
+FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version();
+
+DROP TRIGGER IF EXISTS verb_bump_data_version ON verb;
+CREATE TRIGGER verb_bump_data_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON verb
+FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version();
+
+DROP TRIGGER IF EXISTS pronoun_bump_data_version ON pronoun;
+CREATE TRIGGER pronoun_bump_data_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON pronoun
+FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version();
+
+
+-- =========================
+-- MATERIALIZED PARADIGMS
+-- =========================
+-- One document per (verb, tense, mood, derivation, marker set), already joined
+-- with pronoun forms: {"<frame>": [{"subject", "object", "subject_code",
+-- "object_code", "conjugation"}, ...]}. Only forms without an optional prefix
+-- are stored. Built by `flask --app backend.app refresh-paradigms`.
+CREATE TABLE IF NOT EXISTS verb_paradigm (
+  verb_id INTEGER NOT NULL REFERENCES verb(verb_id) ON DELETE CASCADE,
+
+  tense      tense NOT NULL,
+  mood       mood NOT NULL,
+  derivation derivation NOT NULL,
+
+  is_applicative      BOOLEAN NOT NULL,
+  is_causative        BOOLEAN NOT NULL,
+  is_double_causative BOOLEAN NOT NULL,
+
+  document JSONB NOT NULL,
+
+  PRIMARY KEY (
+    verb_id, tense, mood, derivation,
+    is_applicative, is_causative, is_double_causative
+  )
+);
+
+-- Which data_version each verb's documents were built from. Readers only trust
+-- verb_paradigm rows whose verb was refreshed against the current version.
+CREATE TABLE IF NOT EXISTS verb_paradigm_refresh (
+  verb_id INTEGER PRIMARY KEY REFERENCES verb(verb_id) ON DELETE CASCADE,
+  source_version BIGINT NOT NULL,
+  refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+
+-- =========================
+-- NORMALIZED SPELLINGS
+-- =========================
+-- Reverse-lookup keys for each form: the spelling lowercased by Python (SQL
+-- LOWER() folds non-ASCII letters by the database's ctype), and passed
+-- through db_query's strict and broad normalization rules. The rules live in
+-- Python (db_query.reverse_lookup_keys), so the seed notebook writes the
+-- columns with the forms it inserts. `flask --app backend.app
+-- normalize-spellings` fills rows written any other way, and rewrites them
+-- all after a change of the rules; run it before refresh-paradigms.
+ALTER TABLE verb_form ADD COLUMN IF NOT EXISTS spelling_lower       TEXT;
+ALTER TABLE verb_form ADD COLUMN IF NOT EXISTS spelling_norm_strict TEXT;
+ALTER TABLE verb_form ADD COLUMN IF NOT EXISTS spelling_norm_broad  TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_verb_form_spelling_lower       ON verb_form(spelling_lower);
+CREATE INDEX IF NOT EXISTS idx_verb_form_spelling_norm_strict ON verb_form(spelling_norm_strict);
+CREATE INDEX IF NOT EXISTS idx_verb_form_spelling_norm_broad  ON verb_form(spelling_norm_broad);
@@ -0,0 +1,82 @@
+"""
+p50/p90/p99 latency of the fuzzy reverse-lookup tier over the whole verb_form
+vocabulary: every distinct spelling gets one random single-letter typo, and
+each typo is looked up in the in-memory reverse index. The index is built
+for --max-distance and without the analyzed tier, so that the timings are
+those of the fuzzy tier alone.
+
+Run from laz_verb_conjugator/ with DATABASE_URL set:
+
+    python backend/Scripts/bench_reverse_fuzzy.py [--max-distance 1] [--limit N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend import reverse_index  # noqa: E402
+from backend.reverse_index import ReverseIndex  # noqa: E402
+
+LETTERS = "abcdefghijklmnoprstuvxyzçğşǩžǯʒ"
+
+
+def typo(spelling, rng):
+    i = rng.randrange(len(spelling))
+    edit = rng.choice(("substitute", "delete", "insert", "transpose"))
+    if edit == "substitute":
+        return spelling[:i] + rng.choice(LETTERS) + spelling[i + 1:]
+    if edit == "delete" and len(spelling) > 1:
+        return spelling[:i] + spelling[i + 1:]
+    if edit == "transpose" and i + 1 < len(spelling):
+        return spelling[:i] + spelling[i + 1] + spelling[i] + spelling[i + 2:]
+    return spelling[:i] + rng.choice(LETTERS) + spelling[i:]
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-distance", type=int, default=1)
+    parser.add_argument("--limit", type=int, default=0, help="only the first N spellings")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not 1 <= args.max_distance <= 2:
+        parser.error("--max-distance must be 1 or 2")
+
+    # The deletion index only finds spellings within the distance it is built for.
+    reverse_index.REVERSE_FUZZY_MAX_DISTANCE = args.max_distance
+    reverse_index.REVERSE_ANALYZER_ENABLED = False
+
+    started = time.perf_counter()
+    index = ReverseIndex.build()
+    print(f"Indexed {len(index)} forms (fuzzy distance {index.fuzzy.max_distance}) "
+          f"in {time.perf_counter() - started:.1f}s")
+
+    rng = random.Random(args.seed)
+    spellings = sorted(set(index.columns["spelling"]))
+    if args.limit:
+        spellings = spellings[:args.limit]
+    queries = [typo(spelling, rng) for spelling in spellings]
+
+    timings = []
+    fuzzy = 0
+    for query in queries:
+        started = time.perf_counter()
+        matches = index.lookup(query, args.max_distance)
+        timings.append((time.perf_counter() - started) * 1000)
+        fuzzy += bool(matches) and matches[0]["match_type"] == "fuzzy"
+
+    timings.sort()
+    print(f"{len(queries)} queries, {fuzzy} answered by the fuzzy tier")
+    for label, fraction in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99)):
+        print(f"{label}: {percentile(timings, fraction):.3f} ms")
+    print(f"max: {timings[-1]:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
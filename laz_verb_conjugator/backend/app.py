@@ -1,10 +1,28 @@
-from flask import Flask, request, jsonify
+import click
+import functools
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
 import logging
 import os
-import json
 
-from backend.db_query import get_verb_id, get_conjugation_rows, reverse_lookup, reverse_suggestions
+from backend.db_query import (
+    DERIVATIONS,
+    DIALECT_CODES,
+    MOODS,
+    TENSES,
+    Markers,
+    ParadigmRequest,
+    ReverseCursor,
+    get_full_paradigm,
+    get_paradigm,
+    get_paradigms,
+    paradigm_cache,
+    pool_stats,
+    refresh_normalized_spellings,
+    refresh_paradigms,
+    request_scope,
+    spelling_normalizer,
+)
 from flask_jwt_extended import JWTManager
 
 from backend.config.webhook_config import WebhookConfig
@@ -16,6 +34,26 @@ from backend.services.webhook import (
 )
 
 from backend.admin import admin
+from backend.http_cache import conditional, request_etag, response_cache
+from backend.popularity import POPULARITY_TABLE, aggregate, log_files, write_table
+from backend.request_log import RequestLogger
+from backend.reverse_index import (
+    REVERSE_INDEX_ENABLED,
+    REVERSE_INDEX_PREWARM,
+    REVERSE_INDEX_SNAPSHOT,
+    analyze_passage,
+    ensure_reverse_index,
+    group_matches,
+    load_reverse_index,
+    reverse_index_stats,
+    reverse_index_variant,
+    reverse_search_page,
+    reverse_suggest,
+    reverse_suggestions_variant,
+    write_snapshot,
+)
+from backend.serialization import EncodedResponse, dumps
+from backend.tense_modules import TENSE_MODULES_PREWARM, tense_modules
 from backend.verbs import verbs
 from backend import db  # Should fail if the database is not set.
 
@@ -26,36 +64,15 @@ from backend import db  # Should fail if the database is not set.
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-req_res_logger = logging.getLogger("request_response")
-req_res_logger.setLevel(logging.INFO)
-
 LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 
-req_res_handler = logging.FileHandler(
-    os.path.join(LOG_DIR, "request_response.log"),
-    encoding="utf-8"
-)
-req_res_handler.setLevel(logging.INFO)
-
-formatter = logging.Formatter("%(asctime)s - %(message)s")
-req_res_handler.setFormatter(formatter)
-
-if not any(
-    isinstance(h, logging.FileHandler)
-    and getattr(h, "baseFilename", "") == req_res_handler.baseFilename
-    for h in req_res_logger.handlers
-):
-    req_res_logger.addHandler(req_res_handler)
+REQUEST_LOG_PATH = os.path.join(LOG_DIR, "request_response.log")
+request_logger = RequestLogger(REQUEST_LOG_PATH)
 
 
 def log_request_response(request_params, response_data, endpoint):
-    log_entry = {
-        "endpoint": endpoint,
-        "request": request_params,
-        "response": response_data,
-    }
-    req_res_logger.info(json.dumps(log_entry, ensure_ascii=False))
+    request_logger.log(request_params, response_data, endpoint)
 
 
 # -----------------------
@@ -88,6 +105,30 @@ CORS(
     },
 )
 
+# One pooled connection per request, shared by every db_query call
+@app.before_request
+def open_db_scope():
+    g.db_scope = request_scope()
+    g.db_scope.__enter__()
+
+
+@app.teardown_request
+def close_db_scope(exc):
+    db_scope = g.pop("db_scope", None)
+    if db_scope is not None:
+        db_scope.__exit__(None, None, None)
+
+
+# Workers load the snapshot written by `flask build-reverse-index` rather
+# than each building the index from the database
+if REVERSE_INDEX_ENABLED and not load_reverse_index() and REVERSE_INDEX_PREWARM:
+    ensure_reverse_index()
+
+if TENSE_MODULES_PREWARM:
+    tense_modules.prewarm()
+    logger.info("Tense modules at startup: %s", dumps(tense_modules.report()).decode())
+
+
 webhook_config = WebhookConfig.load()
 webhook_service = WebhookService(webhook_config)
 
@@ -129,141 +170,325 @@ def hi():
     return jsonify({"response": "pong!"})
 
 
+@app.route("/api/stats", methods=["GET"])
+def stats():
+    return jsonify({
+        "paradigm_cache": paradigm_cache.stats(),
+        "db_pool": pool_stats(),
+        "response_cache": response_cache.stats(),
+        "request_log": request_logger.stats(),
+        "reverse_index": reverse_index_stats(),
+        "tense_modules": tense_modules.report(),
+    })
+
+
 # -----------------------
-# Helpers
+# CLI
 # -----------------------
-def _bool_arg(name: str) -> bool:
-    return (request.args.get(name, "") or "").lower() == "true"
+@app.cli.command("refresh-paradigms")
+@click.argument("verb_ids", nargs=-1, type=int)
+def refresh_paradigms_command(verb_ids):
+    """Rebuild the verb_paradigm store for all verbs, or only VERB_IDS."""
+    counts = refresh_paradigms(verb_ids or None)
+    click.echo(
+        f"Refreshed {counts['verbs']} verbs: "
+        f"{counts['written']} documents written, {counts['deleted']} deleted."
+    )
+    if REVERSE_INDEX_ENABLED and REVERSE_INDEX_SNAPSHOT:
+        build_reverse_index_command.callback()
+
+
+@app.cli.command("build-reverse-index")
+def build_reverse_index_command():
+    """Write the reverse-lookup index snapshot that workers load at startup."""
+    if not REVERSE_INDEX_SNAPSHOT:
+        raise click.UsageError("REVERSE_INDEX_SNAPSHOT is empty: the snapshot is disabled.")
+    index = write_snapshot()
+    click.echo(f"Indexed {len(index)} verb forms into {REVERSE_INDEX_SNAPSHOT}.")
+
+
+@app.cli.command("aggregate-popularity")
+@click.option("--log", "log_path", default=REQUEST_LOG_PATH, show_default=True,
+              help="Request log to read, with its rotated backups.")
+@click.option("--output", default=POPULARITY_TABLE, show_default=True,
+              help="Where to write the frequency table.")
+def aggregate_popularity_command(log_path, output):
+    """Count looked-up spellings and verbs in the request log, for suggestion ranking."""
+    popularity = aggregate(log_files(log_path), spelling_normalizer.strict)
+    write_table(popularity, output)
+    click.echo(
+        f"Counted {len(popularity.spellings)} spellings and "
+        f"{len(popularity.infinitives)} infinitives into {output}."
+    )
+
+
+@app.cli.command("tense-modules-report")
+@click.argument("names", nargs=-1)
+def tense_modules_report_command(names):
+    """Import the tense modules NAMES (default: all) and print what each cost."""
+    tense_modules.prewarm(names or tense_modules.names)
+    click.echo(dumps(tense_modules.report()).decode())
+
+
+@app.cli.command("normalize-spellings")
+def normalize_spellings_command():
+    """Fill the normalized spelling columns used by reverse lookup."""
+    updated = refresh_normalized_spellings()
+    click.echo(f"Normalized spellings of {updated} verb forms.")
 
 
 # -----------------------
-# Conjugation (DB-backed)
+# Helpers
 # -----------------------
-@app.route("/api/conjugate", methods=["GET"])
-def conjugate():
-    request_params = dict(request.args)
-
-    infinitive = request.args.get("infinitive", "").strip()
-    tense = request.args.get("tense", "present")
+CONJUGATE_BATCH_MAX = int(os.getenv("CONJUGATE_BATCH_MAX", "200"))
+REVERSE_ANALYZE_MAX_CHARS = int(os.getenv("REVERSE_ANALYZE_MAX_CHARS", "20000"))
+# Reverse-lookup matches per page when no limit is given, and the most a page may hold
+REVERSE_PAGE_SIZE = int(os.getenv("REVERSE_PAGE_SIZE", "50"))
+REVERSE_PAGE_MAX = int(os.getenv("REVERSE_PAGE_MAX", "500"))
+
+
+def _bool_arg(args, name: str) -> bool:
+    value = args.get(name, "")
+    if isinstance(value, bool):
+        return value
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"Invalid {name}: expected true or false")
+    return (value or "").lower() == "true"
+
+
+def _str_arg(args, name: str, default=None):
+    value = args.get(name, default)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"Invalid {name}: expected a string")
+    return value
+
+
+def _parse_conjugate_args(args):
+    """
+    Turn /api/conjugate arguments (query string or one batch item) into a
+    ParadigmRequest and the "selected" block echoed back in the response.
+    Raises ValueError for arguments of the wrong type or outside the
+    database's tense, mood and derivation enums.
+    """
+    infinitive = (_str_arg(args, "infinitive", "") or "").strip()
+    tense = _str_arg(args, "tense", "present")
 
     # Support both old frontend ("aspect", optative/imperative flags)
     # and newer frontend ("derivation", "mood")
-    aspect = request.args.get("aspect", "")
-    derivation = request.args.get("derivation")
+    aspect = _str_arg(args, "aspect", "")
+    derivation = _str_arg(args, "derivation")
     if not derivation:
         derivation = aspect if aspect in ("passive", "potential") else "none"
 
-    mood = request.args.get("mood")
-    optative = _bool_arg("optative")
-    imperative = _bool_arg("imperative")
-    neg_imperative = _bool_arg("neg_imperative")
-
+    mood = _str_arg(args, "mood")
     if not mood:
-        if optative:
+        if _bool_arg(args, "optative"):
             mood = "optative"
-        elif imperative:
+        elif _bool_arg(args, "imperative"):
             mood = "imperative"
-        elif neg_imperative:
+        elif _bool_arg(args, "neg_imperative"):
             mood = "negative_imperative"
         else:
             mood = "indicative"
 
-    is_applicative = _bool_arg("applicative")
-    is_causative = _bool_arg("simple_causative")
-    is_double_causative = _bool_arg("causative")
+    markers = Markers(
+        is_applicative=_bool_arg(args, "applicative"),
+        is_causative=_bool_arg(args, "simple_causative"),
+        is_double_causative=_bool_arg(args, "causative"),
+    )
+
+    for name, value, allowed in (("tense", tense, TENSES), ("mood", mood, MOODS), ("derivation", derivation, DERIVATIONS)):
+        if value not in allowed:
+            raise ValueError(f"Invalid {name}: {value!r} (expected one of {', '.join(allowed)})")
+
+    subject = _str_arg(args, "subject", "all")
+    obj = _str_arg(args, "obj", "")
+    regions = args.get("region", "") or ""
+    if isinstance(regions, str):
+        regions = regions.split(",")
+    elif not isinstance(regions, list) or not all(isinstance(region, str) for region in regions):
+        raise ValueError("Invalid region: expected a comma-separated string or a list of strings")
+
+    selected_region_codes = [r.strip() for r in regions if r.strip()]
+
+    dialect_ids = [
+        dialect_id
+        for dialect_id, code in DIALECT_CODES.items()
+        if not selected_region_codes or code in selected_region_codes
+    ]
+
+    paradigm_request = ParadigmRequest(
+        infinitive=infinitive,
+        dialect_ids=dialect_ids,
+        tense=tense,
+        mood=mood,
+        derivation=derivation,
+        markers=markers,
+        subject=subject,
+        object=obj,
+    )
+
+    selected = {
+        "tense": tense,
+        "mood": mood,
+        "derivation": derivation,
+        "subject": subject,
+        "object": obj,
+        "regions": selected_region_codes,
+        "is_applicative": markers.is_applicative,
+        "is_causative": markers.is_causative,
+        "is_double_causative": markers.is_double_causative,
+    }
 
-    subject = request.args.get("subject", "all")
-    obj = request.args.get("obj", "")
-    region_csv = request.args.get("region", "")
+    return paradigm_request, selected
 
-    if not infinitive:
-        payload = {
-            "error": "Missing infinitive"
-        }
-        log_request_response(request_params, payload, "/api/conjugate")
-        return jsonify(payload), 400
 
-    # Your actual DB mapping
-    dialects = {
-        1: "AŞ",
-        2: "PZ",
-        3: "FA",
-        4: "HO",
-    }
+def encoded_json(endpoint: str):
+    """
+    Decorate a read view returning (payload, status). The encoded response is
+    kept in http_cache.response_cache under the request's ETag, so a repeat
+    request is served from ready-made (and, once asked for, compressed)
+    bytes without running the view. Every 200 or error answer is logged;
+    304 revalidations are answered by conditional() before this runs and
+    are not.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            request_params = {**kwargs, **request.args}
 
-    selected_region_codes = []
-    if region_csv.strip():
-        selected_region_codes = [r.strip() for r in region_csv.split(",") if r.strip()]
+            key = request_etag()
+            encoded = response_cache.get(key)
+            if encoded is None:
+                payload, status = view(*args, **kwargs)
+                encoded = EncodedResponse(payload, status)
+                response_cache.set(key, encoded)
+
+            log_request_response(request_params, encoded.payload, endpoint)
+            return encoded.to_response(request.accept_encodings)
+
+        return wrapper
+
+    return decorator
 
-    if selected_region_codes:
-        dialects = {
-            dialect_id: code
-            for dialect_id, code in dialects.items()
-            if code in selected_region_codes
-        }
 
-    frames = ["Dative", "Ergative", "Nominative"]
-    results = {}
+def _conjugate_payload(results, selected):
+    if not results:
+        return {"error": "Verb not found"}, 404
+
+    return {"result": results, "meta": {"selected": selected}}, 200
 
-    for dialect_id, dialect_code in dialects.items():
-        verb_id = get_verb_id(infinitive, dialect_id)
-        if verb_id is None:
+
+# -----------------------
+# Conjugation (DB-backed)
+# -----------------------
+@app.route("/api/conjugate", methods=["GET"])
+@conditional()
+@encoded_json("/api/conjugate")
+def conjugate():
+    try:
+        paradigm_request, selected = _parse_conjugate_args(request.args)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+    if not paradigm_request.infinitive:
+        return {"error": "Missing infinitive"}, 400
+
+    results = get_paradigm(*paradigm_request)
+    return _conjugate_payload(results, selected)
+
+
+@app.route("/api/conjugate/batch", methods=["POST"])
+def conjugate_batch():
+    """
+    Conjugate many verbs in one call.
+
+    The body is a JSON list of /api/conjugate argument objects (or
+    {"requests": [...]}). Items sharing tense, mood, derivation and markers
+    are fetched together, and each answer is streamed as one NDJSON line
+    {"index": i, "status": ..., <the /api/conjugate payload>} as soon as its
+    group is ready, so lines may arrive out of request order.
+    """
+    body = request.get_json(silent=True)
+    items = body.get("requests") if isinstance(body, dict) else body
+
+    if not isinstance(items, list):
+        payload = {"error": "Expected a JSON list of conjugation requests"}
+        log_request_response(body, payload, "/api/conjugate/batch")
+        return jsonify(payload), 400
+
+    if len(items) > CONJUGATE_BATCH_MAX:
+        payload = {"error": f"At most {CONJUGATE_BATCH_MAX} requests per batch"}
+        log_request_response({"size": len(items)}, payload, "/api/conjugate/batch")
+        return jsonify(payload), 413
+
+    invalid = []
+    groups = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            invalid.append((index, item, {"error": "Expected an object"}))
             continue
 
-        results[dialect_code] = {}
-
-        for frame in frames:
-            rows = get_conjugation_rows(
-                verb_id=verb_id,
-                tense=tense,
-                frame=frame,
-                mood=mood,
-                derivation=derivation,
-                is_applicative=is_applicative,
-                is_causative=is_causative,
-                is_double_causative=is_double_causative,
-                subject_filter=subject,
-                object_filter=obj,
-            )
-
-            forms = []
-            for r in rows:
-                forms.append({
-                    "subject": r["subject"],
-                    "object": r["object"],
-                    "subject_code": r["subject_code"],
-                    "object_code": r["object_code"],
-                    "conjugation": r["spelling"]
-                })
-
-            results[dialect_code][frame] = forms
+        try:
+            paradigm_request, selected = _parse_conjugate_args(item)
+        except ValueError as e:
+            invalid.append((index, item, {"error": str(e)}))
+            continue
+        if not paradigm_request.infinitive:
+            invalid.append((index, item, {"error": "Missing infinitive"}))
+            continue
+
+        group = (
+            paradigm_request.tense,
+            paradigm_request.mood,
+            paradigm_request.derivation,
+            paradigm_request.markers,
+        )
+        groups.setdefault(group, []).append((index, item, paradigm_request, selected))
+
+    def line(index, status, payload):
+        return dumps({"index": index, "status": status, **payload}) + b"\n"
+
+    def generate():
+        for index, item, payload in invalid:
+            log_request_response(item, payload, "/api/conjugate/batch")
+            yield line(index, 400, payload)
+
+        for members in groups.values():
+            results = get_paradigms([member[2] for member in members])
+            for (index, item, _, selected), result in zip(members, results):
+                payload, status = _conjugate_payload(result, selected)
+                log_request_response(item, payload, "/api/conjugate/batch")
+                yield line(index, status, payload)
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+@app.route("/api/verbs/<infinitive>/paradigm", methods=["GET"])
+@conditional()
+@encoded_json("/api/verbs/paradigm")
+def verb_paradigm(infinitive):
+    dialects_csv = request.args.get("dialects", "")
+    selected_dialect_codes = [d.strip() for d in dialects_csv.split(",") if d.strip()]
+
+    dialect_ids = [
+        dialect_id
+        for dialect_id, code in DIALECT_CODES.items()
+        if not selected_dialect_codes or code in selected_dialect_codes
+    ]
+
+    results = get_full_paradigm(infinitive.strip(), dialect_ids)
 
     if not results:
-        payload = {
-            "error": "Verb not found"
-        }
-        log_request_response(request_params, payload, "/api/conjugate")
-        return jsonify(payload), 404
+        return {"error": "Verb not found"}, 404
 
     payload = {
+        "infinitive": infinitive,
         "result": results,
-        "meta": {
-            "selected": {
-                "tense": tense,
-                "mood": mood,
-                "derivation": derivation,
-                "subject": subject,
-                "object": obj,
-                "regions": selected_region_codes,
-                "is_applicative": is_applicative,
-                "is_causative": is_causative,
-                "is_double_causative": is_double_causative,
-            }
-        }
+        "meta": {"dialects": selected_dialect_codes},
     }
 
-    log_request_response(request_params, payload, "/api/conjugate")
-    return jsonify(payload), 200
+    return payload, 200
 
 
 # -----------------------
@@ -274,45 +499,86 @@ def conjugate():
 # Reverse lookup
 # -----------------------
 @app.route("/api/reverse", methods=["GET"])
+@conditional(variant=reverse_index_variant)
+@encoded_json("/api/reverse")
 def reverse():
-    request_params = dict(request.args)
-
+    """
+    Reverse lookup, one page at a time: `limit` matches (REVERSE_PAGE_SIZE by
+    default, at most REVERSE_PAGE_MAX) and, while more remain, a
+    `next_cursor` to pass back as `cursor`. `total` counts the rows of the
+    matching tier, `groups` the page's matches per (infinitive, dialect).
+    """
     spelling = request.args.get("spelling", "").strip()
 
     if not spelling:
-        payload = {"error": "Missing spelling"}
-        log_request_response(request_params, payload, "/api/reverse")
-        return jsonify(payload), 400
+        return {"error": "Missing spelling"}, 400
 
-    matches = reverse_lookup(spelling)
+    try:
+        limit = int(request.args.get("limit", REVERSE_PAGE_SIZE))
+        cursor_arg = request.args.get("cursor", "").strip()
+        cursor = ReverseCursor.decode(cursor_arg) if cursor_arg else None
+    except ValueError:
+        return {"error": "Invalid limit or cursor"}, 400
+    limit = max(1, min(limit, REVERSE_PAGE_MAX))
+
+    page = reverse_search_page(spelling, limit, cursor)
+    matches = page.matches
     match_type = matches[0].get("match_type", "exact") if matches else "none"
 
     payload = {
         "query": spelling,
         "match_type": match_type,
         "matches": matches,
+        "groups": group_matches(matches),
+        "total": page.total,
+        "limit": limit,
+        "next_cursor": page.next_cursor.encode() if page.next_cursor is not None else None,
     }
 
-    log_request_response(request_params, payload, "/api/reverse")
-    return jsonify(payload), 200
+    return payload, 200
 
 
 @app.route("/api/reverse/suggestions", methods=["GET"])
+@conditional(variant=reverse_suggestions_variant)
+@encoded_json("/api/reverse/suggestions")
 def reverse_suggestions_route():
-    request_params = dict(request.args)
-
     q = request.args.get("q", "").strip()
 
     if not q:
-        payload = {"suggestions": []}
-        log_request_response(request_params, payload, "/api/reverse/suggestions")
-        return jsonify(payload), 200
+        return {"suggestions": []}, 200
+
+    suggestions = reverse_suggest(q)
+
+    return {"suggestions": suggestions}, 200
+
+
+@app.route("/api/reverse/analyze", methods=["POST"])
+def reverse_analyze():
+    """
+    Reverse-look-up every word of a passage in one call.
+
+    The body is {"text": "..."}. The answer lists the tokens in text order
+    ({"token", "start", "end", "match_type"}, compound forms as one token)
+    and, under "matches", the /api/reverse matches of each distinct token.
+    """
+    body = request.get_json(silent=True)
+    passage = body.get("text") if isinstance(body, dict) else None
+
+    if not isinstance(passage, str):
+        payload = {"error": "Expected a JSON object with a text"}
+        log_request_response(body, payload, "/api/reverse/analyze")
+        return jsonify(payload), 400
+
+    if len(passage) > REVERSE_ANALYZE_MAX_CHARS:
+        payload = {"error": f"At most {REVERSE_ANALYZE_MAX_CHARS} characters per text"}
+        log_request_response({"size": len(passage)}, payload, "/api/reverse/analyze")
+        return jsonify(payload), 413
 
-    suggestions = reverse_suggestions(q)
+    tokens, matches = analyze_passage(passage)
+    payload = {"tokens": tokens, "matches": matches}
 
-    payload = {"suggestions": suggestions}
-    log_request_response(request_params, payload, "/api/reverse/suggestions")
-    return jsonify(payload), 200
+    log_request_response({"size": len(passage), "tokens": len(tokens)}, payload, "/api/reverse/analyze")
+    return EncodedResponse(payload).to_response(request.accept_encodings)
 # -----------------------
 # Run
 # -----------------------
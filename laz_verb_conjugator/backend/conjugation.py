@@ -1,11 +1,15 @@
 # conjugation.py
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Any, Optional, Dict, Tuple
+import os
+import threading
+from dataclasses import dataclass, asdict, field
+from typing import Any, NamedTuple, Optional, Dict, Tuple
 
+from backend.cache import LRUCache
 from backend.validators import ConjugationValidator
 from backend.services.conjugation import ConjugationService
+from backend.tense_modules import VerbCategory, VerbMembership, membership_for
 
 
 SIMPLIFIED_TENSE_MAPPING = {
@@ -21,6 +25,11 @@ SIMPLIFIED_ASPECT_MAPPING = {
     "passive": ["tvm_tve_passive"],
 }
 
+PRESENTPERF_MAPPING = {"presentperf": ["tvm_tve_presentperf"]}
+
+# Routing plans kept per planner, keyed by infinitive, tense, aspect and markers
+CONJUGATION_PLAN_CACHE_SIZE = int(os.getenv("CONJUGATION_PLAN_CACHE_SIZE", "4096"))
+
 SPECIAL_IVD_PAST_AS_PASTPRO = {"uğun", "oçkinu", "uyonun", "uqoun", "unon"}
 SPECIAL_REQUIRES_MARKER = {"gexvamu", "cexvamu", "otebriǩu", "oteşekkyuru"}
 
@@ -53,49 +62,19 @@ class ConjugationMeta:
     selected: Dict[str, Any]
 
 
-def check_verb_existence(infinitive: str, tense_modules: Dict[str, Any]) -> Tuple[bool, bool, bool, bool]:
-    """Copied from app.py, moved here."""
-    infinitive = infinitive.lower().strip()
-
-    # IVD
-    exists_in_ivd = False
-    for module_name in ["ivd_present", "ivd_past", "ivd_pastpro", "ivd_future"]:
-        mod = tense_modules.get(module_name)
-        if mod and hasattr(mod, "verbs"):
-            verbs = {v.lower().strip() for v in mod.verbs}
-            if infinitive in verbs:
-                exists_in_ivd = True
-                break
-
-    # TVE
-    exists_in_tve = False
-    for module_name in ["tve_present", "tve_past", "tve_pastpro", "tve_future"]:
-        mod = tense_modules.get(module_name)
-        if mod and hasattr(mod, "verbs"):
-            verbs = {v.lower().strip() for v in mod.verbs}
-            if infinitive in verbs:
-                exists_in_tve = True
-                break
-
-    # TVM
-    exists_in_tvm = False
-    tvm_mod = tense_modules.get("tvm_tense")
-    if tvm_mod and hasattr(tvm_mod, "verbs"):
-        verbs = {v.lower().strip() for v in tvm_mod.verbs}
-        if infinitive in verbs:
-            exists_in_tvm = True
-
-    # TVM/TVE special modules
-    exists_in_tvm_tve = False
-    for module_name in ["tvm_tve_presentperf", "tvm_tve_potential", "tvm_tve_passive"]:
-        mod = tense_modules.get(module_name)
-        if mod and hasattr(mod, "verbs"):
-            verbs = {v.lower().strip() for v in mod.verbs}
-            if infinitive in verbs:
-                exists_in_tvm_tve = True
-                break
-
-    return exists_in_ivd, exists_in_tve, exists_in_tvm, exists_in_tvm_tve
+def check_verb_existence(
+    infinitive: str, tense_modules: Dict[str, Any], membership: Optional[VerbMembership] = None
+) -> Tuple[bool, bool, bool, bool]:
+    """Whether the verb is IVD, TVE, TVM and TVM/TVE, from the modules' verb membership."""
+    if membership is None:
+        membership = membership_for(tense_modules)
+    categories = membership.get(infinitive).categories
+    return (
+        bool(categories & VerbCategory.IVD),
+        bool(categories & VerbCategory.TVE),
+        bool(categories & VerbCategory.TVM),
+        bool(categories & VerbCategory.TVM_TVE),
+    )
 
 
 def _request_params(
@@ -174,6 +153,195 @@ def _meta(
     )
 
 
+class Route(NamedTuple):
+    validator: ConjugationValidator
+    service: ConjugationService
+
+
+@dataclass(frozen=True)
+class ConjugationPlan:
+    """
+    How conjugate_verb answers one (infinitive, tense, aspect, markers)
+    combination, in the order it tries things. Only the object check and
+    the validators/services' own work depend on the rest of the request.
+    The mappings are shared between requests: read them, don't change them.
+    """
+    infinitive: str
+    tense: Optional[str]
+    aspect: Optional[str]
+    has_markers: bool
+    exists: Tuple[bool, bool, bool, bool] = (False, False, False, False)  # ivd, tve, tvm, tvm_tve
+
+    error: Optional[Tuple[str, str]] = None  # (message, reason) returned before conjugating
+    obj_error: Optional[str] = None  # returned when the request has no object
+    aspect_route: Optional[Route] = None
+    markers_forbidden: bool = False
+    presentperf_route: Optional[Route] = None
+
+    ivd_route: Optional[Route] = None
+    tve_route: Optional[Route] = None
+    tvm_route: Optional[Route] = None
+    ivd_mapping: Dict[str, Any] = field(default_factory=dict)
+    tve_mapping: Dict[str, Any] = field(default_factory=dict)
+    tvm_mapping: Dict[str, Any] = field(default_factory=dict)
+
+
+def _freeze_mapping(mapping: Dict[str, Any]):
+    return tuple((key, tuple(modules)) for key, modules in mapping.items())
+
+
+class ConjugationPlanner:
+    """
+    Compiles requests into ConjugationPlans, memoized in an LRU. Validators
+    and services hold no per-request state, so there is one pair per
+    distinct module mapping, shared by every plan that routes through it.
+    """
+
+    def __init__(self, tense_modules: Dict[str, Any], membership: Optional[VerbMembership] = None,
+                 cache_size: int = CONJUGATION_PLAN_CACHE_SIZE):
+        self.tense_modules = tense_modules
+        self.membership = membership if membership is not None else membership_for(tense_modules)
+        self.cache = LRUCache(cache_size)
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def _route(self, tense_mapping: Dict[str, Any], aspect_mapping: Dict[str, Any]) -> Route:
+        key = (_freeze_mapping(tense_mapping), _freeze_mapping(aspect_mapping))
+        route = self._routes.get(key)
+        if route is None:
+            with self._lock:
+                route = self._routes.get(key)
+                if route is None:
+                    route = self._routes[key] = Route(
+                        ConjugationValidator(self.tense_modules, tense_mapping, aspect_mapping, self.membership),
+                        ConjugationService(self.tense_modules, tense_mapping, aspect_mapping, self.membership),
+                    )
+        return route
+
+    def plan(
+        self,
+        *,
+        infinitive: str,
+        tense: Optional[str] = None,
+        aspect: Optional[str] = None,
+        applicative: bool = False,
+        causative: bool = False,
+        simple_causative: bool = False,
+    ) -> ConjugationPlan:
+        key = (
+            (infinitive or "").strip().lower(),
+            tense or None,
+            aspect or None,
+            bool(applicative),
+            bool(causative),
+            bool(simple_causative),
+        )
+        plan = self.cache.get(key)
+        if plan is None:
+            plan = self._compile(*key)
+            self.cache.set(key, plan)
+        return plan
+
+    def _compile(self, infinitive, tense, aspect, applicative, causative, simple_causative) -> ConjugationPlan:
+        has_markers = any([applicative, causative, simple_causative])
+        plan = dict(infinitive=infinitive, tense=tense, aspect=aspect, has_markers=has_markers)
+
+        # conflicting marker rule
+        if causative and simple_causative:
+            return ConjugationPlan(**plan, error=("Select only one causative type at a time.", "conflicting_causatives"))
+
+        if not infinitive:
+            return ConjugationPlan(**plan, error=("Infinitive is required", "missing_infinitive"))
+
+        # special-case: "guri mentxu"
+        if infinitive == "guri mentxu" and aspect != "potential":
+            return ConjugationPlan(**plan, error=(
+                "This verb only exists in potential form. You need to select the potential form under 'Aspect'",
+                "guri_mentxu_requires_potential",
+            ))
+
+        # existence flags
+        plan["exists"] = check_verb_existence(infinitive, self.tense_modules, self.membership)
+        exists_in_ivd, exists_in_tve, exists_in_tvm, exists_in_tvm_tve = plan["exists"]
+
+        # requires marker verbs
+        if infinitive in SPECIAL_REQUIRES_MARKER and aspect is None and not has_markers:
+            return ConjugationPlan(**plan, error=(
+                "This verb requires a marker (applicative, causative or double causative)/bu fiile uygulamalı, oldurgan veya ettirgen belirteci gerekiyor.",
+                "marker_required",
+            ))
+
+        # TVE marker requires object
+        if exists_in_tve and has_markers:
+            plan["obj_error"] = (
+                "Applicative requires an object to be specified. / Uygulamalı belirteç bir nesnenin belirtilmesini gerektirir."
+                if applicative
+                else "Causative requires an object to be specified. / Ettirgen belirteç bir nesnenin belirtilmesini gerektirir"
+            )
+
+        # ---- Aspect path (potential / passive) ----
+        if aspect and aspect in SIMPLIFIED_ASPECT_MAPPING and exists_in_tvm_tve:
+            plan["aspect_route"] = self._route({}, SIMPLIFIED_ASPECT_MAPPING)
+
+        # marker restriction: IVD-only verbs cannot take markers
+        plan["markers_forbidden"] = exists_in_ivd and not (exists_in_tve or exists_in_tvm_tve) and has_markers
+
+        # ---- Present perfect special handling ----
+        if tense == "presentperf":
+            plan["presentperf_route"] = self._route(PRESENTPERF_MAPPING, {})
+
+        # ---- Regular tense path ----
+        ivd_mapping: Dict[str, Any] = {}
+        tve_mapping: Dict[str, Any] = {}
+        tvm_mapping: Dict[str, Any] = {}
+
+        for tense_key, modules in SIMPLIFIED_TENSE_MAPPING.items():
+            if not isinstance(modules, list):
+                continue
+
+            ivd_modules_for_tense = [m for m in modules if isinstance(m, str) and m.startswith("ivd_")]
+            tve_modules_for_tense = [m for m in modules if isinstance(m, str) and m.startswith("tve_")]
+            tvm_modules_for_tense = [m for m in modules if isinstance(m, tuple) or (isinstance(m, str) and m.startswith("tvm_"))]
+
+            if ivd_modules_for_tense and exists_in_ivd and not has_markers:
+                if tense_key == "past" and infinitive in SPECIAL_IVD_PAST_AS_PASTPRO:
+                    ivd_mapping[tense_key] = ["ivd_pastpro"]
+                else:
+                    ivd_mapping[tense_key] = ivd_modules_for_tense
+
+            if tve_modules_for_tense and exists_in_tve:
+                tve_mapping[tense_key] = tve_modules_for_tense
+
+            if tvm_modules_for_tense and exists_in_tvm:
+                tvm_mapping[tense_key] = tvm_modules_for_tense
+
+        return ConjugationPlan(
+            **plan,
+            ivd_route=self._route(ivd_mapping, {}) if exists_in_ivd and not has_markers else None,
+            tve_route=self._route(tve_mapping, {}) if exists_in_tve else None,
+            tvm_route=self._route(tvm_mapping, {}) if exists_in_tvm else None,
+            ivd_mapping=ivd_mapping,
+            tve_mapping=tve_mapping,
+            tvm_mapping=tvm_mapping,
+        )
+
+
+_planners = LRUCache(8)
+
+
+def planner_for(tense_modules: Dict[str, Any]) -> ConjugationPlanner:
+    """
+    The planner of a tense_modules mapping, made on first use. Its plans
+    reflect the modules the mapping held then.
+    """
+    planner = _planners.get(id(tense_modules))
+    # The planner keeps its mapping alive, so the id cannot be reused while it is cached
+    if planner is None or planner.tense_modules is not tense_modules:
+        planner = ConjugationPlanner(tense_modules)
+        _planners.set(id(tense_modules), planner)
+    return planner
+
+
 def conjugate_verb(
     *,
     tense_modules: Dict[str, Any],
@@ -188,6 +356,7 @@ def conjugate_verb(
     applicative: bool = False,
     causative: bool = False,
     simple_causative: bool = False,
+    planner: Optional[ConjugationPlanner] = None,
 ) -> Dict[str, Any]:
     """
     Pure function: takes explicit params, returns JSON-able dict.
@@ -195,288 +364,243 @@ def conjugate_verb(
       {"result": <conjugations or {"error": "..."}>, "meta": {...}}
     """
 
-    infinitive_n = (infinitive or "").strip().lower()
-    tense_n = tense or None
-    aspect_n = aspect or None
-
     # normalize obj
     if obj in ("", "None"):
         obj = None
 
-    has_markers = any([applicative, causative, simple_causative])
-
-    # conflicting marker rule
-    if causative and simple_causative:
-        return {
-            "result": {"error": "Select only one causative type at a time."},
-            "meta": _meta(
-                infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-                subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-                applicative=applicative, causative=causative, simple_causative=simple_causative,
-                has_markers=True,
-                exists_in_ivd=False, exists_in_tve=False, exists_in_tvm=False, exists_in_tvm_tve=False,
-                selected={"reason": "conflicting_causatives"},
-            ),
-        }
-
-    if not infinitive_n:
-        return {
-            "result": {"error": "Infinitive is required"},
-            "meta": _meta(
-                infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-                subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-                applicative=applicative, causative=causative, simple_causative=simple_causative,
-                has_markers=has_markers,
-                exists_in_ivd=False, exists_in_tve=False, exists_in_tvm=False, exists_in_tvm_tve=False,
-                selected={"reason": "missing_infinitive"},
-            ),
-        }
+    plan = (planner or planner_for(tense_modules)).plan(
+        infinitive=infinitive, tense=tense, aspect=aspect,
+        applicative=applicative, causative=causative, simple_causative=simple_causative,
+    )
+    exists_in_ivd, exists_in_tve, exists_in_tvm, exists_in_tvm_tve = plan.exists
 
-    # special-case: "guri mentxu"
-    if infinitive_n == "guri mentxu" and aspect_n != "potential":
+    def respond(result: Dict[str, Any], selected: Dict[str, Any]) -> Dict[str, Any]:
         return {
-            "result": {"error": "This verb only exists in potential form. You need to select the potential form under 'Aspect'"},
+            "result": result,
             "meta": _meta(
-                infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
+                infinitive=plan.infinitive, tense=plan.tense, aspect=plan.aspect, obj=obj,
                 subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
                 applicative=applicative, causative=causative, simple_causative=simple_causative,
-                has_markers=has_markers,
-                exists_in_ivd=False, exists_in_tve=False, exists_in_tvm=False, exists_in_tvm_tve=False,
-                selected={"reason": "guri_mentxu_requires_potential"},
+                has_markers=plan.has_markers,
+                exists_in_ivd=exists_in_ivd, exists_in_tve=exists_in_tve, exists_in_tvm=exists_in_tvm, exists_in_tvm_tve=exists_in_tvm_tve,
+                selected=selected,
             ),
         }
 
-    # existence flags
-    exists_in_ivd, exists_in_tve, exists_in_tvm, exists_in_tvm_tve = check_verb_existence(infinitive_n, tense_modules)
+    if plan.error:
+        message, reason = plan.error
+        return respond({"error": message}, {"reason": reason})
 
-    # requires marker verbs
-    if infinitive_n in SPECIAL_REQUIRES_MARKER and aspect_n is None and not has_markers:
-        return {
-            "result": {"error": "This verb requires a marker (applicative, causative or double causative)/bu fiile uygulamalı, oldurgan veya ettirgen belirteci gerekiyor."},
-            "meta": _meta(
-                infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-                subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-                applicative=applicative, causative=causative, simple_causative=simple_causative,
-                has_markers=has_markers,
-                exists_in_ivd=exists_in_ivd, exists_in_tve=exists_in_tve, exists_in_tvm=exists_in_tvm, exists_in_tvm_tve=exists_in_tvm_tve,
-                selected={"reason": "marker_required"},
-            ),
-        }
+    if plan.obj_error and not obj:
+        return respond({"error": plan.obj_error}, {"reason": "marker_requires_obj"})
 
-    # TVE marker requires object
-    if exists_in_tve and has_markers and not obj:
-        err = (
-            "Applicative requires an object to be specified. / Uygulamalı belirteç bir nesnenin belirtilmesini gerektirir."
-            if applicative
-            else "Causative requires an object to be specified. / Ettirgen belirteç bir nesnenin belirtilmesini gerektirir"
-        )
-        return {
-            "result": {"error": err},
-            "meta": _meta(
-                infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-                subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-                applicative=applicative, causative=causative, simple_causative=simple_causative,
-                has_markers=has_markers,
-                exists_in_ivd=exists_in_ivd, exists_in_tve=exists_in_tve, exists_in_tvm=exists_in_tvm, exists_in_tvm_tve=exists_in_tvm_tve,
-                selected={"reason": "marker_requires_obj"},
-            ),
-        }
+    req = _request_params(
+        infinitive=plan.infinitive, tense=plan.tense, aspect=plan.aspect, obj=obj,
+        subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
+        applicative=applicative, causative=causative, simple_causative=simple_causative,
+    )
 
     # ---- Aspect path (potential / passive) ----
     aspect_error = None
-    if aspect_n and aspect_n in SIMPLIFIED_ASPECT_MAPPING and exists_in_tvm_tve:
-        aspect_validator = ConjugationValidator(tense_modules, {}, SIMPLIFIED_ASPECT_MAPPING)
-        aspect_service = ConjugationService(tense_modules, {}, SIMPLIFIED_ASPECT_MAPPING)
-
-        req = _request_params(
-            infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-            subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-            applicative=applicative, causative=causative, simple_causative=simple_causative,
-        )
-        params, aspect_error = aspect_validator.validate_request(req)
+    if plan.aspect_route:
+        params, aspect_error = plan.aspect_route.validator.validate_request(req)
         if not aspect_error:
-            out = aspect_service.conjugate(params)
+            out = plan.aspect_route.service.conjugate(params)
             if out:
-                return {
-                    "result": out,
-                    "meta": _meta(
-                        infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-                        subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-                        applicative=applicative, causative=causative, simple_causative=simple_causative,
-                        has_markers=has_markers,
-                        exists_in_ivd=exists_in_ivd, exists_in_tve=exists_in_tve, exists_in_tvm=exists_in_tvm, exists_in_tvm_tve=exists_in_tvm_tve,
-                        selected={
-                            "path": "aspect",
-                            "aspect_module": SIMPLIFIED_ASPECT_MAPPING[aspect_n],
-                        },
-                    ),
-                }
-
-    # marker restriction: IVD-only verbs cannot take markers
-    if exists_in_ivd and not (exists_in_tve or exists_in_tvm_tve) and has_markers:
-        return {
-            "result": {"error": "This verb belongs to a verb group that cannot take additional markers"},
-            "meta": _meta(
-                infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-                subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-                applicative=applicative, causative=causative, simple_causative=simple_causative,
-                has_markers=has_markers,
-                exists_in_ivd=exists_in_ivd, exists_in_tve=exists_in_tve, exists_in_tvm=exists_in_tvm, exists_in_tvm_tve=exists_in_tvm_tve,
-                selected={"reason": "ivd_marker_forbidden"},
-            ),
-        }
+                return respond(out, {
+                    "path": "aspect",
+                    "aspect_module": SIMPLIFIED_ASPECT_MAPPING[plan.aspect],
+                })
+
+    if plan.markers_forbidden:
+        return respond(
+            {"error": "This verb belongs to a verb group that cannot take additional markers"},
+            {"reason": "ivd_marker_forbidden"},
+        )
 
     # ---- Present perfect special handling ----
     presentperf_error = None
-    if tense_n == "presentperf":
-        validator = ConjugationValidator(tense_modules, {"presentperf": ["tvm_tve_presentperf"]}, {})
-        service = ConjugationService(tense_modules, {"presentperf": ["tvm_tve_presentperf"]}, {})
-
-        req = _request_params(
-            infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-            subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-            applicative=applicative, causative=causative, simple_causative=simple_causative,
-        )
-        params, presentperf_error = validator.validate_request(req)
+    if plan.presentperf_route:
+        params, presentperf_error = plan.presentperf_route.validator.validate_request(req)
         if not presentperf_error:
-            out = service.conjugate(params)
+            out = plan.presentperf_route.service.conjugate(params)
             if out:
-                return {
-                    "result": out,
-                    "meta": _meta(
-                        infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-                        subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-                        applicative=applicative, causative=causative, simple_causative=simple_causative,
-                        has_markers=has_markers,
-                        exists_in_ivd=exists_in_ivd, exists_in_tve=exists_in_tve, exists_in_tvm=exists_in_tvm, exists_in_tvm_tve=exists_in_tvm_tve,
-                        selected={
-                            "path": "presentperf",
-                            "modules": ["tvm_tve_presentperf"],
-                        },
-                    ),
-                }
+                return respond(out, {
+                    "path": "presentperf",
+                    "modules": ["tvm_tve_presentperf"],
+                })
 
     # ---- Regular tense path ----
-    ivd_mapping: Dict[str, Any] = {}
-    tve_mapping: Dict[str, Any] = {}
-    tvm_mapping: Dict[str, Any] = {}
-
-    for tense_key, modules in SIMPLIFIED_TENSE_MAPPING.items():
-        if not isinstance(modules, list):
-            continue
-
-        ivd_modules_for_tense = [m for m in modules if isinstance(m, str) and m.startswith("ivd_")]
-        tve_modules_for_tense = [m for m in modules if isinstance(m, str) and m.startswith("tve_")]
-        tvm_modules_for_tense = [m for m in modules if isinstance(m, tuple) or (isinstance(m, str) and m.startswith("tvm_"))]
-
-        if ivd_modules_for_tense and exists_in_ivd and not has_markers:
-            if tense_key == "past" and infinitive_n in SPECIAL_IVD_PAST_AS_PASTPRO:
-                ivd_mapping[tense_key] = ["ivd_pastpro"]
-            else:
-                ivd_mapping[tense_key] = ivd_modules_for_tense
-
-        if tve_modules_for_tense and exists_in_tve:
-            tve_mapping[tense_key] = tve_modules_for_tense
-
-        if tvm_modules_for_tense and exists_in_tvm:
-            tvm_mapping[tense_key] = tvm_modules_for_tense
-
-    req = _request_params(
-        infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-        subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-        applicative=applicative, causative=causative, simple_causative=simple_causative,
-    )
-
     results: Dict[str, Any] = {}
 
     ivd_error = None
     tve_error = None
     tvm_error = None
 
-    if exists_in_ivd and not has_markers:
-        ivd_validator = ConjugationValidator(tense_modules, ivd_mapping, {})
-        ivd_service = ConjugationService(tense_modules, ivd_mapping, {})
-        ivd_params, ivd_error = ivd_validator.validate_request(req)
+    if plan.ivd_route:
+        ivd_params, ivd_error = plan.ivd_route.validator.validate_request(req)
         if not ivd_error:
-            ivd_out = ivd_service.conjugate(ivd_params)
+            ivd_out = plan.ivd_route.service.conjugate(ivd_params)
             if ivd_out:
                 results.update(ivd_out)
 
-    if exists_in_tve:
-        tve_validator = ConjugationValidator(tense_modules, tve_mapping, {})
-        tve_service = ConjugationService(tense_modules, tve_mapping, {})
-        tve_params, tve_error = tve_validator.validate_request(req)
+    if plan.tve_route:
+        tve_params, tve_error = plan.tve_route.validator.validate_request(req)
         if not tve_error:
-            tve_out = tve_service.conjugate(tve_params)
+            tve_out = plan.tve_route.service.conjugate(tve_params)
             if tve_out:
                 for region in tve_out:
                     results.setdefault(region, {}).update(tve_out[region])
 
-    if exists_in_tvm:
-        tvm_validator = ConjugationValidator(tense_modules, tvm_mapping, {})
-        tvm_service = ConjugationService(tense_modules, tvm_mapping, {})
-        tvm_params, tvm_error = tvm_validator.validate_request(req)
+    if plan.tvm_route:
+        tvm_params, tvm_error = plan.tvm_route.validator.validate_request(req)
         if not tvm_error:
-            tvm_out = tvm_service.conjugate(tvm_params)
+            tvm_out = plan.tvm_route.service.conjugate(tvm_params)
             if tvm_out:
                 for region in tvm_out:
                     results.setdefault(region, {}).update(tvm_out[region])
 
     if results:
-        return {
-            "result": results,
-            "meta": _meta(
-                infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-                subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-                applicative=applicative, causative=causative, simple_causative=simple_causative,
-                has_markers=has_markers,
-                exists_in_ivd=exists_in_ivd, exists_in_tve=exists_in_tve, exists_in_tvm=exists_in_tvm, exists_in_tvm_tve=exists_in_tvm_tve,
-                selected={
-                    "path": "tense",
-                    "ivd_mapping": ivd_mapping,
-                    "tve_mapping": tve_mapping,
-                    "tvm_mapping": tvm_mapping,
-                },
-            ),
-        }
+        return respond(results, {
+            "path": "tense",
+            "ivd_mapping": plan.ivd_mapping,
+            "tve_mapping": plan.tve_mapping,
+            "tvm_mapping": plan.tvm_mapping,
+        })
 
     # ---- Final: distinguish truly-not-found vs no-output ----
-    if not (exists_in_ivd or exists_in_tve or exists_in_tvm or exists_in_tvm_tve):
-        return {
-            "result": {"error": f"Infinitive {infinitive_n} not found in any module."},
-            "meta": _meta(
-                infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-                subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-                applicative=applicative, causative=causative, simple_causative=simple_causative,
-                has_markers=has_markers,
-                exists_in_ivd=exists_in_ivd, exists_in_tve=exists_in_tve, exists_in_tvm=exists_in_tvm, exists_in_tvm_tve=exists_in_tvm_tve,
-                selected={"reason": "not_found"},
-            ),
-        }
+    if not any(plan.exists):
+        return respond({"error": f"Infinitive {plan.infinitive} not found in any module."}, {"reason": "not_found"})
 
     # Verb exists somewhere but nothing came out -> surface validator errors
-    return {
-        "result": {"error": "Verb exists in module lists, but no conjugation output was produced (likely missing/invalid parameters)."},
-        "meta": _meta(
-            infinitive=infinitive_n, tense=tense_n, aspect=aspect_n, obj=obj,
-            subject=subject, optative=optative, imperative=imperative, neg_imperative=neg_imperative,
-            applicative=applicative, causative=causative, simple_causative=simple_causative,
-            has_markers=has_markers,
-            exists_in_ivd=exists_in_ivd, exists_in_tve=exists_in_tve, exists_in_tvm=exists_in_tvm, exists_in_tvm_tve=exists_in_tvm_tve,
-            selected={
-                "reason": "no_output",
-                "validator_errors": {
-                    "aspect_error": aspect_error,
-                    "presentperf_error": presentperf_error,
-                    "ivd_error": ivd_error,
-                    "tve_error": tve_error,
-                    "tvm_error": tvm_error,
-                },
-                "mappings": {
-                    "ivd_mapping": ivd_mapping,
-                    "tve_mapping": tve_mapping,
-                    "tvm_mapping": tvm_mapping,
-                },
+    return respond(
+        {"error": "Verb exists in module lists, but no conjugation output was produced (likely missing/invalid parameters)."},
+        {
+            "reason": "no_output",
+            "validator_errors": {
+                "aspect_error": aspect_error,
+                "presentperf_error": presentperf_error,
+                "ivd_error": ivd_error,
+                "tve_error": tve_error,
+                "tvm_error": tvm_error,
             },
-        ),
-    }
+            "mappings": {
+                "ivd_mapping": plan.ivd_mapping,
+                "tve_mapping": plan.tve_mapping,
+                "tvm_mapping": plan.tvm_mapping,
+            },
+        },
+    )
+
+
+# Pronouns in the tense modules' output -> person codes, whatever the region
+# (the seed notebook's PRONOUN_TO_SUBJECT / PRONOUN_TO_OBJECT)
+PRONOUN_PERSONS = {
+    "ma": "1SG", "si": "2SG",
+    "him": "3SG", "himus": "3SG", "himuk": "3SG",
+    "heya": "3SG", "heyas": "3SG", "heyak": "3SG",
+    "(h)em": "3SG", "(h)emus": "3SG", "(h)emuk": "3SG",
+    "şǩu": "1PL", "çku": "1PL", "çkin": "1PL",
+    "t̆ǩva": "2PL", "tkva": "2PL", "tkvan": "2PL",
+    "hini": "3PL", "hinis": "3PL", "hinik": "3PL",
+    "hentepe": "3PL", "hentepes": "3PL", "hentepek": "3PL",
+    "entepe": "3PL", "entepes": "3PL", "entepek": "3PL",
+}
+
+# (mood, conjugate_verb flags) of the present-tense rows of the seed
+PRESENT_MOODS = (
+    ("indicative", {}),
+    ("optative", {"optative": True}),
+    ("imperative", {"imperative": True}),
+    ("negative_imperative", {"neg_imperative": True}),
+)
+
+# (applicative, causative, simple_causative) requests -> (is_applicative,
+# is_causative, is_double_causative) of the rows; all but the first are
+# generated for TVE verbs only
+MARKER_FLAGS = (
+    ((False, False, False), (False, False, False)),
+    ((True, False, False), (True, False, False)),
+    ((False, False, True), (False, True, False)),
+    ((False, True, False), (False, False, True)),
+    ((True, True, False), (True, False, True)),
+)
+
+
+class PresentForm(NamedTuple):
+    """One present-tense form of a verb, with the verb_form columns the seed stores for it."""
+    spelling: str
+    region: str
+    frame: str
+    subject: Optional[str]
+    object: Optional[str]
+    mood: str
+    derivation: str
+    is_applicative: bool
+    is_causative: bool
+    is_double_causative: bool
+
+
+def _object_rejected(error: ValueError) -> bool:
+    message = str(error)
+    return "cannot take an object" in message or "nesne alamaz" in message
+
+
+def present_forms(infinitive: str, tense_modules: Dict[str, Any]) -> list:
+    """
+    The present-tense PresentForms of `infinitive`, generated the way the
+    seed notebook fills verb_form: every mood, derivation (indicative only)
+    and, for TVE verbs, marker combination (underived only), asking for
+    every object where the verb takes one.
+    """
+    planner = planner_for(tense_modules)
+    exists_in_ivd, exists_in_tve, _, _ = check_verb_existence(infinitive, tense_modules, planner.membership)
+    markers = MARKER_FLAGS if exists_in_tve else MARKER_FLAGS[:1]
+
+    forms = {}
+    for mood, mood_flags in PRESENT_MOODS:
+        for derivation in ("none", "passive", "potential") if mood == "indicative" else ("none",):
+            for (applicative, causative, simple_causative), flags in markers:
+                if derivation != "none" and any(flags):
+                    continue
+
+                obj = "all" if derivation == "none" and (exists_in_ivd or exists_in_tve) else None
+                request = dict(
+                    tense_modules=tense_modules, infinitive=infinitive, tense="present",
+                    aspect=None if derivation == "none" else derivation, subject="all",
+                    applicative=applicative, causative=causative, simple_causative=simple_causative,
+                    planner=planner, **mood_flags,
+                )
+                try:
+                    out = conjugate_verb(obj=obj, **request)
+                except ValueError as e:
+                    if obj is None or not _object_rejected(e):
+                        continue
+                    out = conjugate_verb(obj=None, **request)
+
+                result = out.get("result")
+                if not isinstance(result, dict) or "error" in result:
+                    continue
+                for region, frames in result.items():
+                    if not isinstance(frames, dict):
+                        continue
+                    for frame, items in frames.items():
+                        if not isinstance(items, list):
+                            continue
+                        for item in items:
+                            if not isinstance(item, dict):
+                                continue
+                            subject = (item.get("subject") or "").strip()
+                            object_ = (item.get("object") or item.get("obj") or "").strip()
+                            form = PresentForm(
+                                (item.get("conjugation") or "").strip(),
+                                region,
+                                frame,
+                                "S" + PRONOUN_PERSONS[subject] if subject in PRONOUN_PERSONS else None,
+                                "O" + PRONOUN_PERSONS[object_] if object_ in PRONOUN_PERSONS else None,
+                                mood,
+                                derivation,
+                                *flags,
+                            )
+                            forms[form] = None
+    return list(forms)
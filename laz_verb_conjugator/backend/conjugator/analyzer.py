@@ -0,0 +1,318 @@
+import unicodedata
+from collections import Counter
+from itertools import groupby, product
+from typing import Callable, NamedTuple
+
+from backend.cache import LRUCache
+
+from .common import (DATIVE_SUBJECT_MARKERS, PROTHETIC_CONSONANTS_NO_OBJECT,
+                     PROTHETIC_CONSONANTS_SECOND_PERSON,
+                     PROTHETIC_CONSONANTS_SECOND_PERSON_OBJECT, VERB_PREFIXES,
+                     Region)
+from .present_conjugator import DATIVE_SECOND_PERSON_SUFFIXES, DATIVE_SUFFIXES
+from .tables.base import (APPLICATIVE_PREFIXES, APPLICATIVE_SUFFIXES,
+                          CAUSATIVE_PREFIXES, OPTATIVE_SUFFIXES,
+                          PRESENT_ERGATIVE_SUFFIXES,
+                          PRESENT_NOMINATIVE_SUFFIXES,
+                          PRESENT_PASSIVE_SUFFIXES, PRESENT_POTENTIAL_PREFIXES,
+                          PRESENT_POTENTIAL_SUFFIXES)
+from .tables.preverbs import (PREVERB_APPLICATIVE_PREFIXES_TABLE,
+                              PREVERB_CAUSATIVE_PREFIXES_TABLE,
+                              PREVERB_PREFIXES_TABLE)
+from .verbs import DativeVerb, ErgativeVerb, NominativeVerb, Verb
+
+CATEGORY_VERB_TYPES = {
+    "TVM": NominativeVerb,
+    "TVE": ErgativeVerb,
+    "IVD": DativeVerb,
+}
+
+REGION_CODES = {
+    "AŞ": Region.ARDESEN,
+    "PZ": Region.PAZAR,
+    "FA": Region.FINDIKLI_ARHAVI,
+    "HO": Region.HOPA,
+}
+
+# The verb category whose forms a frame holds
+FRAME_CATEGORIES = {
+    "Nominative": "TVM",
+    "Ergative": "TVE",
+    "Dative": "IVD",
+}
+
+
+class LexiconEntry(NamedTuple):
+    infinitive: str
+    present_third: str
+    category: str
+    regions: tuple
+    meaning_english: str | None
+    meaning_turkish: str | None
+    verb: Verb
+
+
+class Analysis(NamedTuple):
+    """One way a lexicon verb produces a surface form: the verb and the paradigm form it matched."""
+
+    entry: LexiconEntry
+    form: NamedTuple
+
+
+class _AffixTrie:
+    """
+    Character trie whose walk reports the length of every stored key that
+    starts a text, or, with `reverse`, of every stored key that ends it.
+    """
+
+    def __init__(self, reverse: bool = False):
+        self.reverse = reverse
+        self.root = {}
+
+    def add(self, key: str):
+        node = self.root
+        for char in reversed(key) if self.reverse else key:
+            node = node.setdefault(char, {})
+        node[None] = True
+
+    def walk(self, text: str):
+        """The length of each stored key starting (or ending) `text`, shortest first."""
+        node = self.root
+        if None in node:
+            yield 0
+        for length, char in enumerate(reversed(text) if self.reverse else text, start=1):
+            node = node.get(char)
+            if node is None:
+                return
+            if None in node:
+                yield length
+
+
+def _table_entries(table, *levels):
+    """Flatten a nested {level: ... {level: affix}} table into (keys, affix) pairs."""
+    if isinstance(table, str):
+        yield levels, table
+        return
+    for key, value in table.items():
+        yield from _table_entries(value, *levels, key)
+
+
+def _default_normalize(text: str) -> str:
+    return unicodedata.normalize("NFC", (text or "").strip().lower())
+
+
+def _bigrams(word: str):
+    return {word[i:i + 2] for i in range(len(word) - 1)}
+
+
+class MorphologicalAnalyzer:
+    """
+    Present-tense analysis of a surface form against the paradigms of the
+    lexicon verbs, without a pre-generated form table.
+
+    `paradigm(infinitive)` gives the present-tense forms of a verb (anything
+    with a `spelling`; see backend.conjugation.present_forms), and a verb
+    analyzes a form when one of them is spelled like it. Paradigms are
+    computed on demand, so only a few candidate verbs are checked per form,
+    in this order:
+
+    - the verbs whose stem is left when the form is split by the affix
+      tables (every present suffix and every prefix, optionally preceded by
+      a preverb and a prothetic consonant), found by walking a reversed
+      suffix trie and a prefix trie;
+    - then the verbs sharing the most letter bigrams with the form's last
+      word, for the stems the tables do not describe (suppletive roots,
+      vowel changes).
+
+    Candidates are checked a tier of equal rank at a time, and the search
+    stops at the first tier with an analysis or after `max_candidates`
+    verbs. Each check can run the tense modules, so serving code should
+    use analyses(), which enumerates every paradigm once, ahead of time.
+    """
+
+    def __init__(
+        self,
+        entries,
+        paradigm: Callable[[str], list],
+        normalize: Callable[[str], str] = _default_normalize,
+        max_candidates: int = 40,
+        paradigm_cache_size: int = 128,
+    ):
+        self.normalize = normalize
+        self.entries = list(entries)
+        self.paradigm = paradigm
+        self.max_candidates = max_candidates
+        self.paradigms = LRUCache(paradigm_cache_size)
+        self.suffixes = _AffixTrie(reverse=True)
+        self.prefixes = _AffixTrie()
+        self.stems = {}
+        self.bigrams = {}
+        self.by_infinitive = {}
+
+        for suffix in self._suffixes():
+            self.suffixes.add(normalize(suffix) if suffix else "")
+        for prefix in self._prefixes():
+            self.prefixes.add(normalize(prefix) if prefix else "")
+
+        for entry in self.entries:
+            self.by_infinitive.setdefault(entry.infinitive, []).append(entry)
+            for stem in self._stem_keys(entry.verb):
+                if stem:
+                    self.stems.setdefault(normalize(stem), set()).add(entry.infinitive)
+            for key in (entry.infinitive, entry.present_third):
+                words = normalize(key).split()
+                for bigram in _bigrams(words[-1] if words else ""):
+                    self.bigrams.setdefault(bigram, set()).add(entry.infinitive)
+
+    @classmethod
+    def from_verb_data(cls, rows, paradigm: Callable[[str], list], normalize: Callable[[str], str] = _default_normalize,
+                       **options):
+        """Build the lexicon from verb_data.json rows, one entry per present form."""
+        entries = []
+        for row in rows:
+            verb_type = CATEGORY_VERB_TYPES.get(row.get("Category"))
+            if verb_type is None:
+                continue
+            for form_key, region_key in (
+                ("Laz 3rd Person Singular Present", "Region"),
+                ("Laz 3rd Person Singular Present Alternative 1", "Region Alternative 1"),
+                ("Laz 3rd Person Singular Present Alternative 2", "Region Alternative 2"),
+            ):
+                present_third = row.get(form_key)
+                if not present_third:
+                    continue
+                codes = [code.strip() for code in (row.get(region_key) or "").split(",")]
+                regions = tuple(REGION_CODES[code] for code in codes if code in REGION_CODES)
+                entries.append(LexiconEntry(
+                    infinitive=row["Laz Infinitive"],
+                    present_third=present_third,
+                    category=row["Category"],
+                    regions=regions or tuple(Region),
+                    meaning_english=row.get("English Translation"),
+                    meaning_turkish=row.get("Turkish Verb"),
+                    verb=verb_type(infinitive=row["Laz Infinitive"], present_third=present_third),
+                ))
+        return cls(entries, paradigm, normalize, **options)
+
+    @staticmethod
+    def _suffixes():
+        for _, suffix in _table_entries(PRESENT_NOMINATIVE_SUFFIXES):
+            yield suffix
+        for _, suffix in _table_entries(PRESENT_ERGATIVE_SUFFIXES):
+            yield suffix
+            yield f"ap{suffix}"
+        for table in (
+            APPLICATIVE_SUFFIXES,
+            OPTATIVE_SUFFIXES,
+            PRESENT_POTENTIAL_SUFFIXES,
+            PRESENT_PASSIVE_SUFFIXES,
+            DATIVE_SUFFIXES,
+            DATIVE_SECOND_PERSON_SUFFIXES,
+        ):
+            for _, suffix in _table_entries(table):
+                yield suffix
+
+    @staticmethod
+    def _prefixes():
+        """Table prefixes, each also preceded by a preverb and/or a prothetic consonant."""
+        table_prefixes = [""]
+        for table in (APPLICATIVE_PREFIXES, CAUSATIVE_PREFIXES, PRESENT_POTENTIAL_PREFIXES, DATIVE_SUBJECT_MARKERS):
+            table_prefixes.extend(prefix for _, prefix in _table_entries(table))
+        for tables in (PREVERB_PREFIXES_TABLE, PREVERB_APPLICATIVE_PREFIXES_TABLE):
+            table_prefixes.extend(prefix for _, prefix in _table_entries(tables))
+        for (_, object, region, subject), prefix in _table_entries(PREVERB_CAUSATIVE_PREFIXES_TABLE):
+            table_prefixes.append(prefix)
+            # Preverbed causatives keep the causative prefix after the preverb's.
+            causative = CAUSATIVE_PREFIXES.get(object, {}).get(region, {}).get(subject)
+            if causative is not None:
+                table_prefixes.append(prefix + causative)
+
+        prothetic = {""}
+        for table in (
+            *PROTHETIC_CONSONANTS_NO_OBJECT.values(),
+            *PROTHETIC_CONSONANTS_SECOND_PERSON_OBJECT.values(),
+            PROTHETIC_CONSONANTS_SECOND_PERSON,
+        ):
+            prothetic.update(table)
+        prothetic.add("m")
+
+        for preverb, consonant, prefix in product(["", *VERB_PREFIXES], prothetic, table_prefixes):
+            yield f"{preverb}{consonant}{prefix}"
+
+    @staticmethod
+    def _stem_keys(verb: Verb):
+        """The stems the present-tense rules put between the prefixes and the suffix."""
+        present_third = verb.present_third
+        return {
+            verb.stem,
+            f"{verb.prefix}{verb.stem}",
+            present_third,
+            present_third[:-1],
+            f"i{present_third[1:]}",
+            f"i{present_third[1:-1]}",
+        }
+
+    def candidates(self, normalized: str):
+        """
+        Tiers of candidate infinitives for a normalized form, best first:
+        the verbs split out by the affix tables, then by shared bigrams,
+        each ordered by how many bigrams they share.
+        """
+        words = normalized.split()
+        core = words[-1] if words else ""
+
+        split = set()
+        for prefix_length in self.prefixes.walk(core):
+            for suffix_length in self.suffixes.walk(core):
+                if prefix_length + suffix_length < len(core):
+                    split.update(self.stems.get(core[prefix_length:len(core) - suffix_length], ()))
+
+        shared = Counter()
+        for bigram in _bigrams(core):
+            shared.update(self.bigrams.get(bigram, ()))
+        for infinitive in split:
+            shared[infinitive] += 0
+
+        ranked = sorted(shared, key=lambda infinitive: (infinitive not in split, -shared[infinitive], infinitive))
+        for _, tier in groupby(ranked, key=lambda infinitive: (infinitive not in split, shared[infinitive])):
+            yield list(tier)
+
+    def _forms_by_spelling(self, infinitive: str) -> dict:
+        """{normalized spelling: [paradigm forms]} of a verb, computed once and kept in an LRU."""
+        forms = self.paradigms.get(infinitive)
+        if forms is None:
+            forms = {}
+            for form in self.paradigm(infinitive):
+                forms.setdefault(self.normalize(form.spelling), []).append(form)
+            self.paradigms.set(infinitive, forms)
+        return forms
+
+    def _entry(self, infinitive: str, frame: str) -> LexiconEntry:
+        """The lexicon entry of `infinitive` in the category of `frame`, or its first one."""
+        entries = self.by_infinitive[infinitive]
+        category = FRAME_CATEGORIES.get(frame)
+        return next((entry for entry in entries if entry.category == category), entries[0])
+
+    def analyses(self):
+        """(normalized spelling, Analysis) for every form of every lexicon verb's paradigm."""
+        for infinitive in self.by_infinitive:
+            for form in self.paradigm(infinitive):
+                yield self.normalize(form.spelling), Analysis(self._entry(infinitive, form.frame), form)
+
+    def analyze(self, form: str):
+        """Every present-tense analysis of `form`, as Analysis tuples."""
+        normalized = self.normalize(form)
+        if not normalized.split():
+            return []
+
+        analyses = []
+        checked = 0
+        for tier in self.candidates(normalized):
+            tier = tier[:self.max_candidates - checked]
+            for infinitive in tier:
+                for matched in self._forms_by_spelling(infinitive).get(normalized, ()):
+                    analyses.append(Analysis(self._entry(infinitive, matched.frame), matched))
+            checked += len(tier)
+            if analyses or checked >= self.max_candidates:
+                break
+        return analyses
@@ -2,6 +2,8 @@ import re
 from enum import Enum, IntFlag, auto
 from typing import TypeAlias
 
+from .phonemes import phonemes
+
 
 class Mood(IntFlag):
     NONE = 0
@@ -176,6 +178,15 @@ PROTHETIC_CONSONANTS_SECOND_PERSON = {
     "ǩ": ["ç̌", "ǩ", "q", "ǯ", "t̆"],
 }
 
+# The tables above as {region: {initial phoneme id: prothetic segment}}
+PROTHETIC_RULES_NO_OBJECT = {
+    region: phonemes.compile_rules(table) for region, table in PROTHETIC_CONSONANTS_NO_OBJECT.items()
+}
+PROTHETIC_RULES_SECOND_PERSON_OBJECT = {
+    region: phonemes.compile_rules(table)
+    for region, table in PROTHETIC_CONSONANTS_SECOND_PERSON_OBJECT.items()
+}
+
 VERB_PREFIXES = [
     "gelo",
     "ge",
@@ -246,11 +257,16 @@ def extract_initial_cluster(verb_form: str) -> str:
         str: The initial consonant or consonant cluster to be used
             in morphological rules.
     """
-    if len(verb_form) > 1 and verb_form[:2] in ["t̆", "ç̌", "ǩ", "p̌", "ǯ"]:
-        return verb_form[:2]
-    elif verb_form.startswith("gyoç̌ǩams"):
+    if verb_form.startswith("gyoç̌ǩams"):
         return verb_form[2:]
-    return verb_form[0]
+    return phonemes.grapheme(phonemes.ids(verb_form)[0])
+
+
+def initial_phoneme(verb_form: str) -> int | None:
+    """Phoneme id of extract_initial_cluster(verb_form), None where that is no single letter."""
+    if verb_form.startswith("gyoç̌ǩams"):
+        return None
+    return phonemes.ids(verb_form)[0]
 
 
 def extract_preverb(infinitive_form: str) -> str | None:
@@ -1,8 +1,9 @@
 from typing import Callable, List
 
-from .common import (PROTHETIC_CONSONANTS_NO_OBJECT,
-                     PROTHETIC_CONSONANTS_SECOND_PERSON_OBJECT, Aspect, Mood,
-                     Person, Region, extract_initial_cluster)
+from .common import (PROTHETIC_RULES_NO_OBJECT,
+                     PROTHETIC_RULES_SECOND_PERSON_OBJECT, Aspect, Mood,
+                     Person, Region, initial_phoneme)
+from .phonemes import phonemes
 from .errors import ConjugatorError
 from .rules.common import VerbRule
 from .verbs import Verb
@@ -148,31 +149,24 @@ class Conjugator:
                 Returns the original stem if no rule matches.
         """
         if self.object is None:
-            epenthetic_segments_by_cluster = PROTHETIC_CONSONANTS_NO_OBJECT[
-                self.region
-            ]
+            epenthetic_segments_by_phoneme = PROTHETIC_RULES_NO_OBJECT[self.region]
         elif (
             self.object.is_first_person() and not self.object.is_first_person()
         ):
             return f"m{inflected_stem}"
         elif self.object.is_second_person():
-            epenthetic_segments_by_cluster = (
-                PROTHETIC_CONSONANTS_SECOND_PERSON_OBJECT[self.region]
+            epenthetic_segments_by_phoneme = (
+                PROTHETIC_RULES_SECOND_PERSON_OBJECT[self.region]
             )
         else:
-            epenthetic_segments_by_cluster = PROTHETIC_CONSONANTS_NO_OBJECT[
-                self.region
-            ]
-
-        initial_cluster = extract_initial_cluster(inflected_stem)
-        for (
-            epenthetic_segment,
-            initial_clusters,
-        ) in epenthetic_segments_by_cluster.items():
-            if initial_cluster in initial_clusters:
-                return (
-                    f"{epenthetic_segment}{inflected_stem}"
-                    if epenthetic_segment != initial_cluster
-                    else inflected_stem
-                )
-        return inflected_stem
+            epenthetic_segments_by_phoneme = PROTHETIC_RULES_NO_OBJECT[self.region]
+
+        initial_cluster = initial_phoneme(inflected_stem)
+        epenthetic_segment = epenthetic_segments_by_phoneme.get(initial_cluster)
+        if epenthetic_segment is None:
+            return inflected_stem
+        return (
+            f"{epenthetic_segment}{inflected_stem}"
+            if epenthetic_segment != phonemes.grapheme(initial_cluster)
+            else inflected_stem
+        )
@@ -0,0 +1,73 @@
+import os
+import re
+import threading
+
+from backend.cache import LRUCache
+
+# Forms whose phoneme tuples are memoized
+PHONEME_CACHE_SIZE = int(os.getenv("PHONEME_CACHE_SIZE", "65536"))
+
+# One written Laz letter: a code point and the combining marks after it.
+# t̆, p̌ and ç̌ have no precomposed form and take two code points; ǩ and ǯ
+# are precomposed and take one.
+COMBINING_MARKS = "\u0300-\u036f"
+GRAPHEME = re.compile(rf"[^{COMBINING_MARKS}][{COMBINING_MARKS}]*|[{COMBINING_MARKS}]+", re.DOTALL)
+
+
+class Phonemes:
+    """
+    Forms as tuples of phoneme ids: each grapheme gets a small int the first
+    time it is seen, so rules can match a whole letter by comparing ints
+    rather than slicing code points.
+    """
+
+    def __init__(self, cache_size: int = PHONEME_CACHE_SIZE):
+        self._ids = {}
+        self._graphemes = []
+        self._lock = threading.Lock()
+        self.cache = LRUCache(cache_size)
+
+    def id(self, grapheme: str) -> int:
+        """The interned id of one grapheme."""
+        phoneme = self._ids.get(grapheme)
+        if phoneme is None:
+            with self._lock:
+                phoneme = self._ids.get(grapheme)
+                if phoneme is None:
+                    phoneme = self._ids[grapheme] = len(self._graphemes)
+                    self._graphemes.append(grapheme)
+        return phoneme
+
+    def ids(self, text: str) -> tuple:
+        """`text` tokenized into phoneme ids."""
+        phonemes = self.cache.get(text)
+        if phonemes is None:
+            phonemes = tuple(self.id(match.group()) for match in GRAPHEME.finditer(text))
+            self.cache.set(text, phonemes)
+        return phonemes
+
+    def grapheme(self, phoneme: int) -> str:
+        return self._graphemes[phoneme]
+
+    def text(self, phonemes) -> str:
+        return "".join(self._graphemes[phoneme] for phoneme in phonemes)
+
+    def first(self, text: str) -> int | None:
+        """Id of the first phoneme of `text`, None if it is empty."""
+        phonemes = self.ids(text)
+        return phonemes[0] if phonemes else None
+
+    def compile_rules(self, segments_by_cluster: dict) -> dict:
+        """
+        {segment: [initial letters]} (the prothetic-consonant tables) as
+        {phoneme id: segment}; the first segment listing a letter wins,
+        as when the lists are scanned in order.
+        """
+        rules = {}
+        for segment, clusters in segments_by_cluster.items():
+            for cluster in clusters:
+                rules.setdefault(self.id(cluster), segment)
+        return rules
+
+
+phonemes = Phonemes()
@@ -1,289 +1,194 @@
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+import hashlib
 import json
+import marshal
+import os
+import threading
 
 BASE_DIR = Path(__file__).resolve().parent          # .../backend
 DATA_DIR = BASE_DIR / "data"                        # .../backend/data
 
+# Parsed verb_data.json, reused while the file's mtime, size or content hash
+# matches ("" disables it)
+LEXICON_SNAPSHOT = os.getenv("LEXICON_SNAPSHOT", "")
+
+_SNAPSHOT_FORMAT = 1
+
+_PRESENT_KEYS = (
+    'Laz 3rd Person Singular Present',
+    'Laz 3rd Person Singular Present Alternative 1',
+    'Laz 3rd Person Singular Present Alternative 2',
+)
+_REGION_KEYS = ('Region', 'Region Alternative 1', 'Region Alternative 2')
+
+# Word-initial markers of the co/gyo/no verb lists, per category
+_PREFIX_MARKERS = {
+    'TVE': {
+        'co': ('co', 'cu'),
+        'gyo': ('gyo', 'gyu'),
+        'no': ('no', 'nu', 'n'),
+    },
+    'TVM': {
+        'co': ('co',),
+        'gyo': ('gyo',),
+        'no': ('no', 'nu', 'n'),
+    },
+}
+
+
+class LexiconView(NamedTuple):
+    """The verbs of some categories, read-only and shared by every loader asking for them."""
+
+    verbs: MappingProxyType  # infinitive -> [(present form, region codes), ...]
+    regions: MappingProxyType  # infinitive -> [region code, ...] or ["All"]
+    co_verbs: frozenset
+    gyo_verbs: frozenset
+    no_verbs: frozenset
+
+
+class Lexicon:
+    """verb_data.json, parsed once, with its per-category views built on first use."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self._views = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=None, snapshot=None):
+        path = Path(path or DATA_DIR / "verb_data.json")
+        snapshot = LEXICON_SNAPSHOT if snapshot is None else snapshot
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = _read_snapshot(snapshot) if snapshot else None
+        if cached is not None and cached[0] == key:
+            return cls(cached[2])
+
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if cached is not None and cached[1] == digest:
+            rows = cached[2]  # touched, not changed
+        else:
+            rows = json.loads(raw.decode("utf-8"))
+        if snapshot:
+            _write_snapshot(snapshot, key, digest, rows)
+        return cls(rows)
+
+    def view(self, *categories) -> LexiconView:
+        view = self._views.get(categories)
+        if view is None:
+            with self._lock:
+                view = self._views.get(categories)
+                if view is None:
+                    view = self._views[categories] = self._build_view(categories)
+        return view
+
+    def _build_view(self, categories) -> LexiconView:
+        markers = _PREFIX_MARKERS.get(categories[0], {}) if len(categories) == 1 else {}
+        verbs = {}
+        regions = {}
+        marked = {name: set() for name in ('co', 'gyo', 'no')}
+
+        for row in self.rows:
+            if row['Category'] not in categories:
+                continue
+            infinitive = row['Laz Infinitive']
+
+            present_forms = [row[key] for key in _PRESENT_KEYS if row.get(key)]
+            for name, prefixes in markers.items():
+                if any(word.startswith(prefixes) for form in present_forms for word in form.split()):
+                    marked[name].add(infinitive)
+
+            region_data = [row[key] for key in _REGION_KEYS if row.get(key)]
+            regions_list = [r.strip() for reg in region_data for r in reg.split(',')]
+
+            verbs[infinitive] = list(zip(present_forms, region_data))
+            regions[infinitive] = regions_list or ["All"]
+
+        return LexiconView(
+            MappingProxyType(verbs),
+            MappingProxyType(regions),
+            frozenset(marked['co']),
+            frozenset(marked['gyo']),
+            frozenset(marked['no']),
+        )
+
+
+def _read_snapshot(path):
+    try:
+        with open(path, "rb") as f:
+            snapshot_format, key, digest, rows = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if snapshot_format != _SNAPSHOT_FORMAT:
+        return None
+    return tuple(key), digest, rows
+
+
+def _write_snapshot(path, key, digest, rows):
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump((_SNAPSHOT_FORMAT, key, digest, rows), f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+_lexicon_lock = threading.Lock()
+_lexicon_state = {"lexicon": None}
+
+
+def get_lexicon() -> Lexicon:
+    """The process-wide Lexicon, loaded on first use."""
+    lexicon = _lexicon_state["lexicon"]
+    if lexicon is None:
+        with _lexicon_lock:
+            lexicon = _lexicon_state["lexicon"]
+            if lexicon is None:
+                lexicon = _lexicon_state["lexicon"] = Lexicon.load()
+    return lexicon
+
 
 def _load_verb_data():
-    """Load verb data JSON from backend/data/verb_data.json (stable path)."""
-    path = DATA_DIR / "verb_data.json"
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    """The rows of backend/data/verb_data.json (shared: do not modify)."""
+    return get_lexicon().rows
 
 
 def load_ivd_verbs():
     """Load IVD (Intransitive Verbs) data from JSON file."""
-    data = _load_verb_data()
-
-    # Filter for IVD verbs only
-    df_ivd = [row for row in data if row['Category'] == 'IVD']
-
-    verbs = {}
-    regions = {}
-
-    for row in df_ivd:
-        infinitive = row['Laz Infinitive']
-
-        present_forms = []
-        for key in [
-            'Laz 3rd Person Singular Present',
-            'Laz 3rd Person Singular Present Alternative 1',
-            'Laz 3rd Person Singular Present Alternative 2'
-        ]:
-            if row.get(key):
-                present_forms.append(row[key])
-
-        region_data = []
-        for key in ['Region', 'Region Alternative 1', 'Region Alternative 2']:
-            if row.get(key):
-                region_data.append(row[key])
-
-        regions_list = []
-        for reg in region_data:
-            if reg:
-                regions_list.extend([r.strip() for r in reg.split(',')])
-
-        if not regions_list:
-            regions_list = ["All"]
-
-        verbs[infinitive] = list(zip(present_forms, region_data))
-        regions[infinitive] = regions_list
-
-    return verbs, regions
+    view = get_lexicon().view('IVD')
+    return view.verbs, view.regions
 
 
 def load_tve_verbs():
     """Load TVE (Transitive Verbs) data from JSON file."""
-    data = _load_verb_data()
-
-    df_tve = [row for row in data if row['Category'] == 'TVE']
-
-    verbs = {}
-    regions = {}
-    co_verbs = []
-    gyo_verbs = []
-    no_verbs = []
-
-    def check_prefix_in_words(form, prefix):
-        if not form:
-            return False
-        words = form.split()
-        return any(word.startswith(prefix) for word in words)
-
-    for row in df_tve:
-        infinitive = row['Laz Infinitive']
-
-        present_forms = []
-        for key in [
-            'Laz 3rd Person Singular Present',
-            'Laz 3rd Person Singular Present Alternative 1',
-            'Laz 3rd Person Singular Present Alternative 2'
-        ]:
-            if row.get(key):
-                present_forms.append(row[key])
-
-        if any(form and (check_prefix_in_words(form, 'co') or check_prefix_in_words(form, 'cu'))
-               for form in present_forms):
-            co_verbs.append(infinitive)
-        if any(form and (check_prefix_in_words(form, 'gyo') or check_prefix_in_words(form, 'gyu'))
-               for form in present_forms):
-            gyo_verbs.append(infinitive)
-        if any(form and (check_prefix_in_words(form, 'no') or check_prefix_in_words(form, 'nu') or check_prefix_in_words(form, 'n'))
-               for form in present_forms):
-            no_verbs.append(infinitive)
-
-        region_data = []
-        for key in ['Region', 'Region Alternative 1', 'Region Alternative 2']:
-            if row.get(key):
-                region_data.append(row[key])
-
-        regions_list = []
-        for reg in region_data:
-            if reg:
-                regions_list.extend([r.strip() for r in reg.split(',')])
-
-        if not regions_list:
-            regions_list = ["All"]
-
-        verbs[infinitive] = list(zip(present_forms, region_data))
-        regions[infinitive] = regions_list
-
-    return verbs, regions, co_verbs, gyo_verbs, no_verbs
+    view = get_lexicon().view('TVE')
+    return view.verbs, view.regions, view.co_verbs, view.gyo_verbs, view.no_verbs
 
 
 def load_tvm_tense():
     """Load TVM (Middle Voice) tense data from JSON file."""
-    data = _load_verb_data()
-
-    df_tvm = [row for row in data if row['Category'] == 'TVM']
-
-    verbs = {}
-    regions = {}
-    co_verbs = []
-    gyo_verbs = []
-    no_verbs = []
-
-    def check_prefix_in_words(form, prefix):
-        if not form:
-            return False
-        words = form.split()
-        return any(word.startswith(prefix) for word in words)
-
-    for row in df_tvm:
-        infinitive = row['Laz Infinitive']
-
-        present_forms = []
-        for key in [
-            'Laz 3rd Person Singular Present',
-            'Laz 3rd Person Singular Present Alternative 1',
-            'Laz 3rd Person Singular Present Alternative 2'
-        ]:
-            if row.get(key):
-                present_forms.append(row[key])
-
-        if any(form and check_prefix_in_words(form, 'co') for form in present_forms):
-            co_verbs.append(infinitive)
-        if any(form and check_prefix_in_words(form, 'gyo') for form in present_forms):
-            gyo_verbs.append(infinitive)
-        if any(form and (check_prefix_in_words(form, 'no') or check_prefix_in_words(form, 'nu') or check_prefix_in_words(form, 'n'))
-               for form in present_forms):
-            no_verbs.append(infinitive)
-
-        region_data = []
-        for key in ['Region', 'Region Alternative 1', 'Region Alternative 2']:
-            if row.get(key):
-                region_data.append(row[key])
-
-        regions_list = []
-        for reg in region_data:
-            if reg:
-                regions_list.extend([r.strip() for r in reg.split(',')])
-
-        if not regions_list:
-            regions_list = ["All"]
-
-        verbs[infinitive] = list(zip(present_forms, region_data))
-        regions[infinitive] = regions_list
-
-    return verbs, regions, co_verbs, gyo_verbs, no_verbs
+    view = get_lexicon().view('TVM')
+    return view.verbs, view.regions, view.co_verbs, view.gyo_verbs, view.no_verbs
 
 
 def load_tvm_tve_passive():
     """Load TVM and TVE passive forms from JSON file."""
-    data = _load_verb_data()
-
-    df_tve = [row for row in data if row['Category'] in ['TVE', 'TVM']]
-
-    verbs = {}
-    regions = {}
-
-    for row in df_tve:
-        infinitive = row['Laz Infinitive']
-
-        passive_forms = []
-        for key in [
-            'Laz 3rd Person Singular Present',
-            'Laz 3rd Person Singular Present Alternative 1',
-            'Laz 3rd Person Singular Present Alternative 2'
-        ]:
-            if row.get(key):
-                passive_forms.append(row[key])
-
-        region_data = []
-        for key in ['Region', 'Region Alternative 1', 'Region Alternative 2']:
-            if row.get(key):
-                region_data.append(row[key])
-
-        regions_list = []
-        for reg in region_data:
-            if reg:
-                regions_list.extend([r.strip() for r in reg.split(',')])
-
-        if not regions_list:
-            regions_list = ["All"]
-
-        verbs[infinitive] = list(zip(passive_forms, region_data))
-        regions[infinitive] = regions_list
-
-    return verbs, regions
+    view = get_lexicon().view('TVE', 'TVM')
+    return view.verbs, view.regions
 
 
 def load_tvm_tve_potential():
     """Load TVM and TVE potential forms from JSON file."""
-    data = _load_verb_data()
-
-    df_tve = [row for row in data if row['Category'] in ['TVE', 'TVM']]
-
-    verbs = {}
-    regions = {}
-
-    for row in df_tve:
-        infinitive = row['Laz Infinitive']
-
-        potential_forms = []
-        for key in [
-            'Laz 3rd Person Singular Present',
-            'Laz 3rd Person Singular Present Alternative 1',
-            'Laz 3rd Person Singular Present Alternative 2'
-        ]:
-            if row.get(key):
-                potential_forms.append(row[key])
-
-        region_data = []
-        for key in ['Region', 'Region Alternative 1', 'Region Alternative 2']:
-            if row.get(key):
-                region_data.append(row[key])
-
-        regions_list = []
-        for reg in region_data:
-            if reg:
-                regions_list.extend([r.strip() for r in reg.split(',')])
-
-        if not regions_list:
-            regions_list = ["All"]
-
-        verbs[infinitive] = list(zip(potential_forms, region_data))
-        regions[infinitive] = regions_list
-
-    return verbs, regions
+    view = get_lexicon().view('TVE', 'TVM')
+    return view.verbs, view.regions
 
 
 def load_tvm_tve_presentperf():
     """Load TVM and TVE present perfect forms from JSON file."""
-    data = _load_verb_data()
-
-    df_tve = [row for row in data if row['Category'] in ['TVE', 'TVM']]
-
-    verbs = {}
-    regions = {}
-
-    for row in df_tve:
-        infinitive = row['Laz Infinitive']
-
-        present_perfect_forms = []
-        for key in [
-            'Laz 3rd Person Singular Present',
-            'Laz 3rd Person Singular Present Alternative 1',
-            'Laz 3rd Person Singular Present Alternative 2'
-        ]:
-            if row.get(key):
-                present_perfect_forms.append(row[key])
-
-        region_data = []
-        for key in ['Region', 'Region Alternative 1', 'Region Alternative 2']:
-            if row.get(key):
-                region_data.append(row[key])
-
-        regions_list = []
-        for reg in region_data:
-            if reg:
-                regions_list.extend([r.strip() for r in reg.split(',')])
-
-        if not regions_list:
-            regions_list = ["All"]
-
-        verbs[infinitive] = list(zip(present_perfect_forms, region_data))
-        regions[infinitive] = regions_list
-
-    return verbs, regions
\ No newline at end of file
+    view = get_lexicon().view('TVE', 'TVM')
+    return view.verbs, view.regions
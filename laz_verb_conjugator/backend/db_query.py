@@ -1,7 +1,20 @@
+import base64
+import contextvars
+import json
+import logging
 import os
+import re
+import threading
+import time
 import unicodedata
+from contextlib import contextmanager
+from typing import NamedTuple
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import DBAPIError, ProgrammingError
+
+from backend.cache import LRUCache
+from backend.normalization import SpellingNormalizer
 
 load_dotenv()
 
@@ -9,7 +22,186 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set.")
 
-engine = create_engine(DATABASE_URL, future=True)
+logger = logging.getLogger(__name__)
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Seconds after which a pooled connection is replaced (-1 never)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# Server-side PREPAREd hot statements; turn off behind a transaction-pooling
+# proxy such as pgbouncer, which does not keep them per client.
+DB_PREPARED_STATEMENTS = os.getenv("DB_PREPARED_STATEMENTS", "true").lower() == "true"
+
+engine = create_engine(
+    DATABASE_URL,
+    future=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+
+# How often (seconds) the dataset version is re-read from the database
+DATASET_VERSION_TTL = float(os.getenv("DATASET_VERSION_TTL", "30"))
+# Maximum number of paradigms kept by the in-process cache (0 disables it)
+PARADIGM_CACHE_SIZE = int(os.getenv("PARADIGM_CACHE_SIZE", "2048"))
+# Matching rows fetched per tier by the prefix-based reverse lookup
+# (schemas without the normalized spelling columns)
+REVERSE_CANDIDATE_MAX = int(os.getenv("REVERSE_CANDIDATE_MAX", "5000"))
+
+# dialect_id -> code used as the top-level key of conjugation results
+DIALECT_CODES = {
+    1: "AŞ",
+    2: "PZ",
+    3: "FA",
+    4: "HO",
+}
+
+FRAMES = ["Dative", "Ergative", "Nominative"]
+
+# Values of the tense, mood and derivation enums (SQL Lazverbcon/enums.sql)
+TENSES = ("present", "past", "future", "present_perfect", "past_progressive")
+MOODS = ("indicative", "imperative", "negative_imperative", "optative")
+DERIVATIONS = ("none", "passive", "potential")
+
+
+class Markers(NamedTuple):
+    is_applicative: bool = False
+    is_causative: bool = False
+    is_double_causative: bool = False
+
+
+# -----------------------
+# Connections
+# -----------------------
+_scoped_connection = contextvars.ContextVar("db_query_connection", default=None)
+
+_pool_lock = threading.Lock()
+_pool_waits = {"checkouts": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+
+def _checkout():
+    started = time.perf_counter()
+    conn = engine.connect()
+    waited = time.perf_counter() - started
+
+    with _pool_lock:
+        _pool_waits["checkouts"] += 1
+        _pool_waits["wait_total"] += waited
+        _pool_waits["wait_max"] = max(_pool_waits["wait_max"], waited)
+
+    return conn
+
+
+@contextmanager
+def request_scope():
+    """
+    Share one pooled connection between every db_query call made inside the
+    block (typically one HTTP request). The connection is checked out on
+    first use and returned when the block exits.
+    """
+    holder = {"conn": None, "closed": False}
+    token = _scoped_connection.set(holder)
+    try:
+        yield
+    finally:
+        holder["closed"] = True
+        if holder["conn"] is not None:
+            holder["conn"].close()
+        try:
+            _scoped_connection.reset(token)
+        except ValueError:
+            # Exited from another context (e.g. after a streamed response);
+            # the closed holder is ignored by _connect there.
+            pass
+
+
+@contextmanager
+def _connect():
+    """Yield the request-scoped connection, or a fresh one outside a scope."""
+    holder = _scoped_connection.get()
+    if holder is None or holder["closed"]:
+        with _checkout() as conn:
+            yield conn
+        return
+
+    if holder["conn"] is None:
+        holder["conn"] = _checkout()
+    conn = holder["conn"]
+    try:
+        yield conn
+    except DBAPIError:
+        # A failed statement aborts the open transaction; later calls in
+        # the same scope need a clean one.
+        conn.rollback()
+        raise
+
+
+def pool_stats() -> dict:
+    with _pool_lock:
+        checkouts = _pool_waits["checkouts"]
+        wait_total = _pool_waits["wait_total"]
+        wait_max = _pool_waits["wait_max"]
+
+    return {
+        "size": engine.pool.size(),
+        "checked_out": engine.pool.checkedout(),
+        "overflow": engine.pool.overflow(),
+        "checkouts": checkouts,
+        "wait_avg_ms": round(1000 * wait_total / checkouts, 3) if checkouts else 0.0,
+        "wait_max_ms": round(1000 * wait_max, 3),
+    }
+
+
+class _HotStatement(NamedTuple):
+    name: str
+    params: tuple  # ((name, postgres type), ...) in PREPARE order
+    sql: str
+
+
+def _prepare_sql(statement: _HotStatement) -> str:
+    sql = statement.sql
+    for position, (param, _) in enumerate(statement.params, start=1):
+        sql = re.sub(rf"(?<!:):{param}\b", f"${position}", sql)
+    types = ", ".join(param_type for _, param_type in statement.params)
+    return f"PREPARE {statement.name} ({types}) AS {sql}"
+
+
+def _prepare_hot_statements(dbapi_connection, connection_record):
+    """PREPARE every hot statement on a new pooled connection."""
+    prepared = connection_record.info.setdefault("prepared", set())
+    cursor = dbapi_connection.cursor()
+    try:
+        for statement in _HOT_STATEMENTS:
+            try:
+                cursor.execute(_prepare_sql(statement))
+                dbapi_connection.commit()
+                prepared.add(statement.name)
+            except engine.dialect.dbapi.Error as e:
+                # e.g. the schema is older than the statement; plain SQL
+                # text is used for it on this connection.
+                dbapi_connection.rollback()
+                logger.warning("Could not prepare %s: %s", statement.name, e)
+    finally:
+        cursor.close()
+
+
+if DB_PREPARED_STATEMENTS:
+    event.listen(engine, "connect", _prepare_hot_statements)
+
+
+def _execute_hot(conn, statement: _HotStatement, params: dict):
+    """
+    Run a hot statement through its server-side prepared plan when this
+    connection has one, and as plain SQL text otherwise.
+    """
+    if statement.name in conn.info.get("prepared", ()):
+        placeholders = ", ".join(f":{param}" for param, _ in statement.params)
+        return conn.execute(text(f"EXECUTE {statement.name} ({placeholders})"), params)
+    return conn.execute(text(statement.sql), params)
 
 # Canonical tokens
 TOKEN_K = "{KCARON}"
@@ -70,6 +262,9 @@ TOKEN_TO_CANONICAL = {
 }
 
 
+# _apply_rules / _finalize_tokens are the rule-by-rule definition of the
+# reverse-lookup normalization; spelling_normalizer is its compiled,
+# memoized equivalent and is what the lookups use.
 def _apply_rules(text: str, rules) -> str:
     if not text:
         return ""
@@ -87,15 +282,51 @@ def _finalize_tokens(text: str) -> str:
     return unicodedata.normalize("NFC", t)
 
 
+spelling_normalizer = SpellingNormalizer(
+    STRICT_NORMALIZATION_RULES,
+    BROAD_NORMALIZATION_RULES,
+    TOKEN_TO_CANONICAL,
+)
+
+
+def _sql_string(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _normalize_sql(column: str, *rule_sets) -> str:
+    """
+    SQL computing _finalize_tokens(_apply_rules(...)) of `column` (the
+    rule-by-rule definition, as nested REPLACE calls), for schemas without
+    the normalized spelling columns.
+    """
+    sql = f"normalize(LOWER(btrim({column})), NFC)"
+    for rules in rule_sets:
+        for src, target in rules:
+            sql = f"REPLACE({sql}, {_sql_string(src)}, {_sql_string(target)})"
+    for token, canonical in TOKEN_TO_CANONICAL.items():
+        sql = f"REPLACE({sql}, {_sql_string(token)}, {_sql_string(canonical)})"
+    return f"normalize({sql}, NFC)"
+
+
+_SPELLING_STRICT_SQL = _normalize_sql("vf.spelling", STRICT_NORMALIZATION_RULES)
+_SPELLING_BROAD_SQL = _normalize_sql("vf.spelling", STRICT_NORMALIZATION_RULES, BROAD_NORMALIZATION_RULES)
+
+
 def _normalize_reverse_input_strict(text: str) -> str:
-    t = _apply_rules(text, STRICT_NORMALIZATION_RULES)
-    return _finalize_tokens(t)
+    return spelling_normalizer.strict(text)
 
 
 def _normalize_reverse_input_broad(text: str) -> str:
-    t = _apply_rules(text, STRICT_NORMALIZATION_RULES)
-    t = _apply_rules(t, BROAD_NORMALIZATION_RULES)
-    return _finalize_tokens(t)
+    return spelling_normalizer.broad(text)
+
+
+def reverse_lookup_keys(spelling: str):
+    """
+    The verb_form.spelling_lower / spelling_norm_strict / spelling_norm_broad
+    of a form spelled `spelling`: its str.lower() and its strict and broad
+    normalization. Whatever writes verb_form rows fills them from this.
+    """
+    return (spelling.lower(), *spelling_normalizer.keys(spelling))
 
 
 def _dedupe_reverse_rows(rows):
@@ -128,15 +359,200 @@ def _dedupe_reverse_rows(rows):
     return deduped
 
 
-def get_verb_id(infinitive: str, dialect_id: int) -> int | None:
-    sql = text("""
+_version_lock = threading.Lock()
+_version_state = {
+    "version": None,
+    "updated_at": None,
+    "pronouns": {},
+    "labels": ({}, {}),
+    "checked_at": 0.0,
+    "has_table": True,
+    "has_paradigm_store": True,
+    "has_normalized_spellings": True,
+}
+
+paradigm_cache = LRUCache(PARADIGM_CACHE_SIZE)
+
+
+def _read_dataset_version():
+    """
+    Read (version, updated_at) from the `data_version` row, which the seed
+    triggers bump on every write. Databases that predate the table fall back
+    to the max verb_form_id plus the row count, with no timestamp.
+    """
+    if _version_state["has_table"]:
+        try:
+            with _connect() as conn:
+                row = conn.execute(text("SELECT version, updated_at FROM data_version")).fetchone()
+            if row is None:
+                return ("data_version", 0), None
+            return ("data_version", row[0]), row[1]
+        except ProgrammingError:
+            _version_state["has_table"] = False
+
+    with _connect() as conn:
+        row = conn.execute(text("""
+            SELECT COALESCE(MAX(verb_form_id), 0), COUNT(*)
+            FROM verb_form
+        """)).fetchone()
+    return ("verb_form", row[0], row[1]), None
+
+
+def get_dataset_version():
+    """
+    Return the current dataset version, read at most once every
+    DATASET_VERSION_TTL seconds. A change of version clears the caches that
+    depend on the seeded data.
+    """
+    now = time.monotonic()
+    if (
+        _version_state["version"] is not None
+        and now - _version_state["checked_at"] < DATASET_VERSION_TTL
+    ):
+        return _version_state["version"]
+
+    with _version_lock:
+        if (
+            _version_state["version"] is not None
+            and now - _version_state["checked_at"] < DATASET_VERSION_TTL
+        ):
+            return _version_state["version"]
+
+        version, updated_at = _read_dataset_version()
+        if version != _version_state["version"]:
+            paradigm_cache.clear()
+            _version_state["pronouns"] = _read_pronoun_forms()
+            _version_state["labels"] = _read_labels()
+            _version_state["has_paradigm_store"] = True
+            _version_state["has_normalized_spellings"] = True
+        _version_state["version"] = version
+        _version_state["updated_at"] = updated_at
+        _version_state["checked_at"] = time.monotonic()
+        return version
+
+
+def get_dataset_updated_at():
+    """Return when the dataset last changed (timezone-aware), or None when unknown."""
+    get_dataset_version()
+    return _version_state["updated_at"]
+
+
+def _read_pronoun_forms():
+    with _connect() as conn:
+        rows = conn.execute(text("SELECT dialect_id, code, frame, form FROM pronoun")).fetchall()
+    return {(dialect_id, code, frame): form for dialect_id, code, frame, form in rows}
+
+
+def get_pronoun_forms():
+    """
+    Return {(dialect_id, code, frame): form} for the whole pronoun table,
+    loaded once per dataset version. Queries select bare person codes and
+    decorate them with these forms instead of joining pronoun twice.
+    """
+    get_dataset_version()
+    return _version_state["pronouns"]
+
+
+def _read_labels():
+    with _connect() as conn:
+        dialects = conn.execute(text("SELECT dialect_id, laz_name FROM dialect")).fetchall()
+        categories = conn.execute(text("SELECT code, english_name, turkish_name FROM verb_category")).fetchall()
+    return (
+        {dialect_id: laz_name for dialect_id, laz_name in dialects},
+        {code: (english_name, turkish_name) for code, english_name, turkish_name in categories},
+    )
+
+
+def get_labels():
+    """
+    Return ({dialect_id: laz_name}, {verb category code: (english_name,
+    turkish_name)}), loaded once per dataset version: the names reverse
+    lookups report for rows that do not come from verb_form.
+    """
+    get_dataset_version()
+    return _version_state["labels"]
+
+
+def _pronoun_form(pronouns, dialect_id, code, frame):
+    """Python twin of COALESCE(pronoun.form, code) for a LEFT JOIN on pronoun."""
+    if code is None:
+        return None
+    return pronouns.get((dialect_id, code, frame), code)
+
+
+def _decorate_pronouns(row: dict, pronouns) -> dict:
+    """Replace the subject/object codes of a row by their forms, dropping its dialect_id."""
+    dialect_id = row.pop("dialect_id")
+    row["subject"] = _pronoun_form(pronouns, dialect_id, row["subject"], row["frame"])
+    row["object"] = _pronoun_form(pronouns, dialect_id, row["object"], row["frame"])
+    return row
+
+
+_GET_VERB_ID = _HotStatement(
+    "lvc_get_verb_id",
+    (("infinitive", "text"), ("dialect_id", "integer")),
+    """
         SELECT verb_id
         FROM verb
         WHERE infinitive = :infinitive
           AND dialect_id = :dialect_id
-    """)
-    with engine.connect() as conn:
-        row = conn.execute(sql, {
+    """,
+)
+
+# The subject/object filters are folded into parameters so that every
+# combination shares one prepared plan: a NULL subject_filter matches any
+# subject, and object_mode is "default" (no object or O3SG), "code" or "all".
+_GET_CONJUGATION_ROWS = _HotStatement(
+    "lvc_get_conjugation_rows",
+    (
+        ("verb_id", "integer"),
+        ("tense", "tense"),
+        ("frame", "frame_type"),
+        ("mood", "mood"),
+        ("derivation", "derivation"),
+        ("is_applicative", "boolean"),
+        ("is_causative", "boolean"),
+        ("is_double_causative", "boolean"),
+        ("subject_filter", "person"),
+        ("object_mode", "text"),
+        ("object_filter", "person"),
+    ),
+    """
+        SELECT
+            v.dialect_id,
+            vf.subject,
+            vf.object,
+            vf.subject AS subject_code,
+            vf.object AS object_code,
+            vf.spelling,
+            vf.frame,
+            vf.optional_prefix
+        FROM verb_form vf
+        JOIN verb v
+          ON vf.verb_id = v.verb_id
+        WHERE vf.verb_id = :verb_id
+          AND vf.tense = :tense
+          AND vf.frame = :frame
+          AND vf.mood = :mood
+          AND vf.derivation = :derivation
+          AND vf.is_applicative = :is_applicative
+          AND vf.is_causative = :is_causative
+          AND vf.is_double_causative = :is_double_causative
+          AND vf.optional_prefix IS NULL
+          AND (CAST(:subject_filter AS person) IS NULL OR vf.subject = CAST(:subject_filter AS person))
+          AND (
+                (:object_mode = 'default' AND (vf.object IS NULL OR vf.object = 'O3SG'))
+             OR (:object_mode = 'code' AND vf.object = CAST(:object_filter AS person))
+             OR :object_mode = 'all'
+          )
+        ORDER BY vf.subject, vf.object
+    """,
+)
+
+
+def get_verb_id(infinitive: str, dialect_id: int) -> int | None:
+    with _connect() as conn:
+        row = _execute_hot(conn, _GET_VERB_ID, {
             "infinitive": infinitive,
             "dialect_id": dialect_id
         }).fetchone()
@@ -155,18 +571,6 @@ def get_conjugation_rows(
     subject_filter: str = "all",
     object_filter: str = "",
 ):
-    conditions = [
-        "vf.verb_id = :verb_id",
-        "vf.tense = :tense",
-        "vf.frame = :frame",
-        "vf.mood = :mood",
-        "vf.derivation = :derivation",
-        "vf.is_applicative = :is_applicative",
-        "vf.is_causative = :is_causative",
-        "vf.is_double_causative = :is_double_causative",
-        "vf.optional_prefix IS NULL",
-    ]
-
     params = {
         "verb_id": verb_id,
         "tense": tense,
@@ -176,46 +580,462 @@ def get_conjugation_rows(
         "is_applicative": is_applicative,
         "is_causative": is_causative,
         "is_double_causative": is_double_causative,
+        "subject_filter": None,
+        "object_mode": "all",
+        "object_filter": None,
     }
 
     if subject_filter and subject_filter != "all":
-        conditions.append("vf.subject = CAST(:subject_filter AS person)")
         params["subject_filter"] = subject_filter
 
     if object_filter == "":
-        conditions.append("(vf.object IS NULL OR vf.object = 'O3SG')")
+        params["object_mode"] = "default"
     elif object_filter and object_filter != "all":
-        conditions.append("vf.object = CAST(:object_filter AS person)")
+        params["object_mode"] = "code"
         params["object_filter"] = object_filter
 
-    sql = text(f"""
+    with _connect() as conn:
+        rows = _execute_hot(conn, _GET_CONJUGATION_ROWS, params).mappings().all()
+
+    pronouns = get_pronoun_forms()
+    return [_decorate_pronouns(dict(row), pronouns) for row in rows]
+
+
+class ParadigmRequest(NamedTuple):
+    infinitive: str
+    dialect_ids: tuple
+    tense: str
+    mood: str
+    derivation: str
+    markers: Markers
+    subject: str = "all"
+    object: str = ""
+
+
+def get_paradigm(
+    infinitive: str,
+    dialect_ids,
+    tense: str,
+    mood: str,
+    derivation: str,
+    markers: Markers,
+    subject: str = "all",
+    object: str = "",
+):
+    """
+    Return {dialect_code: {frame: [form, ...]}} for one verb.
+
+    A dialect is present as soon as the verb exists in it, even when no form
+    matches the filters (its frames are then empty lists). The returned dict
+    is shared between requests and must be treated as read-only.
+    """
+    request = ParadigmRequest(infinitive, dialect_ids, tense, mood, derivation, markers, subject, object)
+    return get_paradigms([request])[0]
+
+
+def get_paradigms(requests):
+    """
+    Answer several ParadigmRequests that share tense, mood, derivation and
+    markers, in order. Cache misses are fetched together: one read of the
+    materialized store, plus one live join for the verbs it cannot serve.
+    """
+    get_dataset_version()
+
+    keys = [_paradigm_key(request) for request in requests]
+    if len({key[2:6] for key in keys}) > 1:
+        raise ValueError("get_paradigms requests must share tense, mood, derivation and markers")
+
+    results = [paradigm_cache.get(key) for key in keys]
+    missing = [key for key, result in zip(keys, results) if result is None]
+    if not missing:
+        return results
+
+    group = missing[0]
+    infinitives = sorted({key.infinitive for key in missing})
+    dialect_ids = sorted({dialect_id for key in missing for dialect_id in key.dialect_ids})
+
+    paradigms, stale = _read_stored_paradigms(
+        infinitives, dialect_ids, group.tense, group.mood, group.derivation, group.markers
+    )
+    if stale:
+        paradigms.update(_fetch_paradigms(
+            sorted(stale), dialect_ids, group.tense, group.mood, group.derivation, group.markers
+        ))
+
+    for i, key in enumerate(keys):
+        if results[i] is None:
+            results[i] = _select_paradigm(paradigms.get(key.infinitive, {}), key)
+            paradigm_cache.set(key, results[i])
+
+    return results
+
+
+def _paradigm_key(request: ParadigmRequest) -> ParadigmRequest:
+    return request._replace(
+        dialect_ids=tuple(sorted(request.dialect_ids)),
+        markers=Markers(*request.markers),
+    )
+
+
+def _form_matches(form, subject: str, object: str) -> bool:
+    """Python twin of the subject/object conditions of get_conjugation_rows."""
+    if subject and subject != "all" and form["subject_code"] != subject:
+        return False
+    if object == "":
+        return form["object_code"] in (None, "O3SG")
+    if object and object != "all":
+        return form["object_code"] == object
+    return True
+
+
+def _select_paradigm(paradigm, request: ParadigmRequest):
+    """Narrow an unfiltered paradigm to the request's dialects, subject and object."""
+    results = {}
+    for dialect_id in request.dialect_ids:
+        dialect_code = DIALECT_CODES[dialect_id]
+        if dialect_code not in paradigm:
+            continue
+        results[dialect_code] = {
+            frame: [
+                form for form in paradigm[dialect_code][frame]
+                if _form_matches(form, request.subject, request.object)
+            ]
+            for frame in FRAMES
+        }
+    return results
+
+
+def _read_stored_paradigms(infinitives, dialect_ids, tense, mood, derivation, markers: Markers):
+    """
+    Read the materialized verb_paradigm documents, one row per (verb, dialect).
+
+    Returns ({infinitive: {dialect_code: {frame: [form, ...]}}}, stale) where
+    `stale` holds the infinitives the store cannot answer for: not built yet,
+    or built from an older data_version in one of the dialects.
+    """
+    if not _version_state["has_paradigm_store"]:
+        return {}, set(infinitives)
+
+    sql = text("""
+        SELECT
+            v.infinitive,
+            v.dialect_id,
+            r.source_version IS NOT DISTINCT FROM dv.version AS is_fresh,
+            p.document
+        FROM verb v
+        CROSS JOIN data_version dv
+        LEFT JOIN verb_paradigm_refresh r
+          ON r.verb_id = v.verb_id
+        LEFT JOIN verb_paradigm p
+          ON p.verb_id = v.verb_id
+         AND p.tense = :tense
+         AND p.mood = :mood
+         AND p.derivation = :derivation
+         AND p.is_applicative = :is_applicative
+         AND p.is_causative = :is_causative
+         AND p.is_double_causative = :is_double_causative
+        WHERE v.infinitive = ANY(:infinitives)
+          AND v.dialect_id = ANY(:dialect_ids)
+        ORDER BY v.infinitive, v.dialect_id
+    """)
+
+    params = {
+        "infinitives": list(infinitives),
+        "dialect_ids": list(dialect_ids),
+        "tense": tense,
+        "mood": mood,
+        "derivation": derivation,
+        "is_applicative": markers.is_applicative,
+        "is_causative": markers.is_causative,
+        "is_double_causative": markers.is_double_causative,
+    }
+
+    try:
+        with _connect() as conn:
+            rows = conn.execute(sql, params).mappings().all()
+    except ProgrammingError:
+        # Tables missing: the schema predates the paradigm store.
+        _version_state["has_paradigm_store"] = False
+        return {}, set(infinitives)
+
+    paradigms = {}
+    stale = set()
+    for row in rows:
+        if not row["is_fresh"]:
+            stale.add(row["infinitive"])
+            continue
+        document = row["document"] or {}
+        paradigms.setdefault(row["infinitive"], {})[DIALECT_CODES[row["dialect_id"]]] = {
+            frame: document.get(frame, []) for frame in FRAMES
+        }
+
+    for infinitive in stale:
+        paradigms.pop(infinitive, None)
+
+    return paradigms, stale
+
+
+def _fetch_paradigms(infinitives, dialect_ids, tense, mood, derivation, markers: Markers):
+    """
+    Live version of _read_stored_paradigms: join verb_form and pronoun for
+    every selected verb, dialect and frame in one statement.
+    """
+    # LEFT JOIN so that a verb without matching forms still yields one
+    # (all-NULL) row and its dialect shows up with empty frames.
+    sql = text("""
         SELECT
-            COALESCE(ps.form, vf.subject::text) AS subject,
-            COALESCE(po.form, vf.object::text) AS object,
+            v.infinitive,
+            v.dialect_id,
+            vf.frame,
             vf.subject AS subject_code,
             vf.object AS object_code,
-            vf.spelling,
+            vf.spelling
+        FROM verb v
+        LEFT JOIN verb_form vf
+          ON vf.verb_id = v.verb_id
+         AND vf.tense = :tense
+         AND vf.mood = :mood
+         AND vf.derivation = :derivation
+         AND vf.is_applicative = :is_applicative
+         AND vf.is_causative = :is_causative
+         AND vf.is_double_causative = :is_double_causative
+         AND vf.optional_prefix IS NULL
+        WHERE v.infinitive = ANY(:infinitives)
+          AND v.dialect_id = ANY(:dialect_ids)
+        ORDER BY v.infinitive, v.dialect_id, vf.subject, vf.object, vf.verb_form_id
+    """)
+
+    params = {
+        "infinitives": list(infinitives),
+        "dialect_ids": list(dialect_ids),
+        "tense": tense,
+        "mood": mood,
+        "derivation": derivation,
+        "is_applicative": markers.is_applicative,
+        "is_causative": markers.is_causative,
+        "is_double_causative": markers.is_double_causative,
+    }
+
+    with _connect() as conn:
+        rows = conn.execute(sql, params).mappings().all()
+
+    pronouns = get_pronoun_forms()
+    paradigms = {}
+    for row in rows:
+        dialects = paradigms.setdefault(row["infinitive"], {})
+        dialect_code = DIALECT_CODES[row["dialect_id"]]
+        frames = dialects.get(dialect_code)
+        if frames is None:
+            frames = dialects[dialect_code] = {frame: [] for frame in FRAMES}
+
+        if row["frame"] is None:
+            continue
+
+        frames[row["frame"]].append({
+            "subject": _pronoun_form(pronouns, row["dialect_id"], row["subject_code"], row["frame"]),
+            "object": _pronoun_form(pronouns, row["dialect_id"], row["object_code"], row["frame"]),
+            "subject_code": row["subject_code"],
+            "object_code": row["object_code"],
+            "conjugation": row["spelling"],
+        })
+
+    return paradigms
+
+
+def markers_key(markers: Markers) -> str:
+    """Name a marker combination for grouping: "none", "applicative", "applicative+double_causative", ..."""
+    names = [field.removeprefix("is_") for field, value in zip(Markers._fields, markers) if value]
+    return "+".join(names) or "none"
+
+
+def get_full_paradigm(infinitive: str, dialect_ids):
+    """
+    Return every verb_form of a verb, grouped as
+    {dialect_code: {tense: {mood: {derivation: {markers_key: {frame: [form, ...]}}}}}}.
+
+    Only the groups that have forms are present. Forms with an optional
+    prefix are included and carry it in "optional_prefix". The returned dict
+    is shared between requests and must be treated as read-only.
+    """
+    get_dataset_version()
+
+    key = ("full", infinitive, tuple(sorted(dialect_ids)))
+    results = paradigm_cache.get(key)
+    if results is not None:
+        return results
+
+    # verb_form is reached through idx_verb_form_verb_id only, for the
+    # handful of verb rows (one per dialect) matching the infinitive.
+    sql = text("""
+        SELECT
+            v.dialect_id,
+            vf.tense,
+            vf.mood,
+            vf.derivation,
+            vf.is_applicative,
+            vf.is_causative,
+            vf.is_double_causative,
             vf.frame,
-            vf.optional_prefix
-        FROM verb_form vf
-        JOIN verb v
+            vf.subject AS subject_code,
+            vf.object AS object_code,
+            vf.optional_prefix,
+            vf.spelling
+        FROM verb v
+        JOIN verb_form vf
           ON vf.verb_id = v.verb_id
-        LEFT JOIN pronoun ps
-          ON ps.dialect_id = v.dialect_id
-         AND ps.code = vf.subject
-         AND ps.frame = vf.frame
-        LEFT JOIN pronoun po
-          ON po.dialect_id = v.dialect_id
-         AND po.code = vf.object
-         AND po.frame = vf.frame
-        WHERE {" AND ".join(conditions)}
-        ORDER BY vf.subject, vf.object
+        WHERE v.infinitive = :infinitive
+          AND v.dialect_id = ANY(:dialect_ids)
+        ORDER BY
+            v.dialect_id, vf.tense, vf.mood, vf.derivation,
+            vf.is_applicative, vf.is_causative, vf.is_double_causative,
+            vf.frame, vf.subject, vf.object, vf.optional_prefix NULLS FIRST, vf.verb_form_id
     """)
 
+    with _connect() as conn:
+        rows = conn.execute(
+            sql, {"infinitive": infinitive, "dialect_ids": list(key[2])}
+        ).mappings().all()
+
+    pronouns = get_pronoun_forms()
+    results = {}
+    for row in rows:
+        markers = Markers(row["is_applicative"], row["is_causative"], row["is_double_causative"])
+        frames = (
+            results
+            .setdefault(DIALECT_CODES[row["dialect_id"]], {})
+            .setdefault(row["tense"], {})
+            .setdefault(row["mood"], {})
+            .setdefault(row["derivation"], {})
+            .setdefault(markers_key(markers), {})
+        )
+        frames.setdefault(row["frame"], []).append({
+            "subject": _pronoun_form(pronouns, row["dialect_id"], row["subject_code"], row["frame"]),
+            "object": _pronoun_form(pronouns, row["dialect_id"], row["object_code"], row["frame"]),
+            "subject_code": row["subject_code"],
+            "object_code": row["object_code"],
+            "optional_prefix": row["optional_prefix"],
+            "conjugation": row["spelling"],
+        })
+
+    paradigm_cache.set(key, results)
+    return results
+
+
+def refresh_paradigms(verb_ids=None) -> dict:
+    """
+    Rebuild the verb_paradigm documents for every verb, or only `verb_ids`.
+
+    Runs in a single transaction, so readers keep seeing the previous
+    documents until it commits. Documents that did not change are left
+    untouched; documents whose forms disappeared are deleted.
+    """
+    verb_filter = ""
+    params = {}
+    if verb_ids is not None:
+        verb_filter = "AND vf.verb_id = ANY(:verb_ids)"
+        params["verb_ids"] = list(verb_ids)
+
+    upsert_sql = text(f"""
+        WITH frame_forms AS (
+            SELECT
+                vf.verb_id,
+                vf.tense,
+                vf.mood,
+                vf.derivation,
+                vf.is_applicative,
+                vf.is_causative,
+                vf.is_double_causative,
+                vf.frame,
+                jsonb_agg(
+                    jsonb_build_object(
+                        'subject', COALESCE(ps.form, vf.subject::text),
+                        'object', COALESCE(po.form, vf.object::text),
+                        'subject_code', vf.subject,
+                        'object_code', vf.object,
+                        'conjugation', vf.spelling
+                    )
+                    ORDER BY vf.subject, vf.object, vf.verb_form_id
+                ) AS forms
+            FROM verb_form vf
+            JOIN verb v
+              ON vf.verb_id = v.verb_id
+            LEFT JOIN pronoun ps
+              ON ps.dialect_id = v.dialect_id
+             AND ps.code = vf.subject
+             AND ps.frame = vf.frame
+            LEFT JOIN pronoun po
+              ON po.dialect_id = v.dialect_id
+             AND po.code = vf.object
+             AND po.frame = vf.frame
+            WHERE vf.optional_prefix IS NULL
+              {verb_filter}
+            GROUP BY
+                vf.verb_id, vf.tense, vf.mood, vf.derivation,
+                vf.is_applicative, vf.is_causative, vf.is_double_causative,
+                vf.frame
+        )
+        INSERT INTO verb_paradigm (
+            verb_id, tense, mood, derivation,
+            is_applicative, is_causative, is_double_causative,
+            document
+        )
+        SELECT
+            verb_id, tense, mood, derivation,
+            is_applicative, is_causative, is_double_causative,
+            jsonb_object_agg(frame, forms)
+        FROM frame_forms
+        GROUP BY
+            verb_id, tense, mood, derivation,
+            is_applicative, is_causative, is_double_causative
+        ON CONFLICT (
+            verb_id, tense, mood, derivation,
+            is_applicative, is_causative, is_double_causative
+        )
+        DO UPDATE SET document = EXCLUDED.document
+        WHERE verb_paradigm.document IS DISTINCT FROM EXCLUDED.document
+    """)
+
+    delete_sql = text(f"""
+        DELETE FROM verb_paradigm p
+        WHERE NOT EXISTS (
+            SELECT 1
+            FROM verb_form vf
+            WHERE vf.verb_id = p.verb_id
+              AND vf.tense = p.tense
+              AND vf.mood = p.mood
+              AND vf.derivation = p.derivation
+              AND vf.is_applicative = p.is_applicative
+              AND vf.is_causative = p.is_causative
+              AND vf.is_double_causative = p.is_double_causative
+              AND vf.optional_prefix IS NULL
+        )
+        {"AND p.verb_id = ANY(:verb_ids)" if verb_ids is not None else ""}
+    """)
+
+    stamp_sql = text(f"""
+        INSERT INTO verb_paradigm_refresh (verb_id, source_version, refreshed_at)
+        SELECT v.verb_id, dv.version, now()
+        FROM verb v
+        CROSS JOIN data_version dv
+        {"WHERE v.verb_id = ANY(:verb_ids)" if verb_ids is not None else ""}
+        ON CONFLICT (verb_id)
+        DO UPDATE SET
+            source_version = EXCLUDED.source_version,
+            refreshed_at = EXCLUDED.refreshed_at
+    """)
+
+    # REPEATABLE READ: the documents and the stamped data_version come from
+    # the same snapshot, even if a reseed commits while we are running.
     with engine.connect() as conn:
-        rows = conn.execute(sql, params).mappings().all()
+        conn = conn.execution_options(isolation_level="REPEATABLE READ")
+        with conn.begin():
+            # Serialize concurrent refreshes; readers are never blocked.
+            conn.execute(text("LOCK TABLE verb_paradigm_refresh IN SHARE ROW EXCLUSIVE MODE"))
+            written = conn.execute(upsert_sql, params).rowcount
+            deleted = conn.execute(delete_sql, params).rowcount
+            verbs = conn.execute(stamp_sql, params).rowcount
 
-    return [dict(row) for row in rows]
+    return {"verbs": verbs, "written": written, "deleted": deleted}
 
 
 def _candidate_prefixes_for_query(query: str, broad: bool = False):
@@ -278,12 +1098,18 @@ def _candidate_prefixes_for_query(query: str, broad: bool = False):
     return prefixes
 
 
-def _fetch_reverse_candidates(conn, prefixes):
+def _fetch_reverse_candidates(conn, prefixes, normalized_sql, normalized_query):
+    """
+    The forms sharing a candidate prefix whose normalization (`normalized_sql`)
+    is `normalized_query`. Filtering in SQL keeps the REVERSE_CANDIDATE_MAX
+    cap on matches: a common prefix ("k'" starts over ten thousand forms)
+    cannot push the matching ones past it.
+    """
     if not prefixes:
         return []
 
     candidate_conditions = []
-    candidate_params = {}
+    candidate_params = {"normalized_query": normalized_query}
 
     for i, prefix in enumerate(prefixes):
         key = f"prefix{i}"
@@ -300,8 +1126,9 @@ def _fetch_reverse_candidates(conn, prefixes):
             vf.tense,
             vf.mood,
             vf.frame,
-            COALESCE(ps.form, vf.subject::text) AS subject,
-            COALESCE(po.form, vf.object::text) AS object,
+            v.dialect_id,
+            vf.subject,
+            vf.object,
             vf.subject AS subject_code,
             vf.object AS object_code,
             vf.derivation,
@@ -319,27 +1146,21 @@ def _fetch_reverse_candidates(conn, prefixes):
           ON v.dialect_id = d.dialect_id
         JOIN verb_category vc
           ON v.verb_category_id = vc.verb_category_id
-        LEFT JOIN pronoun ps
-          ON ps.dialect_id = v.dialect_id
-         AND ps.code = vf.subject
-         AND ps.frame = vf.frame
-        LEFT JOIN pronoun po
-          ON po.dialect_id = v.dialect_id
-         AND po.code = vf.object
-         AND po.frame = vf.frame
-        WHERE {" OR ".join(candidate_conditions)}
-        ORDER BY d.dialect_id, v.infinitive
+        WHERE ({" OR ".join(candidate_conditions)})
+          AND {normalized_sql} = :normalized_query
+        ORDER BY d.dialect_id, v.infinitive, vf.verb_form_id
+        LIMIT :candidate_limit
     """)
+    candidate_params["candidate_limit"] = REVERSE_CANDIDATE_MAX
 
+    # Undecorated: only the few candidates that match get their pronouns.
     return conn.execute(candidate_sql, candidate_params).mappings().all()
 
 
-def reverse_lookup(spelling: str):
-    spelling = (spelling or "").strip()
-    strict_normalized_spelling = _normalize_reverse_input_strict(spelling)
-    broad_normalized_spelling = _normalize_reverse_input_broad(spelling)
-
-    exact_sql = text("""
+_REVERSE_EXACT = _HotStatement(
+    "lvc_reverse_exact",
+    (("spelling", "text"),),
+    """
         SELECT
             vf.spelling AS conjugated_form,
             v.infinitive,
@@ -349,8 +1170,9 @@ def reverse_lookup(spelling: str):
             vf.tense,
             vf.mood,
             vf.frame,
-            COALESCE(ps.form, vf.subject::text) AS subject,
-            COALESCE(po.form, vf.object::text) AS object,
+            v.dialect_id,
+            vf.subject,
+            vf.object,
             vf.subject AS subject_code,
             vf.object AS object_code,
             vf.derivation,
@@ -368,27 +1190,493 @@ def reverse_lookup(spelling: str):
           ON v.dialect_id = d.dialect_id
         JOIN verb_category vc
           ON v.verb_category_id = vc.verb_category_id
-        LEFT JOIN pronoun ps
-          ON ps.dialect_id = v.dialect_id
-         AND ps.code = vf.subject
-         AND ps.frame = vf.frame
-        LEFT JOIN pronoun po
-          ON po.dialect_id = v.dialect_id
-         AND po.code = vf.object
-         AND po.frame = vf.frame
         WHERE LOWER(vf.spelling) = LOWER(:spelling)
-        ORDER BY d.dialect_id, v.infinitive
-    """)
+        ORDER BY d.dialect_id, v.infinitive, vf.verb_form_id
+    """,
+)
 
-    with engine.connect() as conn:
+_REVERSE_SELECT = """
+        SELECT
+            vf.spelling AS conjugated_form,
+            v.infinitive,
+            d.laz_name AS dialect,
+            v.meaning_english,
+            v.meaning_turkish,
+            vf.tense,
+            vf.mood,
+            vf.frame,
+            v.dialect_id,
+            vf.subject,
+            vf.object,
+            vf.subject AS subject_code,
+            vf.object AS object_code,
+            vf.derivation,
+            vf.is_applicative,
+            vf.is_causative,
+            vf.is_double_causative,
+            vf.optional_prefix,
+            vc.code AS verb_group_code,
+            vc.english_name AS verb_group_english,
+            vc.turkish_name AS verb_group_turkish
+        FROM verb_form vf
+        JOIN verb v
+          ON vf.verb_id = v.verb_id
+        JOIN dialect d
+          ON v.dialect_id = d.dialect_id
+        JOIN verb_category vc
+          ON v.verb_category_id = vc.verb_category_id
+"""
+
+# One indexed equality lookup per reverse-lookup tier. spelling_lower holds
+# Python's str.lower() of the spelling (see refresh_normalized_spellings), so
+# queries are folded the same way rather than by SQL LOWER(), which depends
+# on the database's ctype.
+_REVERSE_BY_LOWER = _HotStatement(
+    "lvc_reverse_by_lower",
+    (("spelling", "text"),),
+    _REVERSE_SELECT + """
+        WHERE vf.spelling_lower = :spelling
+        ORDER BY d.dialect_id, v.infinitive, vf.verb_form_id
+    """,
+)
+
+_REVERSE_BY_NORM_STRICT = _HotStatement(
+    "lvc_reverse_by_norm_strict",
+    (("spelling", "text"),),
+    _REVERSE_SELECT + """
+        WHERE vf.spelling_norm_strict = :spelling
+        ORDER BY d.dialect_id, v.infinitive, vf.verb_form_id
+    """,
+)
+
+_REVERSE_BY_NORM_BROAD = _HotStatement(
+    "lvc_reverse_by_norm_broad",
+    (("spelling", "text"),),
+    _REVERSE_SELECT + """
+        WHERE vf.spelling_norm_broad = :spelling
+        ORDER BY d.dialect_id, v.infinitive, vf.verb_form_id
+    """,
+)
+
+# The first page of a tier: its first rows and how many rows it has. Counting
+# reads the whole tier, so it happens once; the total travels in the cursor.
+_REVERSE_FIRST_PAGE_PARAMS = (
+    ("spelling", "text"),
+    ("limit", "integer"),
+)
+_REVERSE_FIRST_PAGE_SELECT = _REVERSE_SELECT.replace(
+    "SELECT", "SELECT vf.verb_form_id AS form_id, COUNT(*) OVER () AS total,", 1
+)
+_REVERSE_PAGE_ORDER = """
+        ORDER BY d.dialect_id, v.infinitive, vf.verb_form_id
+        LIMIT :limit
+"""
+
+# A later page of a tier: the rows after a (dialect_id, infinitive,
+# verb_form_id) keyset position.
+_REVERSE_PAGE_PARAMS = (
+    ("spelling", "text"),
+    ("after_dialect_id", "integer"),
+    ("after_infinitive", "text"),
+    ("after_form_id", "integer"),
+    ("limit", "integer"),
+)
+_REVERSE_PAGE_SELECT = _REVERSE_SELECT.replace(
+    "SELECT", "SELECT vf.verb_form_id AS form_id,", 1
+)
+_REVERSE_PAGE_AFTER = """
+          AND (v.dialect_id, v.infinitive, vf.verb_form_id)
+            > (:after_dialect_id, :after_infinitive, :after_form_id)
+""" + _REVERSE_PAGE_ORDER
+
+_REVERSE_TIER_CONDITIONS = (
+    ("lower", "vf.spelling_lower = :spelling"),
+    ("norm_strict", "vf.spelling_norm_strict = :spelling"),
+    ("norm_broad", "vf.spelling_norm_broad = :spelling"),
+)
+
+_REVERSE_FIRST_PAGE_STATEMENTS = tuple(
+    _HotStatement(
+        f"lvc_reverse_first_page_by_{name}",
+        _REVERSE_FIRST_PAGE_PARAMS,
+        _REVERSE_FIRST_PAGE_SELECT + f"""
+        WHERE {condition}
+    """ + _REVERSE_PAGE_ORDER,
+    )
+    for name, condition in _REVERSE_TIER_CONDITIONS
+)
+
+_REVERSE_PAGE_STATEMENTS = tuple(
+    _HotStatement(
+        f"lvc_reverse_page_by_{name}",
+        _REVERSE_PAGE_PARAMS,
+        _REVERSE_PAGE_SELECT + f"""
+        WHERE {condition}
+    """ + _REVERSE_PAGE_AFTER,
+    )
+    for name, condition in _REVERSE_TIER_CONDITIONS
+)
+
+# Prepared on every new pooled connection (see _prepare_hot_statements)
+_HOT_STATEMENTS = (
+    _GET_VERB_ID,
+    _GET_CONJUGATION_ROWS,
+    _REVERSE_EXACT,
+    _REVERSE_BY_LOWER,
+    _REVERSE_BY_NORM_STRICT,
+    _REVERSE_BY_NORM_BROAD,
+    *_REVERSE_FIRST_PAGE_STATEMENTS,
+    *_REVERSE_PAGE_STATEMENTS,
+)
+
+
+class ReverseCursor(NamedTuple):
+    """
+    Where the next page of a reverse lookup starts: the tier being paged,
+    how many of its rows were returned so far and, for the tiers read from
+    verb_form, the (dialect_id, infinitive, verb_form_id) of the last one
+    and the tier's row count, taken on its first page.
+    """
+
+    match_type: str
+    seen: int
+    after: tuple | None = None
+    total: int | None = None
+
+    def encode(self) -> str:
+        raw = json.dumps(
+            [self.match_type, self.seen, self.after, self.total], ensure_ascii=False, separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str):
+        """Parse an encode()d cursor; ValueError if it is not one."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            match_type, seen, after, total = json.loads(raw.decode("utf-8"))
+        except (ValueError, TypeError, UnicodeDecodeError):
+            raise ValueError("Invalid cursor")
+
+        if not isinstance(match_type, str) or not isinstance(seen, int) or seen < 0:
+            raise ValueError("Invalid cursor")
+        if total is not None and (not isinstance(total, int) or total < seen):
+            raise ValueError("Invalid cursor")
+        if after is not None:
+            if not (isinstance(after, list) and len(after) == 3
+                    and isinstance(after[0], int) and isinstance(after[1], str) and isinstance(after[2], int)):
+                raise ValueError("Invalid cursor")
+            after = tuple(after)
+        return cls(match_type, seen, after, total)
+
+
+class ReversePage(NamedTuple):
+    matches: list
+    total: int  # rows of the tier; deduplication may leave fewer
+    next_cursor: ReverseCursor | None
+
+
+def page_matches(matches, limit: int, cursor: ReverseCursor | None = None) -> ReversePage:
+    """Page an already computed list of matches by offset."""
+    start = cursor.seen if cursor is not None else 0
+    page = matches[start:start + limit]
+    next_cursor = None
+    if start + limit < len(matches):
+        next_cursor = ReverseCursor(page[0]["match_type"], start + len(page))
+    return ReversePage(page, len(matches), next_cursor)
+
+
+def reverse_lookup(spelling: str):
+    """
+    Find the forms spelled like `spelling`, trying in turn: a case-insensitive
+    exact match, then the strict and the broad normalized spellings. Each
+    tier is one indexed equality lookup on a verb_form column.
+    """
+    spelling = (spelling or "").strip()
+
+    if not _version_state["has_normalized_spellings"]:
+        return _reverse_lookup_by_prefix(spelling)
+
+    strict_normalized_spelling, broad_normalized_spelling = spelling_normalizer.keys(spelling)
+
+    tiers = [
+        ("exact", _REVERSE_BY_LOWER, spelling.lower(), strict_normalized_spelling),
+        ("normalized_strict", _REVERSE_BY_NORM_STRICT, strict_normalized_spelling, strict_normalized_spelling),
+        ("normalized_broad", _REVERSE_BY_NORM_BROAD, broad_normalized_spelling, broad_normalized_spelling),
+    ]
+
+    try:
+        with _connect() as conn:
+            for match_type, statement, key, normalized_query in tiers:
+                rows = _execute_hot(conn, statement, {"spelling": key}).mappings().all()
+                if not rows:
+                    continue
+
+                pronouns = get_pronoun_forms()
+                matches = [_decorate_pronouns(dict(row), pronouns) for row in rows]
+                for row in matches:
+                    row["match_type"] = match_type
+                    row["matched_query"] = spelling
+                    row["normalized_query"] = normalized_query
+
+                # Exact matches were never deduplicated; keep it that way.
+                return matches if match_type == "exact" else _dedupe_reverse_rows(matches)
+    except ProgrammingError:
+        # Columns missing: the schema predates the normalized spellings.
+        _version_state["has_normalized_spellings"] = False
+        return _reverse_lookup_by_prefix(spelling)
+
+    return []
+
+
+_REVERSE_TIERS = ("exact", "normalized_strict", "normalized_broad")
+
+
+def reverse_lookup_page(spelling: str, limit: int, cursor: ReverseCursor | None = None) -> ReversePage:
+    """
+    One page of reverse_lookup: at most `limit` rows of the first matching
+    tier (or of the tier `cursor` is paging), read with keyset pagination so
+    that no page after the first, which also counts the tier, costs more
+    than its own rows.
+    """
+    spelling = (spelling or "").strip()
+
+    if not _version_state["has_normalized_spellings"]:
+        seen = cursor.seen if cursor is not None else 0
+        return page_matches(_reverse_lookup_by_prefix(spelling, seen + limit + 1), limit, cursor)
+
+    strict_normalized_spelling, broad_normalized_spelling = spelling_normalizer.keys(spelling)
+    keys = (spelling.lower(), strict_normalized_spelling, broad_normalized_spelling)
+    seen = cursor.seen if cursor is not None else 0
+    paging = cursor is not None and cursor.after is not None and cursor.total is not None
+
+    try:
+        with _connect() as conn:
+            for tier, match_type in enumerate(_REVERSE_TIERS):
+                if cursor is not None and cursor.match_type != match_type:
+                    continue
+
+                if paging:
+                    after_dialect_id, after_infinitive, after_form_id = cursor.after
+                    rows = _execute_hot(conn, _REVERSE_PAGE_STATEMENTS[tier], {
+                        "spelling": keys[tier],
+                        "after_dialect_id": after_dialect_id,
+                        "after_infinitive": after_infinitive,
+                        "after_form_id": after_form_id,
+                        "limit": limit,
+                    }).mappings().all()
+                    total = cursor.total
+                else:
+                    rows = _execute_hot(conn, _REVERSE_FIRST_PAGE_STATEMENTS[tier], {
+                        "spelling": keys[tier],
+                        "limit": limit,
+                    }).mappings().all()
+                    total = rows[0]["total"] if rows else 0
+                if not rows:
+                    continue
+
+                last = rows[-1]
+                next_cursor = None
+                if len(rows) == limit and seen + len(rows) < total:
+                    next_cursor = ReverseCursor(
+                        match_type,
+                        seen + len(rows),
+                        (last["dialect_id"], last["infinitive"], last["form_id"]),
+                        total,
+                    )
+
+                pronouns = get_pronoun_forms()
+                normalized_query = broad_normalized_spelling if tier == 2 else strict_normalized_spelling
+                matches = []
+                for row in rows:
+                    row = dict(row)
+                    row.pop("form_id")
+                    row.pop("total", None)
+                    row = _decorate_pronouns(row, pronouns)
+                    row["match_type"] = match_type
+                    row["matched_query"] = spelling
+                    row["normalized_query"] = normalized_query
+                    matches.append(row)
+
+                if match_type != "exact":
+                    matches = _dedupe_reverse_rows(matches)
+                return ReversePage(matches, total, next_cursor)
+    except ProgrammingError:
+        _version_state["has_normalized_spellings"] = False
+        return page_matches(_reverse_lookup_by_prefix(spelling, seen + limit + 1), limit, cursor)
+
+    return ReversePage([], seen, None)
+
+
+# Every tier of every queried spelling in one statement; rows come grouped by
+# query, then tier, then in the order of the single-spelling tier queries.
+_REVERSE_MANY_SQL = text(
+    """
+    WITH q AS (
+        SELECT *
+        FROM unnest(
+            CAST(:spellings AS text[]),
+            CAST(:lowers AS text[]),
+            CAST(:stricts AS text[]),
+            CAST(:broads AS text[])
+        ) AS q(spelling, lower, strict, broad)
+    ),
+    hits AS (
+        SELECT q.spelling AS query, 0 AS tier, vf.verb_form_id
+        FROM q JOIN verb_form vf ON vf.spelling_lower = q.lower
+        UNION ALL
+        SELECT q.spelling, 1, vf.verb_form_id
+        FROM q JOIN verb_form vf ON vf.spelling_norm_strict = q.strict
+        UNION ALL
+        SELECT q.spelling, 2, vf.verb_form_id
+        FROM q JOIN verb_form vf ON vf.spelling_norm_broad = q.broad
+    )
+    """
+    + _REVERSE_SELECT.replace("SELECT", "SELECT hits.query, hits.tier,", 1)
+    + """
+        JOIN hits
+          ON hits.verb_form_id = vf.verb_form_id
+        ORDER BY hits.query, hits.tier, d.dialect_id, v.infinitive, vf.verb_form_id
+    """
+)
+
+
+def reverse_lookup_many(spellings):
+    """
+    reverse_lookup for many spellings in one round trip:
+    {spelling: matches}, with [] for the spellings nothing matches.
+    """
+    spellings = list(dict.fromkeys((spelling or "").strip() for spelling in spellings))
+    spellings = [spelling for spelling in spellings if spelling]
+    if not spellings:
+        return {}
+
+    if not _version_state["has_normalized_spellings"]:
+        return {spelling: _reverse_lookup_by_prefix(spelling) for spelling in spellings}
+
+    keys = [spelling_normalizer.keys(spelling) for spelling in spellings]
+    params = {
+        "spellings": spellings,
+        "lowers": [spelling.lower() for spelling in spellings],
+        "stricts": [strict for strict, _ in keys],
+        "broads": [broad for _, broad in keys],
+    }
+
+    try:
+        with _connect() as conn:
+            rows = conn.execute(_REVERSE_MANY_SQL, params).mappings().all()
+    except ProgrammingError:
+        _version_state["has_normalized_spellings"] = False
+        return {spelling: _reverse_lookup_by_prefix(spelling) for spelling in spellings}
+
+    # Only the best (lowest) tier reached by each spelling is kept.
+    best = {}
+    for row in rows:
+        query, tier = row["query"], row["tier"]
+        if best.setdefault(query, (tier, []))[0] == tier:
+            best[query][1].append(row)
+
+    pronouns = get_pronoun_forms()
+    results = {}
+    for spelling, (strict_normalized_spelling, broad_normalized_spelling) in zip(spellings, keys):
+        tier, tier_rows = best.get(spelling, (None, []))
+        if tier is None:
+            results[spelling] = []
+            continue
+
+        match_type = _REVERSE_TIERS[tier]
+        normalized_query = broad_normalized_spelling if tier == 2 else strict_normalized_spelling
+        matches = []
+        for row in tier_rows:
+            row = dict(row)
+            del row["query"], row["tier"]
+            row = _decorate_pronouns(row, pronouns)
+            row["match_type"] = match_type
+            row["matched_query"] = spelling
+            row["normalized_query"] = normalized_query
+            matches.append(row)
+
+        results[spelling] = matches if match_type == "exact" else _dedupe_reverse_rows(matches)
+
+    return results
+
+
+def refresh_normalized_spellings(batch_size: int = 10000) -> int:
+    """
+    Fill verb_form.spelling_lower / spelling_norm_strict / spelling_norm_broad
+    with the reverse_lookup_keys() of each spelling (str.lower() is the
+    in-memory index's fold, not SQL LOWER()), for rows written without them
+    or before a change of the rules. Only rows whose
+    values are missing or out of date are written, so re-running it is cheap
+    and, when nothing changed, does not bump the dataset version.
+    Returns the number of rows updated.
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(text("""
+            SELECT
+                verb_form_id,
+                spelling,
+                spelling_lower,
+                spelling_norm_strict,
+                spelling_norm_broad
+            FROM verb_form
+        """)).fetchall()
+
+        changed = []
+        for verb_form_id, spelling, *stored in rows:
+            keys = reverse_lookup_keys(spelling)
+            if keys != tuple(stored):
+                changed.append((verb_form_id, *keys))
+
+        update_sql = text("""
+            UPDATE verb_form AS vf
+            SET spelling_lower = n.lower,
+                spelling_norm_strict = n.strict,
+                spelling_norm_broad = n.broad
+            FROM (
+                SELECT
+                    unnest(CAST(:ids AS integer[])) AS verb_form_id,
+                    unnest(CAST(:lowers AS text[])) AS lower,
+                    unnest(CAST(:stricts AS text[])) AS strict,
+                    unnest(CAST(:broads AS text[])) AS broad
+            ) AS n
+            WHERE vf.verb_form_id = n.verb_form_id
+        """)
+
+        for start in range(0, len(changed), batch_size):
+            ids, lowers, stricts, broads = zip(*changed[start:start + batch_size])
+            conn.execute(update_sql, {
+                "ids": list(ids),
+                "lowers": list(lowers),
+                "stricts": list(stricts),
+                "broads": list(broads),
+            })
+
+    _version_state["has_normalized_spellings"] = True
+    return len(changed)
+
+
+def _reverse_lookup_by_prefix(spelling: str, max_matches: int | None = None):
+    """
+    reverse_lookup for databases without the normalized spelling columns:
+    fetch the forms sharing a candidate prefix whose spelling normalizes to
+    the query's in SQL (at most REVERSE_CANDIDATE_MAX per tier), and check
+    them again in Python, stopping at `max_matches`.
+    """
+    spelling = (spelling or "").strip()
+    strict_normalized_spelling, broad_normalized_spelling = spelling_normalizer.keys(spelling)
+
+    with _connect() as conn:
         # Tier 1: exact
-        exact_rows = conn.execute(
-            exact_sql,
+        exact_rows = _execute_hot(
+            conn,
+            _REVERSE_EXACT,
             {"spelling": spelling}
         ).mappings().all()
 
         if exact_rows:
-            results = [dict(row) for row in exact_rows]
+            pronouns = get_pronoun_forms()
+            results = [_decorate_pronouns(dict(row), pronouns) for row in exact_rows]
             for row in results:
                 row["match_type"] = "exact"
                 row["matched_query"] = spelling
@@ -397,42 +1685,58 @@ def reverse_lookup(spelling: str):
 
         # Tier 2: strict alternate-spelling fallback
         strict_prefixes = _candidate_prefixes_for_query(spelling, broad=False)
-        strict_candidate_rows = _fetch_reverse_candidates(conn, strict_prefixes)
-
-        strict_matches = []
-        for row in strict_candidate_rows:
-            row_dict = dict(row)
-            candidate_spelling = row_dict.get("conjugated_form", "")
-            normalized_candidate = _normalize_reverse_input_strict(candidate_spelling)
-
-            if normalized_candidate == strict_normalized_spelling:
-                row_dict["match_type"] = "normalized_strict"
-                row_dict["matched_query"] = spelling
-                row_dict["normalized_query"] = strict_normalized_spelling
-                strict_matches.append(row_dict)
+        strict_candidate_rows = _fetch_reverse_candidates(
+            conn, strict_prefixes, _SPELLING_STRICT_SQL, strict_normalized_spelling
+        )
 
-        strict_matches = _dedupe_reverse_rows(strict_matches)
+        strict_matches = _filter_reverse_candidates(
+            strict_candidate_rows,
+            _normalize_reverse_input_strict,
+            strict_normalized_spelling,
+            "normalized_strict",
+            spelling,
+            max_matches,
+        )
         if strict_matches:
             return strict_matches
 
         # Tier 3: broad plain-letter fallback
         broad_prefixes = _candidate_prefixes_for_query(spelling, broad=True)
-        broad_candidate_rows = _fetch_reverse_candidates(conn, broad_prefixes)
+        broad_candidate_rows = _fetch_reverse_candidates(
+            conn, broad_prefixes, _SPELLING_BROAD_SQL, broad_normalized_spelling
+        )
 
-    broad_matches = []
-    for row in broad_candidate_rows:
-        row_dict = dict(row)
-        candidate_spelling = row_dict.get("conjugated_form", "")
-        normalized_candidate = _normalize_reverse_input_broad(candidate_spelling)
+    return _filter_reverse_candidates(
+        broad_candidate_rows,
+        _normalize_reverse_input_broad,
+        broad_normalized_spelling,
+        "normalized_broad",
+        spelling,
+        max_matches,
+    )
 
-        if normalized_candidate == broad_normalized_spelling:
-            row_dict["match_type"] = "normalized_broad"
-            row_dict["matched_query"] = spelling
-            row_dict["normalized_query"] = broad_normalized_spelling
-            broad_matches.append(row_dict)
 
-    broad_matches = _dedupe_reverse_rows(broad_matches)
-    return broad_matches
+def _filter_reverse_candidates(rows, normalize, normalized_query, match_type, spelling, max_matches=None):
+    """The candidate rows whose normalized spelling is `normalized_query`, decorated and deduplicated."""
+    pronouns = None
+    matches = []
+    for row in rows:
+        if normalize(row["conjugated_form"] or "") != normalized_query:
+            continue
+
+        if pronouns is None:
+            pronouns = get_pronoun_forms()
+        row_dict = _decorate_pronouns(dict(row), pronouns)
+        row_dict["match_type"] = match_type
+        row_dict["matched_query"] = spelling
+        row_dict["normalized_query"] = normalized_query
+        matches.append(row_dict)
+
+        if max_matches is not None and len(matches) >= max_matches:
+            # Duplicates may still shrink the page; good enough for a bound.
+            break
+
+    return _dedupe_reverse_rows(matches)
 
 
 def reverse_suggestions(query: str, limit: int = 8):
@@ -444,7 +1748,7 @@ def reverse_suggestions(query: str, limit: int = 8):
         ORDER BY vf.spelling
         LIMIT :limit
     """)
-    with engine.connect() as conn:
+    with _connect() as conn:
         rows = conn.execute(sql, {
             "query": f"{query}%",
             "limit": limit
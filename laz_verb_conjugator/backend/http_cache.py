@@ -0,0 +1,107 @@
+import functools
+import hashlib
+import os
+
+from flask import g, make_response, request
+
+from backend.cache import LRUCache
+from backend.db_query import get_dataset_updated_at, get_dataset_version
+from backend.serialization import available_encodings
+
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "300"))
+# Maximum number of encoded responses kept in memory (0 disables it)
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))
+# Part of every ETag, so that a deploy changing the response format does not
+# keep answering 304 to clients holding the old bodies.
+APP_VERSION = os.getenv("APP_VERSION", "")
+
+# request_etag() -> serialization.EncodedResponse. The key carries the
+# dataset version, so entries of an older version are simply never hit again.
+response_cache = LRUCache(RESPONSE_CACHE_SIZE)
+
+
+def request_etag() -> str:
+    """
+    Strong ETag of the current read request: a hash of the dataset version,
+    the path, the query arguments (sorted and stripped) and the view's
+    variant (see conditional()).
+    """
+    etag = g.get("request_etag")
+    if etag is not None:
+        return etag
+
+    args = sorted(
+        (name, value.strip())
+        for name, value in request.args.items(multi=True)
+    )
+    digest = hashlib.sha256(
+        repr((APP_VERSION, get_dataset_version(), request.path, args, g.get("etag_variant"))).encode("utf-8")
+    ).hexdigest()
+    g.request_etag = digest[:32]
+    return g.request_etag
+
+
+def _not_modified(etag: str, last_modified):
+    """Return the validator the client already holds for this request, or None."""
+    if request.if_none_match:
+        for encoding in available_encodings():
+            candidate = _encoded_etag(etag, encoding)
+            if request.if_none_match.contains_weak(candidate):
+                return candidate
+        return None
+
+    if last_modified is not None and request.if_modified_since is not None:
+        if last_modified.replace(microsecond=0) <= request.if_modified_since:
+            return etag
+
+    return None
+
+
+def _encoded_etag(etag: str, encoding) -> str:
+    # Each content coding is a distinct representation, so it gets its own
+    # strong validator.
+    if encoding in (None, "identity"):
+        return etag
+    return f"{etag}-{encoding}"
+
+
+def _set_cache_headers(response, etag: str, last_modified, max_age: int):
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
+
+
+def conditional(max_age: int = HTTP_CACHE_MAX_AGE, variant=None):
+    """
+    Decorate a read-only GET view whose body depends only on the query string
+    and the seeded data, and on what `variant()` returns (a repr-able value
+    for any other state the body depends on, e.g. whether an in-memory index
+    is ready). Matching If-None-Match / If-Modified-Since requests get a 304
+    without running the view; 200 responses carry ETag, Last-Modified and
+    Cache-Control. A view with a variant can change while the data does not,
+    so it gets no Last-Modified and only its ETag validates it.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if variant is not None:
+                g.etag_variant = variant()
+            etag = request_etag()
+            last_modified = get_dataset_updated_at() if variant is None else None
+
+            held = _not_modified(etag, last_modified)
+            if held is not None:
+                return _set_cache_headers(make_response("", 304), held, last_modified, max_age)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                encoded_etag = _encoded_etag(etag, response.headers.get("Content-Encoding"))
+                _set_cache_headers(response, encoded_etag, last_modified, max_age)
+            return response
+
+        return wrapper
+
+    return decorator
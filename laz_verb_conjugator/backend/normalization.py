@@ -0,0 +1,109 @@
+import os
+import re
+import unicodedata
+
+from backend.cache import LRUCache
+from backend.conjugator.phonemes import COMBINING_MARKS
+
+# Spellings whose (strict, broad) keys are memoized
+SPELLING_NORMALIZER_CACHE_SIZE = int(os.getenv("SPELLING_NORMALIZER_CACHE_SIZE", "65536"))
+
+# A word: letters with their combining marks (the graphemes of
+# conjugator.phonemes), and apostrophes inside it (k'ilup, the ASCII
+# spelling of ǩilup).
+_LETTER = rf"[^\W\d_][{COMBINING_MARKS}]*"
+_WORD = re.compile(rf"(?:{_LETTER})+(?:['’ʼ](?:{_LETTER})+)*")
+
+
+def words(text: str):
+    """The words of a passage as (word, start, end), in text order; `text` is taken as is."""
+    return [(match.group(), match.start(), match.end()) for match in _WORD.finditer(text or "")]
+
+
+def _check_single_pass(rules):
+    """
+    Applying ordered replace() rules one after the other equals one
+    leftmost, first-alternative-wins scan only if no rule's source starts
+    inside a lower-priority source (or overlaps its end): replace() would
+    consume it first, the scan would not.
+    """
+    for priority, (earlier, _) in enumerate(rules):
+        for later, _ in rules[priority + 1:]:
+            for offset in range(1, len(later)):
+                tail = later[offset:]
+                if tail.startswith(earlier) or earlier.startswith(tail):
+                    raise ValueError(f"Rule {earlier!r} overlaps the lower-priority rule {later!r}")
+
+
+class SpellingNormalizer:
+    """
+    The reverse-lookup spelling normalization (db_query's strict rules, then
+    broad rules, then token finalization) compiled into one regex scan that
+    yields the strict and the broad key together, behind a bounded memo.
+
+    Byte-identical to the rule-by-rule definition, including its broad-tier
+    quirk: the second pass lowercases the strict tokens before the broad
+    rules run over them, so they are never finalized.
+    """
+
+    def __init__(self, strict_rules, broad_rules, token_to_canonical, cache_size=SPELLING_NORMALIZER_CACHE_SIZE):
+        strict_rules = list(strict_rules)
+        broad_rules = list(broad_rules)
+        _check_single_pass(strict_rules)
+        _check_single_pass(broad_rules)
+
+        self._strict_pattern = re.compile("(" + "|".join(re.escape(src) for src, _ in strict_rules) + ")")
+        self._broad_pattern = re.compile("|".join(re.escape(src) for src, _ in broad_rules))
+
+        broad_targets = {}
+        for src, token in broad_rules:
+            broad_targets.setdefault(src, token_to_canonical.get(token, token))
+        self._broad_targets = broad_targets
+
+        # Matched strict source -> (its strict piece, its broad piece)
+        self._pieces = {}
+        for src, token in strict_rules:
+            if src not in self._pieces:
+                self._pieces[src] = (
+                    token_to_canonical.get(token, token),
+                    self._broad_gap(token.lower()),
+                )
+
+        self.cache = LRUCache(cache_size)
+
+    def _broad_gap(self, text: str) -> str:
+        return self._broad_pattern.sub(lambda match: self._broad_targets[match.group()], text)
+
+    def keys(self, text: str):
+        """(strict, broad) normalized keys of `text`."""
+        if not text:
+            return "", ""
+
+        keys = self.cache.get(text)
+        if keys is not None:
+            return keys
+
+        parts = self._strict_pattern.split(unicodedata.normalize("NFC", text.strip().lower()))
+        strict = []
+        broad = []
+        for i, part in enumerate(parts):
+            if i % 2:
+                strict_piece, broad_piece = self._pieces[part]
+                strict.append(strict_piece)
+                broad.append(broad_piece)
+            elif part:
+                strict.append(part)
+                broad.append(self._broad_gap(part.lower()))
+
+        keys = (
+            unicodedata.normalize("NFC", "".join(strict)),
+            unicodedata.normalize("NFC", "".join(broad)),
+        )
+        self.cache.set(text, keys)
+        return keys
+
+    def strict(self, text: str) -> str:
+        return self.keys(text)[0]
+
+    def broad(self, text: str) -> str:
+        return self.keys(text)[1]
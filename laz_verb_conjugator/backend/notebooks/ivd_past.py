@@ -11,7 +11,8 @@ from ..utils import (
     adjust_prefix,
     ivd_subject_markers as subject_markers,
     subjects,
-    objects
+    objects,
+    collect_paradigm
 )
 from backend.dataloader import load_ivd_verbs
 
@@ -20,39 +21,18 @@ verbs, regions = load_ivd_verbs()
 # Define preverbs and their specific rules
 preverbs_rules = get_preverbs_rules('ivd_past')
 
-# Function to conjugate past tense with subject and object, handling preverbs, phonetic rules, applicative and causative markers
-def conjugate_past(infinitive, subject, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
-    # Check for invalid SxOx combinations
-    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
-       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
-        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
-    
-    if applicative and obj is None:
-        raise ValueError("Applicative requires an object to be specified.")
-    if (causative or simple_causative) and obj is None:
-        raise ValueError("Causative requires an object to be specified.")
-    
-    if infinitive not in verbs:
-        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
-
-    # Get the regions for the current infinitive
-    regions_list = regions[infinitive]
-
+def analyze_verb(infinitive):
+    """
+    The part of conjugate_past() that does not depend on the subject or object,
+    per (third-person form, region) of the verb; conjugate_paradigm() works it
+    out once and shares it between the cells.
+    """
     main_infinitive = process_compound_verb(infinitive)
-    # Get the third-person forms and their associated regions
     third_person_forms = verbs[infinitive]
-    
-    # Initialize region_conjugations
-    region_conjugations = {region: [] for region in regions_list}
-
-
-    # Get the first word from the infinitive at the start
     first_word_infinitive = get_first_word(infinitive)
-
-    # Process each third-person form and its associated regions
+    analysis = {}
     for third_person, region_str in third_person_forms:
-        regions_for_form = region_str.split(',')
-        for region in regions_for_form:
+        for region in region_str.split(','):
             region = region.strip()
             personal_pronouns = get_personal_pronouns(region, mode='ivd_past')
             phonetic_rules_v, phonetic_rules_g = get_phonetic_rules(region)
@@ -96,6 +76,43 @@ def conjugate_past(infinitive, subject, obj=None, applicative=False, causative=F
             # Remove the preverb from the third-person form if it exists
             if preverb and root.startswith(preverb):
                 root = root[len(preverb):]
+            analysis[third_person, region] = (phonetic_rules_v, phonetic_rules_g, root, first_word, suffixes, preverb)
+    return analysis
+
+
+# Function to conjugate past tense with subject and object, handling preverbs, phonetic rules, applicative and causative markers
+def conjugate_past(infinitive, subject, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False, analysis=None):
+    # Check for invalid SxOx combinations
+    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
+       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
+        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
+    
+    if applicative and obj is None:
+        raise ValueError("Applicative requires an object to be specified.")
+    if (causative or simple_causative) and obj is None:
+        raise ValueError("Causative requires an object to be specified.")
+    
+    if infinitive not in verbs:
+        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
+
+    # Get the regions for the current infinitive
+    regions_list = regions[infinitive]
+
+    # Get the third-person forms and their associated regions
+    third_person_forms = verbs[infinitive]
+    
+    # Initialize region_conjugations
+    region_conjugations = {region: [] for region in regions_list}
+
+    if analysis is None:
+        analysis = analyze_verb(infinitive)
+
+    # Process each third-person form and its associated regions
+    for third_person, region_str in third_person_forms:
+        regions_for_form = region_str.split(',')
+        for region in regions_for_form:
+            region = region.strip()
+            phonetic_rules_v, phonetic_rules_g, root, first_word, suffixes, preverb = analysis[third_person, region]
 
             # Handle special case for verbs starting with 'u' and 'i'
             root = handle_special_case_u(root, subject, preverb)
@@ -321,10 +338,10 @@ def conjugate_past(infinitive, subject, obj=None, applicative=False, causative=F
     return region_conjugations
 
 # Define the function to handle conjugations and collection
-def collect_conjugations(infinitive, subjects, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
+def collect_conjugations(infinitive, subjects, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False, analysis=None):
     all_conjugations = {}
     for subject in subjects:
-        result = conjugate_past(infinitive, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, use_optional_preverb=use_optional_preverb)
+        result = conjugate_past(infinitive, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, use_optional_preverb=use_optional_preverb, analysis=analysis)
         for region, conjugation_list in result.items():
             if region not in all_conjugations:
                 all_conjugations[region] = set()
@@ -332,6 +349,14 @@ def collect_conjugations(infinitive, subjects, obj=None, applicative=False, caus
                 all_conjugations[region].add((subject, obj, conjugation[2]))  # Ensure unique conjugation for each combination
     return all_conjugations
 
+# Conjugate every (subject, object) cell of the paradigm, analysing the verb once for all of them
+def conjugate_paradigm(infinitive, subjects, objects, tense=None, applicative=False, causative=False, simple_causative=False, mood=None):
+    analysis = analyze_verb(infinitive) if infinitive in verbs else None
+    return collect_paradigm(
+        lambda subject, obj: collect_conjugations(infinitive, [subject], obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, analysis=analysis),
+        subjects, objects
+    )
+
 def collect_conjugations_all_subjects_all_objects(infinitive, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
     all_conjugations = {}
     for subject in subjects:
@@ -11,7 +11,8 @@ from ..utils import (
     get_preverbs_rules,
     tve_subject_markers as subject_markers,
     subjects,
-    objects
+    objects,
+    collect_paradigm
 )
 from backend.dataloader import load_tve_verbs
 
@@ -19,42 +20,17 @@ verbs, regions, co_verbs, gyo_verbs, no_verbs = load_tve_verbs()
 
 preverbs_rules = get_preverbs_rules('tve_future')
 
-# Update the conjugate_future function to return a dictionary
-def conjugate_future(infinitive, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
-    # Check for invalid SxOx combinations
-    if applicative and (
-        (subject == 'S1_Singular' and obj == 'O1_Plural') or 
-        (subject == 'S2_Singular' and obj == 'O2_Plural') or
-        (subject == 'S1_Plural' and obj == 'O1_Singular') or
-        (subject == 'S2_Plural' and obj == 'O2_Singular')
-    ):
-        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
-    elif (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural'] and not applicative) or \
-        (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural'] and not applicative):
-        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
-    
-    if applicative and obj is None:
-        raise ValueError("Applicative requires an object to be specified.")
-    if (causative or simple_causative) and obj is None:
-        raise ValueError("Causative requires an object to be specified.")
-    
-    if infinitive not in verbs:
-        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
-    
-    # Get the regions for the current infinitive
-    regions_list = regions[infinitive]
-
+def analyze_verb(infinitive):
+    """
+    The part of conjugate_future() that does not depend on the subject or object,
+    per (third-person form, region) of the verb; conjugate_paradigm() works it
+    out once and shares it between the cells.
+    """
     main_infinitive = process_compound_verb(infinitive)
-    # Get the third-person forms and their associated regions
     third_person_forms = verbs[infinitive]
-    
-    # Initialize region_conjugations
-    region_conjugations = {region: [] for region in regions_list}
-
-    # Process each third-person form and its associated regions
+    analysis = {}
     for third_person, region_str in third_person_forms:
-        regions_for_form = region_str.split(',')
-        for region in regions_for_form:
+        for region in region_str.split(','):
             region = region.strip()
             personal_pronouns = get_personal_pronouns(region, 'tve_future')
             phonetic_rules_v, phonetic_rules_g = get_phonetic_rules(region)
@@ -98,6 +74,51 @@ def conjugate_future(infinitive, subject=None, obj=None, applicative=False, caus
             # Remove the preverb from the third-person form if it exists
             if preverb and root.startswith(preverb):
                 root = root[len(preverb):]
+            analysis[third_person, region] = (phonetic_rules_v, phonetic_rules_g, original_root, root, first_word, suffixes, preverb)
+    return analysis
+
+
+# Update the conjugate_future function to return a dictionary
+def conjugate_future(infinitive, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False, analysis=None):
+    # Check for invalid SxOx combinations
+    if applicative and (
+        (subject == 'S1_Singular' and obj == 'O1_Plural') or 
+        (subject == 'S2_Singular' and obj == 'O2_Plural') or
+        (subject == 'S1_Plural' and obj == 'O1_Singular') or
+        (subject == 'S2_Plural' and obj == 'O2_Singular')
+    ):
+        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
+    elif (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural'] and not applicative) or \
+        (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural'] and not applicative):
+        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
+    
+    if applicative and obj is None:
+        raise ValueError("Applicative requires an object to be specified.")
+    if (causative or simple_causative) and obj is None:
+        raise ValueError("Causative requires an object to be specified.")
+    
+    if infinitive not in verbs:
+        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
+    
+    # Get the regions for the current infinitive
+    regions_list = regions[infinitive]
+
+    main_infinitive = process_compound_verb(infinitive)
+    # Get the third-person forms and their associated regions
+    third_person_forms = verbs[infinitive]
+    
+    # Initialize region_conjugations
+    region_conjugations = {region: [] for region in regions_list}
+
+    if analysis is None:
+        analysis = analyze_verb(infinitive)
+
+    # Process each third-person form and its associated regions
+    for third_person, region_str in third_person_forms:
+        regions_for_form = region_str.split(',')
+        for region in regions_for_form:
+            region = region.strip()
+            phonetic_rules_v, phonetic_rules_g, original_root, root, first_word, suffixes, preverb = analysis[third_person, region]
 
             # Determine the marker (applicative or causative)
             marker = ''
@@ -728,10 +749,10 @@ def conjugate_future(infinitive, subject=None, obj=None, applicative=False, caus
 
 
 # Define the function to handle conjugations and collection
-def collect_conjugations(infinitive, subjects, obj=None, applicative=False, causative=False, simple_causative=False):
+def collect_conjugations(infinitive, subjects, obj=None, applicative=False, causative=False, simple_causative=False, analysis=None):
     all_conjugations = {}
     for subject in subjects:
-        result = conjugate_future(infinitive, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative)
+        result = conjugate_future(infinitive, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, analysis=analysis)
         for region, conjugation_list in result.items():
             if region not in all_conjugations:
                 all_conjugations[region] = set()
@@ -739,6 +760,14 @@ def collect_conjugations(infinitive, subjects, obj=None, applicative=False, caus
                 all_conjugations[region].add((subject, obj, conjugation[2]))  # Ensure unique conjugation for each combination
     return all_conjugations
 
+# Conjugate every (subject, object) cell of the paradigm, analysing the verb once for all of them
+def conjugate_paradigm(infinitive, subjects, objects, tense=None, applicative=False, causative=False, simple_causative=False, mood=None):
+    analysis = analyze_verb(infinitive) if infinitive in verbs else None
+    return collect_paradigm(
+        lambda subject, obj: collect_conjugations(infinitive, [subject], obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, analysis=analysis),
+        subjects, objects
+    )
+
 def collect_conjugations_all_subjects_all_objects(infinitive, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
     all_conjugations = {}
     for subject in subjects:
@@ -12,7 +12,8 @@ from ..utils import (
     tve_subject_markers as subject_markers,
     ordered_objects,
     subjects,
-    objects
+    objects,
+    collect_paradigm
 )
 from backend.dataloader import load_tve_verbs
 
@@ -20,44 +21,17 @@ verbs, regions, co_verbs, gyo_verbs, no_verbs = load_tve_verbs()
 
 preverbs_rules = get_preverbs_rules('tve_present')
 
-# Function to conjugate present tense with subject and object, handling preverbs, phonetic rules, applicative and causative markers
-def conjugate_present(infinitive, subject, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False, mood=None):
-    # Check for invalid SxOx combinations
-    if applicative and (
-        (subject == 'S1_Singular' and obj == 'O1_Plural') or 
-        (subject == 'S2_Singular' and obj == 'O2_Plural') or
-        (subject == 'S1_Plural' and obj == 'O1_Singular') or
-        (subject == 'S2_Plural' and obj == 'O2_Singular')
-    ):
-        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
-    elif (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural'] and not applicative) or \
-        (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural'] and not applicative):
-        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
-
-    if applicative and obj is None:
-        raise ValueError("Applicative requires an object to be specified.")
-    if (causative or simple_causative) and obj is None:
-        raise ValueError("Causative requires an object to be specified.")
-    
-    if infinitive not in verbs:
-        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
-
-    # Get the regions for the current infinitive
-    regions_list = regions[infinitive]
-
+def analyze_verb(infinitive):
+    """
+    The part of conjugate_present() that does not depend on the subject or object,
+    per (third-person form, region) of the verb; conjugate_paradigm() works it
+    out once and shares it between the cells.
+    """
     main_infinitive = process_compound_verb(infinitive)
-    # Get the third-person forms and their associated regions
     third_person_forms = verbs[infinitive]
-    
-    # Initialize region_conjugations
-    region_conjugations = {region: [] for region in regions_list}
-
-
-
-    # Process each third-person form and its associated regions
+    analysis = {}
     for third_person, region_str in third_person_forms:
-        regions_for_form = region_str.split(',')
-        for region in regions_for_form:
+        for region in region_str.split(','):
             region = region.strip()
             phonetic_rules_v, phonetic_rules_g = get_phonetic_rules(region)
 
@@ -101,6 +75,51 @@ def conjugate_present(infinitive, subject, obj=None, applicative=False, causativ
             # Remove the preverb from the third-person form if it exists
             if preverb and root.startswith(preverb):
                 root = root[len(preverb):]
+            analysis[third_person, region] = (phonetic_rules_v, phonetic_rules_g, original_root, root, first_word, suffixes, preverb)
+    return analysis
+
+
+# Function to conjugate present tense with subject and object, handling preverbs, phonetic rules, applicative and causative markers
+def conjugate_present(infinitive, subject, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False, mood=None, analysis=None):
+    # Check for invalid SxOx combinations
+    if applicative and (
+        (subject == 'S1_Singular' and obj == 'O1_Plural') or 
+        (subject == 'S2_Singular' and obj == 'O2_Plural') or
+        (subject == 'S1_Plural' and obj == 'O1_Singular') or
+        (subject == 'S2_Plural' and obj == 'O2_Singular')
+    ):
+        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
+    elif (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural'] and not applicative) or \
+        (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural'] and not applicative):
+        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
+
+    if applicative and obj is None:
+        raise ValueError("Applicative requires an object to be specified.")
+    if (causative or simple_causative) and obj is None:
+        raise ValueError("Causative requires an object to be specified.")
+    
+    if infinitive not in verbs:
+        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
+
+    # Get the regions for the current infinitive
+    regions_list = regions[infinitive]
+
+    main_infinitive = process_compound_verb(infinitive)
+    # Get the third-person forms and their associated regions
+    third_person_forms = verbs[infinitive]
+    
+    # Initialize region_conjugations
+    region_conjugations = {region: [] for region in regions_list}
+
+    if analysis is None:
+        analysis = analyze_verb(infinitive)
+
+    # Process each third-person form and its associated regions
+    for third_person, region_str in third_person_forms:
+        regions_for_form = region_str.split(',')
+        for region in regions_for_form:
+            region = region.strip()
+            phonetic_rules_v, phonetic_rules_g, original_root, root, first_word, suffixes, preverb = analysis[third_person, region]
             # After extracting third_person, root, and region but before preverb logic:
 
 
@@ -816,10 +835,10 @@ def conjugate_present(infinitive, subject, obj=None, applicative=False, causativ
     return region_conjugations
 
 # Define the function to handle conjugations and collection
-def collect_conjugations(infinitive, subjects, obj=None, applicative=False, causative=False, simple_causative=False, mood=None):
+def collect_conjugations(infinitive, subjects, obj=None, applicative=False, causative=False, simple_causative=False, mood=None, analysis=None):
     all_conjugations = {}
     for subject in subjects:
-        result = conjugate_present(infinitive, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, mood=mood)
+        result = conjugate_present(infinitive, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, mood=mood, analysis=analysis)
         for region, conjugation_list in result.items():
             if region not in all_conjugations:
                 all_conjugations[region] = []
@@ -830,6 +849,14 @@ def collect_conjugations(infinitive, subjects, obj=None, applicative=False, caus
         all_conjugations[region] = list(all_conjugations[region])
     return all_conjugations
 
+# Conjugate every (subject, object) cell of the paradigm, analysing the verb once for all of them
+def conjugate_paradigm(infinitive, subjects, objects, tense=None, applicative=False, causative=False, simple_causative=False, mood=None):
+    analysis = analyze_verb(infinitive) if infinitive in verbs else None
+    return collect_paradigm(
+        lambda subject, obj: collect_conjugations(infinitive, [subject], obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, mood=mood, analysis=analysis),
+        subjects, objects
+    )
+
 def insert_before_last_word(phrase: str, insert: str) -> str:
     """
     Insert `insert` right before the last whitespace-separated token in `phrase`.
@@ -6,7 +6,8 @@ from ..utils import (
     adjust_prefix, 
     get_personal_pronouns,
     get_preverbs_rules,
-    subjects
+    subjects,
+    collect_paradigm
 )
 
 from backend.dataloader import load_tvm_tense
@@ -118,35 +119,17 @@ def get_suffixes(tense, region):
         }
     return suffixes
 
-def conjugate_verb(infinitive, tense, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
-    # Check for invalid SxOx combinations
-    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
-       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
-        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
-    
-
-    if applicative and obj is None:
-        raise ValueError("Applicative requires an object to be specified.")
-    if (causative or simple_causative) and obj is None:
-        raise ValueError("Causative requires an object to be specified.")
-    
-    if infinitive not in verbs:
-        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
-    
-    # Get the regions for the current infinitive
-    regions_list = regions[infinitive]
-
+def analyze_verb(infinitive, tense):
+    """
+    The part of conjugate_verb() that does not depend on the subject or object,
+    per (third-person form, region) of the verb; conjugate_paradigm() works it
+    out once and shares it between the cells.
+    """
     main_infinitive = process_compound_verb(infinitive)
-    # Get the third-person forms and their associated regions
     third_person_forms = verbs[infinitive]
-    
-    # Initialize region_conjugations
-    region_conjugations = {region: [] for region in regions_list}
-    
-    # Process each third-person form and its associated regions
+    analysis = {}
     for third_person, region_str in third_person_forms:
-        regions_for_form = region_str.split(',')
-        for region in regions_for_form:
+        for region in region_str.split(','):
             region = region.strip()
             personal_pronouns = get_personal_pronouns(region, 'tvm_tense')
             phonetic_rules_v, phonetic_rules_g = get_phonetic_rules(region)
@@ -186,6 +169,44 @@ def conjugate_verb(infinitive, tense, subject=None, obj=None, applicative=False,
             # Remove the preverb from the third-person form if it exists
             if preverb and root.startswith(preverb) and infinitive != 'gonǯǩu':
                 root = root[len(preverb):]
+            analysis[third_person, region] = (phonetic_rules_v, phonetic_rules_g, root, first_word, suffixes, preverb)
+    return analysis
+
+
+def conjugate_verb(infinitive, tense, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False, analysis=None):
+    # Check for invalid SxOx combinations
+    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
+       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
+        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
+    
+
+    if applicative and obj is None:
+        raise ValueError("Applicative requires an object to be specified.")
+    if (causative or simple_causative) and obj is None:
+        raise ValueError("Causative requires an object to be specified.")
+    
+    if infinitive not in verbs:
+        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
+    
+    # Get the regions for the current infinitive
+    regions_list = regions[infinitive]
+
+    main_infinitive = process_compound_verb(infinitive)
+    # Get the third-person forms and their associated regions
+    third_person_forms = verbs[infinitive]
+    
+    # Initialize region_conjugations
+    region_conjugations = {region: [] for region in regions_list}
+    
+    if analysis is None:
+        analysis = analyze_verb(infinitive, tense)
+
+    # Process each third-person form and its associated regions
+    for third_person, region_str in third_person_forms:
+        regions_for_form = region_str.split(',')
+        for region in regions_for_form:
+            region = region.strip()
+            phonetic_rules_v, phonetic_rules_g, root, first_word, suffixes, preverb = analysis[third_person, region]
 
             # Determine the marker (applicative or causative)
             marker = ''
@@ -505,10 +526,10 @@ def conjugate_verb(infinitive, tense, subject=None, obj=None, applicative=False,
 
     return region_conjugations
 
-def collect_conjugations_all(infinitive, subjects, tense='present', obj=None, applicative=False, causative=False, simple_causative=False):
+def collect_conjugations_all(infinitive, subjects, tense='present', obj=None, applicative=False, causative=False, simple_causative=False, analysis=None):
     all_conjugations = {}
     for subject in subjects:
-        result = conjugate_verb(infinitive, tense, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative)
+        result = conjugate_verb(infinitive, tense, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, analysis=analysis)
         for region, conjugation_list in result.items():
             if region not in all_conjugations:
                 all_conjugations[region] = set()
@@ -516,6 +537,14 @@ def collect_conjugations_all(infinitive, subjects, tense='present', obj=None, ap
                 all_conjugations[region].add((subject, obj, conjugation[2]))  # Ensure unique conjugation for each combination
     return all_conjugations
 
+# Conjugate every (subject, object) cell of the paradigm, analysing the verb once for all of them
+def conjugate_paradigm(infinitive, subjects, objects, tense=None, applicative=False, causative=False, simple_causative=False, mood=None):
+    analysis = analyze_verb(infinitive, tense) if infinitive in verbs else None
+    return collect_paradigm(
+        lambda subject, obj: collect_conjugations_all(infinitive, [subject], tense=tense, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, analysis=analysis),
+        subjects, objects
+    )
+
 # Define the function to extract negative imperatives
 def extract_neg_imperatives(all_conjugations, subjects):
     imperatives = {}
@@ -12,7 +12,8 @@ from ..utils import (
     get_personal_pronouns,
     get_preverbs_rules,
     tve_subject_markers as subject_markers,
-    subjects
+    subjects,
+    collect_paradigm
 )
 from backend.dataloader import load_tvm_tve_passive
 
@@ -97,35 +98,18 @@ def get_suffixes(tense, region, causative):
             
     return suffixes
 
-def conjugate_passive_form(infinitive, tense, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
-    
-    # Check for invalid SxOx combinations
-    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
-       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
-        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
-    
-    if applicative and (causative or simple_causative):
-        raise ValueError("A verb can either have an applicative marker or a causative marker, but not both.")
-    if applicative and obj is None:
-        raise ValueError("Applicative requires an object to be specified.")
-    
-    if infinitive not in verbs:
-        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
-    
-    # Get the regions for the current infinitive
+def analyze_verb(infinitive, tense, causative):
+    """
+    The part of conjugate_passive_form() that does not depend on the subject or object,
+    per (third-person form, region) of the verb; conjugate_paradigm() works it
+    out once and shares it between the cells.
+    """
     regions_list = regions[infinitive]
-
     main_infinitive = process_compound_verb(infinitive)
-    # Use the infinitive for the third-person forms
     third_person_forms = [(infinitive, ', '.join(regions_list))]
-    
-    # Initialize region_conjugations
-    region_conjugations = {region: [] for region in regions_list}
-
-    # Process each third-person form and its associated regions
+    analysis = {}
     for third_person, region_str in third_person_forms:
-        regions_for_form = region_str.split(',')
-        for region in regions_for_form:
+        for region in region_str.split(','):
             region = region.strip()
             personal_pronouns = get_personal_pronouns(region, 'tvm_tve_passive')
             phonetic_rules_v, phonetic_rules_g = get_phonetic_rules(region, is_tvm=True)
@@ -161,6 +145,43 @@ def conjugate_passive_form(infinitive, tense, subject=None, obj=None, applicativ
                 root = 'i' + infinitive[1:-1] + "v"
             else:
                 root = 'i' + root[1:-1]  # Remove the last character of the root
+            analysis[third_person, region] = (phonetic_rules_v, phonetic_rules_g, root, first_word, suffixes, preverb)
+    return analysis
+
+
+def conjugate_passive_form(infinitive, tense, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False, analysis=None):
+    
+    # Check for invalid SxOx combinations
+    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
+       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
+        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
+    
+    if applicative and (causative or simple_causative):
+        raise ValueError("A verb can either have an applicative marker or a causative marker, but not both.")
+    if applicative and obj is None:
+        raise ValueError("Applicative requires an object to be specified.")
+    
+    if infinitive not in verbs:
+        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
+    
+    # Get the regions for the current infinitive
+    regions_list = regions[infinitive]
+
+    # Use the infinitive for the third-person forms
+    third_person_forms = [(infinitive, ', '.join(regions_list))]
+    
+    # Initialize region_conjugations
+    region_conjugations = {region: [] for region in regions_list}
+
+    if analysis is None:
+        analysis = analyze_verb(infinitive, tense, causative)
+
+    # Process each third-person form and its associated regions
+    for third_person, region_str in third_person_forms:
+        regions_for_form = region_str.split(',')
+        for region in regions_for_form:
+            region = region.strip()
+            phonetic_rules_v, phonetic_rules_g, root, first_word, suffixes, preverb = analysis[third_person, region]
 
             # Get the first letter after the marker is attached
             first_letter = get_first_letter(root)
@@ -247,13 +268,21 @@ def conjugate_passive_form(infinitive, tense, subject=None, obj=None, applicativ
     return region_conjugations
 
 # Define the function to handle conjugations and collection
-def collect_conjugations_all(infinitive, subjects, tense='present', obj=None, applicative=False, causative=False, simple_causative=False):
+def collect_conjugations_all(infinitive, subjects, tense='present', obj=None, applicative=False, causative=False, simple_causative=False, analysis=None):
     all_conjugations = {}
     for subject in subjects:
-        result = conjugate_passive_form(infinitive, tense, subject=subject, causative=causative, simple_causative=simple_causative)
+        result = conjugate_passive_form(infinitive, tense, subject=subject, causative=causative, simple_causative=simple_causative, analysis=analysis)
         for region, conjugation_list in result.items():
             if region not in all_conjugations:
                 all_conjugations[region] = set()
             for conjugation in conjugation_list:
                 all_conjugations[region].add((subject, obj, conjugation[2]))  # Ensure unique conjugation for each combination
     return all_conjugations
+
+# Conjugate every (subject, object) cell of the paradigm, analysing the verb once for all of them
+def conjugate_paradigm(infinitive, subjects, objects, tense=None, applicative=False, causative=False, simple_causative=False, mood=None):
+    analysis = analyze_verb(infinitive, tense, causative) if infinitive in verbs else None
+    return collect_paradigm(
+        lambda subject, obj: collect_conjugations_all(infinitive, [subject], tense=tense, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, analysis=analysis),
+        subjects, objects
+    )
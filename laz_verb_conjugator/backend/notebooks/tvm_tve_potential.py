@@ -7,7 +7,8 @@ from ..utils import (
     get_preverbs_rules,
     potential_subject_markers as subject_markers,
     subjects,
-    objects
+    objects,
+    collect_paradigm
 )
 from backend.dataloader import load_tvm_tve_potential
 
@@ -64,36 +65,18 @@ def get_suffixes(tense, region):
         }
     return suffixes
 
-def conjugate_potential_form(infinitive, tense, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
-    # Check for invalid SxOx combinations
-    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
-       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
-        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
-    
-    if applicative and (causative or simple_causative):
-        raise ValueError("A verb can either have an applicative marker or a causative marker, but not both.")
-    if applicative and obj is None:
-        raise ValueError("Applicative requires an object to be specified.")
-    if causative and obj is None:
-        raise ValueError("Causative requires an object to be specified.")
-    
-    if infinitive not in verbs:
-        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
-    
-    # Get the regions for the current infinitive
+def analyze_verb(infinitive, tense):
+    """
+    The part of conjugate_potential_form() that does not depend on the subject or object,
+    per (third-person form, region) of the verb; conjugate_paradigm() works it
+    out once and shares it between the cells.
+    """
     regions_list = regions[infinitive]
-
     main_infinitive = process_compound_verb(infinitive)
-    # Use the infinitive for the third-person forms
     third_person_forms = [(infinitive, ', '.join(regions_list))]
-    
-    # Initialize region_conjugations
-    region_conjugations = {region: [] for region in regions_list}
-
-    # Process each third-person form and its associated regions
+    analysis = {}
     for third_person, region_str in third_person_forms:
-        regions_for_form = region_str.split(',')
-        for region in regions_for_form:
+        for region in region_str.split(','):
             region = region.strip()
             personal_pronouns = get_personal_pronouns(region, 'tvm_tve_potential')
             phonetic_rules_v, phonetic_rules_g = get_phonetic_rules(region, is_tvm=True)
@@ -138,6 +121,44 @@ def conjugate_potential_form(infinitive, tense, subject=None, obj=None, applicat
                 root = infinitive[1:-1] + "v"
             else:
                 root = root[1:-1]  # Remove the last character of the root
+            analysis[third_person, region] = (root, first_word, suffixes, preverb)
+    return analysis
+
+
+def conjugate_potential_form(infinitive, tense, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False, analysis=None):
+    # Check for invalid SxOx combinations
+    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
+       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
+        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
+    
+    if applicative and (causative or simple_causative):
+        raise ValueError("A verb can either have an applicative marker or a causative marker, but not both.")
+    if applicative and obj is None:
+        raise ValueError("Applicative requires an object to be specified.")
+    if causative and obj is None:
+        raise ValueError("Causative requires an object to be specified.")
+    
+    if infinitive not in verbs:
+        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
+    
+    # Get the regions for the current infinitive
+    regions_list = regions[infinitive]
+
+    # Use the infinitive for the third-person forms
+    third_person_forms = [(infinitive, ', '.join(regions_list))]
+    
+    # Initialize region_conjugations
+    region_conjugations = {region: [] for region in regions_list}
+
+    if analysis is None:
+        analysis = analyze_verb(infinitive, tense)
+
+    # Process each third-person form and its associated regions
+    for third_person, region_str in third_person_forms:
+        regions_for_form = region_str.split(',')
+        for region in regions_for_form:
+            region = region.strip()
+            root, first_word, suffixes, preverb = analysis[third_person, region]
 
             
 
@@ -198,10 +219,10 @@ def conjugate_potential_form(infinitive, tense, subject=None, obj=None, applicat
     return region_conjugations
 
 # Define the function to handle conjugations and collection
-def collect_conjugations_all(infinitive, subjects, tense='present', obj=None, applicative=False, causative=False, simple_causative=False):
+def collect_conjugations_all(infinitive, subjects, tense='present', obj=None, applicative=False, causative=False, simple_causative=False, analysis=None):
     all_conjugations = {}
     for subject in subjects:
-        result = conjugate_potential_form(infinitive, tense, subject=subject)
+        result = conjugate_potential_form(infinitive, tense, subject=subject, analysis=analysis)
         for region, conjugation_list in result.items():
             if not region:
                 continue
@@ -211,6 +232,14 @@ def collect_conjugations_all(infinitive, subjects, tense='present', obj=None, ap
                 all_conjugations[region].add((subject, obj, conjugation[2]))  # Ensure unique conjugation for each combination
     return all_conjugations
 
+# Conjugate every (subject, object) cell of the paradigm, analysing the verb once for all of them
+def conjugate_paradigm(infinitive, subjects, objects, tense=None, applicative=False, causative=False, simple_causative=False, mood=None):
+    analysis = analyze_verb(infinitive, tense) if infinitive in verbs else None
+    return collect_paradigm(
+        lambda subject, obj: collect_conjugations_all(infinitive, [subject], tense=tense, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, analysis=analysis),
+        subjects, objects
+    )
+
 def collect_conjugations_all_subjects_all_objects(infinitive, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
     all_conjugations = {}
     for subject in subjects:
@@ -224,4 +253,4 @@ def collect_conjugations_all_subjects_all_objects(infinitive, applicative=False,
     return all_conjugations
 
 def collect_conjugations_all_subjects_specific_object(infinitive, obj, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
-    return collect_conjugations(infinitive, subjects, obj, applicative, causative, simple_causative, use_optional_preverb)
\ No newline at end of file
+    return collect_conjugations(infinitive, subjects, obj, applicative, causative, simple_causative, use_optional_preverb)
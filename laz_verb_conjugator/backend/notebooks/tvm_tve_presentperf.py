@@ -6,7 +6,8 @@ from ..utils import (
     get_personal_pronouns,
     get_preverbs_rules,
     presentperf_subject_markers as subject_markers,
-    subjects
+    subjects,
+    collect_paradigm
 )
 from backend.dataloader import load_tvm_tve_presentperf
 
@@ -25,36 +26,18 @@ def get_suffixes(region):
     }
     return suffixes
 
-def conjugate_present_perfect_form(infinitive, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False):
-    # Check for invalid SxOx combinations
-    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
-       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
-        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
-    
-    if applicative or (causative or simple_causative):
-        raise ValueError("This tense cannot have an applicative, causative or optative. ")
-    if obj:
-        raise ValueError("This tense cannot have an object.")
-    if causative and obj is None:
-        raise ValueError("Causative requires an object to be specified.")
-    
-    if infinitive not in verbs:
-        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
-    
-    # Get the regions for the current infinitive
+def analyze_verb(infinitive):
+    """
+    The part of conjugate_present_perfect_form() that does not depend on the subject or object,
+    per (third-person form, region) of the verb; conjugate_paradigm() works it
+    out once and shares it between the cells.
+    """
     regions_list = regions[infinitive]
-
     main_infinitive = process_compound_verb(infinitive)
-    # Use the infinitive for the third-person forms
     third_person_forms = [(infinitive, ', '.join(regions_list))]
-    
-    # Initialize region_conjugations
-    region_conjugations = {region: [] for region in regions_list}
-
-    # Process each third-person form and its associated regions
+    analysis = {}
     for third_person, region_str in third_person_forms:
-        regions_for_form = region_str.split(',')
-        for region in regions_for_form:
+        for region in region_str.split(','):
             region = region.strip()
             personal_pronouns = get_personal_pronouns(region, 'tvm_tve_presentperf')
             phonetic_rules_v, phonetic_rules_g = get_phonetic_rules(region, is_tvm=True)
@@ -89,6 +72,44 @@ def conjugate_present_perfect_form(infinitive, subject=None, obj=None, applicati
                 root = infinitive[1:-1] + "v"
             else:
                 root = root[1:-1]  # Remove the last character of the root
+            analysis[third_person, region] = (root, first_word, suffixes, preverb)
+    return analysis
+
+
+def conjugate_present_perfect_form(infinitive, subject=None, obj=None, applicative=False, causative=False, simple_causative=False, use_optional_preverb=False, analysis=None):
+    # Check for invalid SxOx combinations
+    if (subject in ['S1_Singular', 'S1_Plural'] and obj in ['O1_Singular', 'O1_Plural']) or \
+       (subject in ['S2_Singular', 'S2_Plural'] and obj in ['O2_Singular', 'O2_Plural']):
+        return {region: [(subject, obj, 'N/A - Geçersiz Kombinasyon')] for region in regions[infinitive]}
+    
+    if applicative or (causative or simple_causative):
+        raise ValueError("This tense cannot have an applicative, causative or optative. ")
+    if obj:
+        raise ValueError("This tense cannot have an object.")
+    if causative and obj is None:
+        raise ValueError("Causative requires an object to be specified.")
+    
+    if infinitive not in verbs:
+        return {region: [(subject, obj, f"Infinitive {infinitive} not found.")] for region in regions[infinitive]}
+    
+    # Get the regions for the current infinitive
+    regions_list = regions[infinitive]
+
+    # Use the infinitive for the third-person forms
+    third_person_forms = [(infinitive, ', '.join(regions_list))]
+    
+    # Initialize region_conjugations
+    region_conjugations = {region: [] for region in regions_list}
+
+    if analysis is None:
+        analysis = analyze_verb(infinitive)
+
+    # Process each third-person form and its associated regions
+    for third_person, region_str in third_person_forms:
+        regions_for_form = region_str.split(',')
+        for region in regions_for_form:
+            region = region.strip()
+            root, first_word, suffixes, preverb = analysis[third_person, region]
 
             # Get the first letter after the marker is attached
             first_letter = get_first_letter(root)
@@ -140,13 +161,21 @@ def conjugate_present_perfect_form(infinitive, subject=None, obj=None, applicati
     return region_conjugations
 
 # Define the function to handle conjugations and collection
-def collect_conjugations(infinitive, subjects, obj=None, applicative=False, causative=False, simple_causative=False, mood=None):
+def collect_conjugations(infinitive, subjects, obj=None, applicative=False, causative=False, simple_causative=False, mood=None, analysis=None):
     all_conjugations = {}
     for subject in subjects:
-        result = conjugate_present_perfect_form(infinitive, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative)
+        result = conjugate_present_perfect_form(infinitive, subject=subject, obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, analysis=analysis)
         for region, conjugation_list in result.items():
             if region not in all_conjugations:
                 all_conjugations[region] = set()
             for conjugation in conjugation_list:
                 all_conjugations[region].add(conjugation)
-    return all_conjugations
\ No newline at end of file
+    return all_conjugations
+
+# Conjugate every (subject, object) cell of the paradigm, analysing the verb once for all of them
+def conjugate_paradigm(infinitive, subjects, objects, tense=None, applicative=False, causative=False, simple_causative=False, mood=None):
+    analysis = analyze_verb(infinitive) if infinitive in verbs else None
+    return collect_paradigm(
+        lambda subject, obj: collect_conjugations(infinitive, [subject], obj=obj, applicative=applicative, causative=causative, simple_causative=simple_causative, mood=mood, analysis=analysis),
+        subjects, objects
+    )
@@ -0,0 +1,148 @@
+import glob
+import json
+import os
+from collections import Counter
+from typing import Callable, NamedTuple
+
+# Frequency table written by `flask aggregate-popularity` and used to rank
+# reverse-lookup suggestions
+POPULARITY_TABLE = os.getenv(
+    "POPULARITY_TABLE", os.path.join(os.path.dirname(__file__), "logs", "popularity.json")
+)
+# Entries kept per table section, most frequent first
+POPULARITY_TABLE_MAX = int(os.getenv("POPULARITY_TABLE_MAX", "100000"))
+# A lookup of a spelling counts this many times as much as a lookup of its verb
+POPULARITY_SPELLING_WEIGHT = int(os.getenv("POPULARITY_SPELLING_WEIGHT", "10"))
+
+_CONJUGATE_ENDPOINTS = ("/api/conjugate", "/api/conjugate/batch", "/api/verbs/paradigm")
+
+
+class Popularity(NamedTuple):
+    spellings: Counter  # normalized spelling -> lookups
+    infinitives: Counter  # infinitive -> lookups
+
+
+def log_files(path: str):
+    """The request log at `path` and its rotated backups, oldest first."""
+    backups = sorted(
+        (candidate for candidate in glob.glob(f"{glob.escape(path)}.*") if candidate[len(path) + 1:].isdigit()),
+        key=lambda candidate: int(candidate[len(path) + 1:]),
+        reverse=True,
+    )
+    return [*backups, path]
+
+
+def _log_entries(paths):
+    """The JSON entries of request log lines ("<time> - <json>"), skipping the unreadable ones."""
+    for path in paths:
+        try:
+            f = open(path, encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        with f:
+            for line in f:
+                _, separator, message = line.partition(" - ")
+                if not separator:
+                    continue
+                try:
+                    entry = json.loads(message)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and isinstance(entry.get("request"), dict):
+                    yield entry
+
+
+def _count_matches(popularity, spellings, matches, normalize):
+    """Count one lookup of `spellings` and of the verbs among `matches`."""
+    for spelling in spellings:
+        if isinstance(spelling, str) and spelling.strip():
+            popularity.spellings[normalize(spelling)] += 1
+    infinitives = {row.get("infinitive") for row in matches if isinstance(row, dict)}
+    for infinitive in infinitives:
+        if isinstance(infinitive, str) and infinitive:
+            popularity.infinitives[infinitive] += 1
+
+
+def aggregate(paths, normalize: Callable[[str], str]) -> Popularity:
+    """
+    Stream request logs and count the spellings people looked up (each
+    form a reverse lookup answered with, or the query itself when the log
+    kept only a summary of the response) and the verbs they conjugated.
+    Lookups that matched nothing are left out: they are mostly typos.
+    """
+    popularity = Popularity(Counter(), Counter())
+
+    for entry in _log_entries(paths):
+        endpoint = entry.get("endpoint")
+        request = entry["request"]
+        response = entry.get("response")
+
+        if endpoint == "/api/reverse":
+            if request.get("cursor"):
+                continue  # a later page of a lookup already counted
+            if isinstance(response, dict) and isinstance(response.get("matches"), list):
+                matches = response["matches"]
+                forms = {row.get("conjugated_form") for row in matches if isinstance(row, dict)}
+                _count_matches(popularity, forms, matches, normalize)
+            elif "response_size" in entry:
+                _count_matches(popularity, [request.get("spelling")], [], normalize)
+
+        elif endpoint == "/api/reverse/analyze":
+            if isinstance(response, dict) and isinstance(response.get("matches"), dict):
+                for token, matches in response["matches"].items():
+                    if matches and isinstance(matches, list):
+                        _count_matches(popularity, [token], matches, normalize)
+
+        elif endpoint in _CONJUGATE_ENDPOINTS:
+            infinitive = request.get("infinitive")
+            if isinstance(infinitive, str) and infinitive.strip():
+                popularity.infinitives[infinitive.strip()] += 1
+
+    return popularity
+
+
+def write_table(popularity: Popularity, path: str | None = None):
+    path = path or POPULARITY_TABLE
+    table = {
+        "spellings": dict(popularity.spellings.most_common(POPULARITY_TABLE_MAX)),
+        "infinitives": dict(popularity.infinitives.most_common(POPULARITY_TABLE_MAX)),
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def load_table(path: str | None = None):
+    """The table written by write_table(), or None if missing or unreadable."""
+    try:
+        with open(path or POPULARITY_TABLE, encoding="utf-8") as f:
+            table = json.load(f)
+        return Popularity(Counter(table["spellings"]), Counter(table["infinitives"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def table_mtime(path: str | None = None):
+    try:
+        return os.stat(path or POPULARITY_TABLE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def spelling_scores(popularity: Popularity | None, infinitives_by_spelling: dict, normalize: Callable[[str], str]):
+    """
+    {spelling: score} for the suggestion ranking: the lookups of the spelling
+    (weighted by POPULARITY_SPELLING_WEIGHT) plus those of its verbs.
+    """
+    if popularity is None:
+        return {}
+
+    scores = {}
+    for spelling, infinitives in infinitives_by_spelling.items():
+        score = POPULARITY_SPELLING_WEIGHT * popularity.spellings.get(normalize(spelling), 0)
+        score += sum(popularity.infinitives.get(infinitive, 0) for infinitive in infinitives)
+        if score:
+            scores[spelling] = score
+    return scores
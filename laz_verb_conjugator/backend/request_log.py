@@ -0,0 +1,176 @@
+import atexit
+import hashlib
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+
+# Size-based rotation into numbered backups (path.1, path.2, ...), which
+# popularity.log_files() reads back.
+REQUEST_LOG_MAX_BYTES = int(os.getenv("REQUEST_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+REQUEST_LOG_BACKUP_COUNT = int(os.getenv("REQUEST_LOG_BACKUP_COUNT", "5"))
+REQUEST_LOG_QUEUE_SIZE = int(os.getenv("REQUEST_LOG_QUEUE_SIZE", "10000"))
+
+# "full" logs the whole response body, "summary" only its size and hash.
+REQUEST_LOG_MODE = os.getenv("REQUEST_LOG_MODE", "full")
+REQUEST_LOG_SAMPLE_RATE = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", "1.0"))
+
+
+def _parse_endpoint_settings(value: str):
+    """Parse "endpoint=value,endpoint=value" into a dict."""
+    settings = {}
+    for item in value.split(","):
+        endpoint, _, setting = item.partition("=")
+        if endpoint.strip() and setting.strip():
+            settings[endpoint.strip()] = setting.strip()
+    return settings
+
+
+# Per-endpoint overrides, e.g. "/api/conjugate=0.1,/api/reverse/suggestions=0.01"
+REQUEST_LOG_SAMPLE_RATES = {
+    endpoint: float(rate)
+    for endpoint, rate in _parse_endpoint_settings(os.getenv("REQUEST_LOG_SAMPLE_RATES", "")).items()
+}
+# e.g. "/api/verbs/paradigm=summary,/api/conjugate/batch=summary"
+REQUEST_LOG_MODES = _parse_endpoint_settings(os.getenv("REQUEST_LOG_MODES", ""))
+
+
+class _RequestLogFormatter(logging.Formatter):
+    """
+    Serialize the log entry carried by the record. Runs on the listener
+    thread, so request threads never pay for json.dumps of the response.
+    """
+
+    def formatMessage(self, record):
+        entry = record.entry
+        if record.mode == "summary":
+            body = json.dumps(entry["response"], ensure_ascii=False, sort_keys=True).encode("utf-8")
+            entry = {
+                "endpoint": entry["endpoint"],
+                "request": entry["request"],
+                "response_size": len(body),
+                "response_hash": hashlib.sha256(body).hexdigest()[:16],
+            }
+        record.message = json.dumps(entry, ensure_ascii=False)
+        return super().formatMessage(record)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Hand records over unformatted, and drop them when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _SharedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler for a file every worker process appends to.
+
+    Before each record it reopens the path if another worker has rotated
+    it away (as WatchedFileHandler does), and it sizes the file on disk
+    rather than what this process wrote, so whichever worker first finds it
+    past maxBytes rotates it and the others follow.
+    """
+
+    def _moved(self) -> bool:
+        try:
+            on_disk = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            return True
+        opened = os.fstat(self.stream.fileno())
+        return (on_disk.st_dev, on_disk.st_ino) != (opened.st_dev, opened.st_ino)
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        elif self._moved():
+            self.stream.close()
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+        # The size before this record: formatting it here would serialize
+        # the response twice.
+        return os.fstat(self.stream.fileno()).st_size >= self.maxBytes
+
+
+class RequestLogger:
+    """
+    Sampled request/response log written by a background QueueListener.
+
+    Only the listener thread writes, so the file is rotated there, by size.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        name: str = "request_response",
+        max_bytes: int = REQUEST_LOG_MAX_BYTES,
+        backup_count: int = REQUEST_LOG_BACKUP_COUNT,
+    ):
+        file_handler = _SharedRotatingFileHandler(
+            path,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+        # Same line format as before: Scripts/clean_log.py splits on " - ".
+        file_handler.setFormatter(_RequestLogFormatter("%(asctime)s - %(message)s"))
+
+        self._queue = queue.Queue(REQUEST_LOG_QUEUE_SIZE)
+        self.handler = _DroppingQueueHandler(self._queue)
+        self.listener = logging.handlers.QueueListener(self._queue, file_handler)
+
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+        self.listener.start()
+        self._running = True
+        atexit.register(self.stop)
+
+    def log(self, request_params, response_data, endpoint):
+        rate = REQUEST_LOG_SAMPLE_RATES.get(endpoint, REQUEST_LOG_SAMPLE_RATE)
+        if rate < 1.0 and random.random() >= rate:
+            return
+
+        self.logger.info(
+            "",
+            extra={
+                "entry": {
+                    "endpoint": endpoint,
+                    "request": request_params,
+                    "response": response_data,
+                },
+                "mode": REQUEST_LOG_MODES.get(endpoint, REQUEST_LOG_MODE),
+            },
+        )
+
+    def flush(self):
+        """Block until every queued record has been written."""
+        self._queue.join()
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        self.logger.removeHandler(self.handler)
+        self.listener.stop()
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "dropped": self.handler.dropped,
+        }
@@ -0,0 +1,921 @@
+import functools
+import logging
+import os
+import pickle
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager, redirect_stdout
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock
+    fcntl = None
+
+from sqlalchemy import text
+
+from backend import dataloader, db_query
+from backend.conjugation import present_forms
+from backend.conjugator.analyzer import MorphologicalAnalyzer
+from backend.db_query import (DIALECT_CODES, ReverseCursor, ReversePage,
+                              _dedupe_reverse_rows, _pronoun_form,
+                              page_matches, reverse_lookup_keys,
+                              spelling_normalizer)
+from backend.normalization import words
+from backend.popularity import load_table, spelling_scores, table_mtime
+from backend.suggestions import SuggestionIndex
+from backend.tense_modules import tense_modules
+
+logger = logging.getLogger(__name__)
+
+# Serve /api/reverse from memory (falls back to the database while building).
+# Every worker process holds its own copy: building it reads every verb_form
+# (about 28 s and 1 GB peak RSS per process), loading the snapshot does not.
+REVERSE_INDEX_ENABLED = os.getenv("REVERSE_INDEX_ENABLED", "true").lower() == "true"
+# Build the index in the background as soon as the app starts, when there is
+# no current snapshot to load
+REVERSE_INDEX_PREWARM = os.getenv("REVERSE_INDEX_PREWARM", "false").lower() == "true"
+# Pickle of the index, written by `flask build-reverse-index` (run after each
+# data refresh) and loaded at startup when its dataset version is still
+# current. A worker that finds it stale rebuilds it while the others wait
+# for it. "" disables it.
+REVERSE_INDEX_SNAPSHOT = os.getenv(
+    "REVERSE_INDEX_SNAPSHOT", os.path.join(os.path.dirname(__file__), "logs", "reverse_index.pickle")
+)
+# Largest edit distance of the typo-tolerant "fuzzy" tier (0 disables it).
+# Memory of its deletion index grows quickly with it, so it is capped at 2.
+REVERSE_FUZZY_MAX_DISTANCE = min(int(os.getenv("REVERSE_FUZZY_MAX_DISTANCE", "1")), 2)
+# Most spellings compared against the query by one fuzzy lookup
+REVERSE_FUZZY_MAX_CANDIDATES = int(os.getenv("REVERSE_FUZZY_MAX_CANDIDATES", "256"))
+
+# Index the tense modules' present-tense forms of verb_data.json verbs that
+# verb_form lacks (the "analyzed" tier), when the index is built
+REVERSE_ANALYZER_ENABLED = os.getenv("REVERSE_ANALYZER_ENABLED", "true").lower() == "true"
+# How often (seconds) suggestions check the popularity table for a new version
+POPULARITY_CHECK_SECONDS = float(os.getenv("POPULARITY_CHECK_SECONDS", "60"))
+# Longest run of words looked up as one compound form ("çxomi ç̌opums", "mo naç̌ven")
+REVERSE_COMPOUND_MAX_WORDS = int(os.getenv("REVERSE_COMPOUND_MAX_WORDS", "3"))
+
+_SNAPSHOT_FORMAT = 5
+
+# Same rows, in the same order, as the reverse-lookup tier queries
+_FORMS_SQL = text("""
+    SELECT
+        vf.spelling,
+        vf.verb_form_id,
+        v.verb_id,
+        v.dialect_id,
+        v.infinitive,
+        d.laz_name AS dialect,
+        v.meaning_english,
+        v.meaning_turkish,
+        vc.code AS verb_group_code,
+        vc.english_name AS verb_group_english,
+        vc.turkish_name AS verb_group_turkish,
+        vf.tense,
+        vf.mood,
+        vf.frame,
+        vf.subject,
+        vf.object,
+        vf.derivation,
+        vf.is_applicative,
+        vf.is_causative,
+        vf.is_double_causative,
+        vf.optional_prefix
+    FROM verb_form vf
+    JOIN verb v
+      ON vf.verb_id = v.verb_id
+    JOIN dialect d
+      ON v.dialect_id = d.dialect_id
+    JOIN verb_category vc
+      ON v.verb_category_id = vc.verb_category_id
+    ORDER BY d.dialect_id, v.infinitive, vf.verb_form_id
+""")
+
+_VERB_FIELDS = (
+    "dialect_id",
+    "infinitive",
+    "dialect",
+    "meaning_english",
+    "meaning_turkish",
+    "verb_group_code",
+    "verb_group_english",
+    "verb_group_turkish",
+)
+
+# Low-cardinality form fields, stored as one byte per form
+_CODED_FIELDS = (
+    "tense",
+    "mood",
+    "frame",
+    "subject_code",
+    "object_code",
+    "derivation",
+    "optional_prefix",
+)
+
+_FLAGS = ("is_applicative", "is_causative", "is_double_causative")
+
+
+class _Postings:
+    """key -> ascending form positions, as one dict of slots over one flat array."""
+
+    def __init__(self, lists):
+        self.slots = {}
+        self.starts = array("i", [0])
+        self.positions = array("i")
+        for key, positions in lists.items():
+            self.slots[key] = len(self.starts) - 1
+            self.positions.extend(positions)
+            self.starts.append(len(self.positions))
+
+    def get(self, key):
+        slot = self.slots.get(key)
+        if slot is None:
+            return ()
+        return self.positions[self.starts[slot]:self.starts[slot + 1]]
+
+    def __len__(self):
+        return len(self.slots)
+
+
+def _deletes(word: str, max_distance: int):
+    """`word` and every string obtained by deleting up to `max_distance` characters, nearest first."""
+    found = {word: 0}
+    frontier = [word]
+    for distance in range(1, max_distance + 1):
+        following = []
+        for current in frontier:
+            for i in range(len(current)):
+                deleted = current[:i] + current[i + 1:]
+                if deleted not in found:
+                    found[deleted] = distance
+                    following.append(deleted)
+        frontier = following
+    return found
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance between `a` and `b` (insertions,
+    deletions, substitutions and adjacent transpositions), or limit + 1
+    as soon as it is known to exceed `limit`.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                before is not None and i > 1 and j > 1
+                and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]
+            ):
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class _DeletionIndex:
+    """
+    SymSpell-style typo index: every key is filed under each string reachable
+    from it by up to `max_distance` deletions. Two spellings within that edit
+    distance always share such a string, so a lookup only has to compare the
+    query against the keys filed under the query's own deletes.
+    """
+
+    def __init__(self, keys, max_distance: int):
+        self.max_distance = max_distance
+        self.keys = list(keys)
+        lists = {}
+        for key_id, key in enumerate(self.keys):
+            for deleted in _deletes(key, max_distance):
+                lists.setdefault(deleted, []).append(key_id)
+        self.postings = _Postings(lists)
+
+    def search(self, query: str, max_distance: int, max_candidates: int):
+        """
+        [(distance, key)] for the keys within `max_distance` of `query`,
+        nearest first. At most `max_candidates` keys are compared, starting
+        with those sharing the least-edited deletes of the query.
+        """
+        max_distance = min(max_distance, self.max_distance)
+        compared = set()
+        found = []
+        for deleted in _deletes(query, max_distance):
+            for key_id in self.postings.get(deleted):
+                if key_id in compared:
+                    continue
+                if len(compared) >= max_candidates:
+                    return sorted(found)
+                compared.add(key_id)
+                key = self.keys[key_id]
+                distance = _edit_distance(query, key, max_distance)
+                if distance <= max_distance:
+                    found.append((distance, key))
+        return sorted(found)
+
+    def __len__(self):
+        return len(self.postings)
+
+
+class ReverseIndex:
+    """
+    Every verb_form held in column-oriented arrays, with postings from the
+    lowercase, strict-normalized and broad-normalized spelling to form
+    positions. lookup() mirrors db_query.reverse_lookup, then goes on to
+    the precomputed "analyzed" tier and can end with a typo-tolerant tier
+    over the broad-normalized spellings. suggest() answers type-ahead from
+    the same spellings.
+    """
+
+    def __init__(self, version, columns, postings, analyzed, fuzzy=None, suggestions=None):
+        """
+        `fuzzy` and `suggestions` (the SuggestionIndex and the popularity
+        table mtime it was ranked at) come from a snapshot; they are built
+        when missing, or for a deletion index of another distance.
+        """
+        self.version = version
+        self.columns = columns
+        self.exact, self.strict, self.broad = postings
+        self.analyzed = analyzed
+
+        if REVERSE_FUZZY_MAX_DISTANCE <= 0:
+            fuzzy = None
+        elif fuzzy is None or fuzzy.max_distance != REVERSE_FUZZY_MAX_DISTANCE:
+            fuzzy = _DeletionIndex(self.broad.slots, REVERSE_FUZZY_MAX_DISTANCE)
+        self.fuzzy = fuzzy
+
+        if suggestions is None:
+            self.rank_suggestions()
+        else:
+            # Re-ranked by _refresh_popularity() if the table has changed since
+            self.suggestions, self.popularity_mtime = suggestions
+
+    def __len__(self):
+        return len(self.columns["spelling"])
+
+    def rank_suggestions(self):
+        """(Re)build the suggestion index, ranked by the current popularity table."""
+        mtime = table_mtime()
+        popularity = load_table()
+        scores = {}
+        if popularity is not None:
+            verbs = self.columns["verb"]
+            infinitives = self.columns["verb_values"]["infinitive"]
+            infinitives_by_spelling = {}
+            for position, spelling in enumerate(self.columns["spelling"]):
+                infinitives_by_spelling.setdefault(spelling, set()).add(infinitives[verbs[position]])
+            scores = spelling_scores(popularity, infinitives_by_spelling, spelling_normalizer.strict)
+
+        # One assignment: readers see the old ranking or the new one.
+        self.suggestions = SuggestionIndex(self.columns["spelling"], scores)
+        self.popularity_mtime = mtime
+
+    @classmethod
+    def build(cls, version=None):
+        """Read every form from the database and index it."""
+        version = db_query.get_dataset_version() if version is None else version
+        pronouns = db_query.get_pronoun_forms()
+
+        spellings = []
+        form_ids = array("i")
+        verb_of_form = array("i")
+        coded = {field: array("B") for field in _CODED_FIELDS}
+        flags = array("B")
+        subjects = array("H")
+        objects = array("H")
+
+        verbs = {}
+        verb_values = {field: [] for field in _VERB_FIELDS}
+        values = {field: {} for field in _CODED_FIELDS}
+        displays = {}
+
+        exact_lists, strict_lists, broad_lists = {}, {}, {}
+        strict_keys = {}
+
+        def code(table, value):
+            return table.setdefault(value, len(table))
+
+        with db_query._connect() as conn:
+            result = conn.execution_options(yield_per=10000).execute(_FORMS_SQL).mappings()
+            for position, row in enumerate(result):
+                spelling = row["spelling"]
+                spellings.append(spelling)
+                form_ids.append(row["verb_form_id"])
+
+                verb_index = verbs.get(row["verb_id"])
+                if verb_index is None:
+                    verb_index = verbs[row["verb_id"]] = len(verbs)
+                    for field in _VERB_FIELDS:
+                        verb_values[field].append(row[field])
+                verb_of_form.append(verb_index)
+
+                for field in _CODED_FIELDS:
+                    source = row[field.removesuffix("_code")]
+                    coded[field].append(code(values[field], source))
+                flags.append(sum(bool(row[flag]) << bit for bit, flag in enumerate(_FLAGS)))
+
+                subject = _pronoun_form(pronouns, row["dialect_id"], row["subject"], row["frame"])
+                obj = _pronoun_form(pronouns, row["dialect_id"], row["object"], row["frame"])
+                subjects.append(code(displays, subject))
+                objects.append(code(displays, obj))
+
+                keys = strict_keys.get(spelling)
+                if keys is None:
+                    keys = strict_keys[spelling] = reverse_lookup_keys(spelling)
+                exact_lists.setdefault(keys[0], []).append(position)
+                strict_lists.setdefault(keys[1], []).append(position)
+                broad_lists.setdefault(keys[2], []).append(position)
+
+        columns = {
+            "spelling": spellings,
+            "form_id": form_ids,
+            "verb": verb_of_form,
+            "verb_values": verb_values,
+            "coded": coded,
+            "values": {field: list(table) for field, table in values.items()},
+            "flags": flags,
+            "subject": subjects,
+            "object": objects,
+            "displays": list(displays),
+        }
+        postings = (_Postings(exact_lists), _Postings(strict_lists), _Postings(broad_lists))
+        return cls(version, columns, postings, analyzed_tier(postings[2]))
+
+    def row(self, position: int) -> dict:
+        """The form at `position`, shaped like a reverse-lookup query row."""
+        columns = self.columns
+        verb = columns["verb"][position]
+        verb_values = columns["verb_values"]
+        coded = columns["coded"]
+        values = columns["values"]
+        flags = columns["flags"][position]
+
+        def value(field):
+            return values[field][coded[field][position]]
+
+        return {
+            "conjugated_form": columns["spelling"][position],
+            "infinitive": verb_values["infinitive"][verb],
+            "dialect": verb_values["dialect"][verb],
+            "meaning_english": verb_values["meaning_english"][verb],
+            "meaning_turkish": verb_values["meaning_turkish"][verb],
+            "tense": value("tense"),
+            "mood": value("mood"),
+            "frame": value("frame"),
+            "subject": columns["displays"][columns["subject"][position]],
+            "object": columns["displays"][columns["object"][position]],
+            "subject_code": value("subject_code"),
+            "object_code": value("object_code"),
+            "derivation": value("derivation"),
+            "is_applicative": bool(flags & 1),
+            "is_causative": bool(flags & 2),
+            "is_double_causative": bool(flags & 4),
+            "optional_prefix": value("optional_prefix"),
+            "verb_group_code": verb_values["verb_group_code"][verb],
+            "verb_group_english": verb_values["verb_group_english"][verb],
+            "verb_group_turkish": verb_values["verb_group_turkish"][verb],
+        }
+
+    def lookup(self, spelling: str, max_distance: int = 0):
+        """
+        Same tiers, fields and deduplication as db_query.reverse_lookup, then
+        the "analyzed" tier (see analyzed_tier()). With `max_distance`, a
+        query matching none of them falls through to the "fuzzy" tier: the
+        forms whose broad-normalized spelling is within that edit distance,
+        nearest first and then in dialect order, each carrying its
+        `edit_distance`.
+        """
+        spelling = (spelling or "").strip()
+        strict_normalized_spelling, broad_normalized_spelling = spelling_normalizer.keys(spelling)
+
+        tiers = [
+            ("exact", self.exact, spelling.lower(), strict_normalized_spelling),
+            ("normalized_strict", self.strict, strict_normalized_spelling, strict_normalized_spelling),
+            ("normalized_broad", self.broad, broad_normalized_spelling, broad_normalized_spelling),
+        ]
+
+        for match_type, postings, key, normalized_query in tiers:
+            positions = postings.get(key)
+            if not positions:
+                continue
+
+            matches = [self.row(position) for position in positions]
+            for row in matches:
+                row["match_type"] = match_type
+                row["matched_query"] = spelling
+                row["normalized_query"] = normalized_query
+
+            return matches if match_type == "exact" else _dedupe_reverse_rows(matches)
+
+        analyzed = self.lookup_analyzed(spelling, strict_normalized_spelling)
+        if analyzed:
+            return analyzed
+
+        if max_distance > 0 and self.fuzzy is not None and broad_normalized_spelling:
+            return self.lookup_fuzzy(spelling, broad_normalized_spelling, max_distance)
+
+        return []
+
+    def page_key(self, position: int):
+        """The (dialect_id, infinitive, verb_form_id) keyset position of a form."""
+        verb = self.columns["verb"][position]
+        verb_values = self.columns["verb_values"]
+        return (
+            verb_values["dialect_id"][verb],
+            verb_values["infinitive"][verb],
+            self.columns["form_id"][position],
+        )
+
+    def _start_after(self, positions, after) -> int:
+        """Index in `positions` of the first form past the keyset position `after`."""
+        form_ids = self.columns["form_id"]
+        for i, position in enumerate(positions):
+            if form_ids[position] == after[2]:
+                return i + 1
+        # The form is gone (the dataset changed): compare whole keys, in
+        # Python's order rather than the database collation's.
+        return bisect_right(positions, after, key=self.page_key)
+
+    def lookup_page(self, spelling: str, limit: int, cursor: ReverseCursor | None = None, max_distance: int = 0):
+        """
+        One page of lookup(): at most `limit` rows of the first matching tier
+        (or of the tier `cursor` is paging). Only the rows of the page are
+        built; the analyzed and fuzzy tiers are computed whole and paged by
+        offset.
+        """
+        spelling = (spelling or "").strip()
+        strict_normalized_spelling, broad_normalized_spelling = spelling_normalizer.keys(spelling)
+
+        tiers = [
+            ("exact", self.exact, spelling.lower(), strict_normalized_spelling),
+            ("normalized_strict", self.strict, strict_normalized_spelling, strict_normalized_spelling),
+            ("normalized_broad", self.broad, broad_normalized_spelling, broad_normalized_spelling),
+        ]
+
+        for match_type, postings, key, normalized_query in tiers:
+            if cursor is not None and cursor.match_type != match_type:
+                continue
+
+            positions = postings.get(key)
+            if not positions:
+                if cursor is not None:
+                    return ReversePage([], cursor.seen, None)
+                continue
+
+            start = 0
+            if cursor is not None:
+                start = self._start_after(positions, cursor.after) if cursor.after else cursor.seen
+            page_positions = positions[start:start + limit]
+
+            matches = [self.row(position) for position in page_positions]
+            for row in matches:
+                row["match_type"] = match_type
+                row["matched_query"] = spelling
+                row["normalized_query"] = normalized_query
+
+            next_cursor = None
+            if page_positions and start + len(page_positions) < len(positions):
+                seen = (cursor.seen if cursor is not None else 0) + len(page_positions)
+                next_cursor = ReverseCursor(match_type, seen, self.page_key(page_positions[-1]), len(positions))
+
+            if match_type != "exact":
+                matches = _dedupe_reverse_rows(matches)
+            return ReversePage(matches, len(positions), next_cursor)
+
+        matches = self.lookup_analyzed(spelling, strict_normalized_spelling)
+        if not matches and max_distance > 0 and self.fuzzy is not None and broad_normalized_spelling:
+            matches = self.lookup_fuzzy(spelling, broad_normalized_spelling, max_distance)
+        return page_matches(matches, limit, cursor)
+
+    def lookup_analyzed(self, spelling: str, normalized_query: str):
+        return [
+            {**row, "match_type": "analyzed", "matched_query": spelling, "normalized_query": normalized_query}
+            for row in self.analyzed.get(normalized_query, ())
+        ]
+
+    def lookup_fuzzy(self, spelling: str, normalized_query: str, max_distance: int):
+        nearby = self.fuzzy.search(normalized_query, max_distance, REVERSE_FUZZY_MAX_CANDIDATES)
+
+        # Positions follow the dialect order of the tier queries.
+        ranked = sorted(
+            (distance, position)
+            for distance, key in nearby
+            for position in self.broad.get(key)
+        )
+
+        matches = []
+        for distance, position in ranked:
+            row = self.row(position)
+            row["match_type"] = "fuzzy"
+            row["matched_query"] = spelling
+            row["normalized_query"] = normalized_query
+            row["edit_distance"] = distance
+            matches.append(row)
+
+        return _dedupe_reverse_rows(matches)
+
+    def suggest(self, query: str, limit: int = 8):
+        """Same shape as db_query.reverse_suggestions, also matching alternate spellings."""
+        return self.suggestions.suggest(query, limit)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            # A small header first, so a stale snapshot is rejected without reading the rest
+            pickle.dump((_SNAPSHOT_FORMAT, self.version), f, protocol=pickle.HIGHEST_PROTOCOL)
+            # The derived indexes too: rebuilding them would take most of a build.
+            pickle.dump(
+                (
+                    self.columns,
+                    (self.exact, self.strict, self.broad),
+                    self.analyzed,
+                    self.fuzzy,
+                    (self.suggestions, self.popularity_mtime),
+                ),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, version=None):
+        """Load a snapshot written by save(), or None if missing, unreadable or not of `version`."""
+        try:
+            with open(path, "rb") as f:
+                snapshot_format, snapshot_version = pickle.load(f)
+                if snapshot_format != _SNAPSHOT_FORMAT:
+                    return None
+                if version is not None and snapshot_version != version:
+                    return None
+                columns, postings, analyzed, fuzzy, suggestions = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return None
+        return cls(snapshot_version, columns, postings, analyzed, fuzzy, suggestions)
+
+
+_index_lock = threading.Lock()
+_index_state = {"index": None, "building": False, "built_in": None}
+
+# Region code of the tense modules' output -> dialect_id
+_DIALECT_IDS = {code: dialect_id for dialect_id, code in DIALECT_CODES.items()}
+
+
+def _analysis_row(analysis, pronouns, labels) -> dict:
+    """An Analysis shaped like a reverse-lookup row, with the database's dialect and category names."""
+    entry, form = analysis
+    dialect_id = _DIALECT_IDS[form.region]
+    dialect_names, category_names = labels
+    verb_group_english, verb_group_turkish = category_names.get(entry.category, (None, None))
+
+    return {
+        "conjugated_form": form.spelling,
+        "infinitive": entry.infinitive,
+        "dialect": dialect_names.get(dialect_id, form.region),
+        "meaning_english": entry.meaning_english,
+        "meaning_turkish": entry.meaning_turkish,
+        "tense": "present",
+        "mood": form.mood,
+        "frame": form.frame,
+        "subject": _pronoun_form(pronouns, dialect_id, form.subject, form.frame),
+        "object": _pronoun_form(pronouns, dialect_id, form.object, form.frame),
+        "subject_code": form.subject,
+        "object_code": form.object,
+        "derivation": form.derivation,
+        "is_applicative": form.is_applicative,
+        "is_causative": form.is_causative,
+        "is_double_causative": form.is_double_causative,
+        "optional_prefix": None,
+        "verb_group_code": entry.category,
+        "verb_group_english": verb_group_english,
+        "verb_group_turkish": verb_group_turkish,
+    }
+
+
+def analyzed_tier(broad) -> dict:
+    """
+    The "analyzed" tier: {strict-normalized spelling: rows} of the
+    present-tense forms the tense modules give verb_data.json verbs, for
+    the spellings whose broad-normalized key `broad` (the table's postings)
+    lacks, as lookups only get this far when it does. Computed with the
+    index, so lookups never run the tense modules.
+    """
+    if not REVERSE_ANALYZER_ENABLED:
+        return {}
+
+    analyzer = MorphologicalAnalyzer.from_verb_data(
+        dataloader._load_verb_data(),
+        paradigm=functools.partial(present_forms, tense_modules=tense_modules),
+        normalize=spelling_normalizer.strict,
+    )
+    analyses = {}
+    # The tense modules print their intermediate roots.
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for key, analysis in analyzer.analyses():
+            if not broad.get(spelling_normalizer.broad(analysis.form.spelling)):
+                analyses.setdefault(key, []).append(analysis)
+
+    pronouns = db_query.get_pronoun_forms()
+    labels = db_query.get_labels()
+    return {
+        key: _dedupe_reverse_rows([
+            _analysis_row(analysis, pronouns, labels)
+            # verb_form's order: dialect, then infinitive, then paradigm order
+            for analysis in sorted(found, key=lambda a: (_DIALECT_IDS[a.form.region], a.entry.infinitive))
+        ])
+        for key, found in analyses.items()
+    }
+
+
+def _load_snapshot(version):
+    """The snapshot of `version`, or None if snapshots are off, it is missing or it is stale."""
+    if not REVERSE_INDEX_SNAPSHOT:
+        return None
+    return ReverseIndex.load(REVERSE_INDEX_SNAPSHOT, version)
+
+
+@contextmanager
+def _snapshot_lock():
+    """Held by the one worker process (re)building the snapshot."""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(REVERSE_INDEX_SNAPSHOT) or ".", exist_ok=True)
+    with open(f"{REVERSE_INDEX_SNAPSHOT}.lock", "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _load_or_build(version):
+    index = _load_snapshot(version)
+    if index is not None:
+        return index
+    if not REVERSE_INDEX_SNAPSHOT:
+        return ReverseIndex.build(version)
+
+    with _snapshot_lock():
+        # Another worker may have written it while this one waited.
+        index = _load_snapshot(version)
+        if index is None:
+            index = ReverseIndex.build(version)
+            index.save(REVERSE_INDEX_SNAPSHOT)
+    return index
+
+
+def write_snapshot() -> ReverseIndex:
+    """Build the index of the current data into REVERSE_INDEX_SNAPSHOT (`flask build-reverse-index`)."""
+    version = db_query.get_dataset_version()
+    with _snapshot_lock():
+        index = ReverseIndex.build(version)
+        index.save(REVERSE_INDEX_SNAPSHOT)
+    return index
+
+
+def _install(index, started):
+    # Swap in one assignment: readers see the old index or the new one.
+    _index_state["index"] = index
+    _index_state["built_in"] = time.perf_counter() - started
+    logger.info("Reverse index ready: %d forms (version %s)", len(index), index.version)
+
+
+def load_reverse_index() -> bool:
+    """Install the snapshot of the current dataset version, if there is one (at startup)."""
+    started = time.perf_counter()
+    index = _load_snapshot(db_query.get_dataset_version())
+    if index is None:
+        return False
+    _install(index, started)
+    return True
+
+
+def _build_current(version):
+    try:
+        started = time.perf_counter()
+        _install(_load_or_build(version), started)
+    except Exception:
+        logger.exception("Reverse index build failed")
+    finally:
+        _index_state["building"] = False
+
+
+def ensure_reverse_index(wait: bool = False):
+    """
+    Return the index for the current dataset version, or None while it is
+    being (re)built in the background. `wait=True` builds synchronously.
+    """
+    version = db_query.get_dataset_version()
+    index = _index_state["index"]
+    if index is not None and index.version == version:
+        return index
+
+    with _index_lock:
+        if _index_state["building"] and not wait:
+            return None
+        _index_state["building"] = True
+
+    if wait:
+        _build_current(version)
+        index = _index_state["index"]
+        return index if index is not None and index.version == version else None
+
+    threading.Thread(target=_build_current, args=(version,), daemon=True).start()
+    return None
+
+
+def reverse_index_variant():
+    """
+    Where reverse lookups are answered from: "index", or "database" while
+    the index builds (no fuzzy tier). Part of their ETag and response-cache
+    key, so no fallback answer is served once the index is ready.
+    """
+    if REVERSE_INDEX_ENABLED and ensure_reverse_index() is not None:
+        return "index"
+    return "database"
+
+
+def reverse_search(spelling: str):
+    """
+    reverse_lookup from the in-memory index, including its analyzed and fuzzy
+    tiers, or from the database (neither of them) while the index builds.
+    """
+    if REVERSE_INDEX_ENABLED:
+        index = ensure_reverse_index()
+        if index is not None:
+            return index.lookup(spelling, REVERSE_FUZZY_MAX_DISTANCE)
+    return db_query.reverse_lookup(spelling)
+
+
+def reverse_search_page(spelling: str, limit: int, cursor: ReverseCursor | None = None) -> ReversePage:
+    """reverse_search, one bounded page at a time (see ReverseIndex.lookup_page)."""
+    if REVERSE_INDEX_ENABLED:
+        index = ensure_reverse_index()
+        if index is not None:
+            return index.lookup_page(spelling, limit, cursor, REVERSE_FUZZY_MAX_DISTANCE)
+    return db_query.reverse_lookup_page(spelling, limit, cursor)
+
+
+def group_matches(matches):
+    """[{"infinitive", "dialect", "count"}] of a page, in order of first appearance."""
+    groups = {}
+    for row in matches:
+        key = (row["infinitive"], row["dialect"])
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {"infinitive": row["infinitive"], "dialect": row["dialect"], "count": 0}
+        group["count"] += 1
+    return list(groups.values())
+
+
+def reverse_search_many(spellings):
+    """
+    reverse_search for many spellings at once, as {spelling: matches}: from
+    the in-memory index, or with one database query while it builds.
+    """
+    spellings = [spelling for spelling in dict.fromkeys(spellings) if spelling]
+
+    if REVERSE_INDEX_ENABLED:
+        index = ensure_reverse_index()
+        if index is not None:
+            return {spelling: index.lookup(spelling, REVERSE_FUZZY_MAX_DISTANCE) for spelling in spellings}
+
+    found = db_query.reverse_lookup_many(spellings)
+    return {spelling: found.get(spelling.strip(), []) for spelling in spellings}
+
+
+def analyze_passage(text: str):
+    """
+    Reverse-look-up every word of a passage. Runs of up to
+    REVERSE_COMPOUND_MAX_WORDS words that form one verb form (other than by
+    a typo) are kept together, longest first. Returns the tokens in text
+    order, as {"token", "start", "end", "match_type"}, and the matches of
+    each distinct token.
+    """
+    found = words(text)
+    texts = [word for word, _, _ in found]
+
+    # The longest run of words starting at each position that only
+    # whitespace separates (a compound never spans punctuation).
+    runs = [1] * len(found)
+    for position in range(len(found) - 2, -1, -1):
+        if text[found[position][2]:found[position + 1][1]].isspace():
+            runs[position] = min(runs[position + 1] + 1, REVERSE_COMPOUND_MAX_WORDS)
+
+    candidates = set(texts)
+    for position, run in enumerate(runs):
+        for size in range(2, run + 1):
+            candidates.add(" ".join(texts[position:position + size]))
+
+    resolved = reverse_search_many(sorted(candidates))
+
+    tokens = []
+    matches = {}
+    position = 0
+    while position < len(found):
+        size = 1
+        for longer in range(runs[position], 1, -1):
+            phrase_matches = resolved.get(" ".join(texts[position:position + longer]))
+            if phrase_matches and phrase_matches[0]["match_type"] != "fuzzy":
+                size = longer
+                break
+
+        token = " ".join(texts[position:position + size])
+        token_matches = matches[token] = resolved.get(token, [])
+        tokens.append({
+            "token": token,
+            "start": found[position][1],
+            "end": found[position + size - 1][2],
+            "match_type": token_matches[0]["match_type"] if token_matches else "none",
+        })
+        position += size
+
+    return tokens, matches
+
+
+_popularity_state = {"checked": 0.0, "ranking": False}
+
+
+def _rank(index):
+    try:
+        index.rank_suggestions()
+        logger.info("Suggestions re-ranked from the popularity table")
+    except Exception:
+        logger.exception("Ranking suggestions failed")
+    finally:
+        _popularity_state["ranking"] = False
+
+
+def _refresh_popularity(index):
+    """Re-rank the suggestions in the background once the popularity table changes."""
+    now = time.monotonic()
+    if now - _popularity_state["checked"] < POPULARITY_CHECK_SECONDS:
+        return
+    _popularity_state["checked"] = now
+
+    if table_mtime() == index.popularity_mtime:
+        return
+
+    with _index_lock:
+        if _popularity_state["ranking"]:
+            return
+        _popularity_state["ranking"] = True
+    threading.Thread(target=_rank, args=(index,), daemon=True).start()
+
+
+def reverse_suggestions_variant():
+    """
+    reverse_index_variant for suggestions, with the modification time of the
+    popularity table they are ranked by: a re-ranking changes their ETag and
+    response-cache key. Checking the table for changes happens here rather
+    than in the view, which cached and 304 answers never reach.
+    """
+    if REVERSE_INDEX_ENABLED:
+        index = ensure_reverse_index()
+        if index is not None:
+            _refresh_popularity(index)
+            return "index", index.popularity_mtime
+    return "database"
+
+
+def reverse_suggest(query: str, limit: int = 8):
+    """
+    Type-ahead from the in-memory index, most looked-up first, or from the
+    database (alphabetically) while it builds.
+    """
+    if REVERSE_INDEX_ENABLED:
+        index = ensure_reverse_index()
+        if index is not None:
+            return index.suggest(query, limit)
+    return db_query.reverse_suggestions(query, limit)
+
+
+def reverse_index_stats() -> dict:
+    index = _index_state["index"]
+    return {
+        "enabled": REVERSE_INDEX_ENABLED,
+        "building": _index_state["building"],
+        "forms": len(index) if index is not None else 0,
+        "keys": {
+            "exact": len(index.exact),
+            "strict": len(index.strict),
+            "broad": len(index.broad),
+            "fuzzy": len(index.fuzzy) if index.fuzzy is not None else 0,
+            "analyzed": len(index.analyzed),
+        } if index is not None else {},
+        "suggestions": index.suggestions.cache.stats() if index is not None else None,
+        "popularity_mtime": index.popularity_mtime if index is not None else None,
+        "version": repr(index.version) if index is not None else None,
+        "build_seconds": _index_state["built_in"],
+        "fuzzy_max_distance": REVERSE_FUZZY_MAX_DISTANCE,
+    }
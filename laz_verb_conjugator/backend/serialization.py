@@ -0,0 +1,83 @@
+import gzip
+import json
+import os
+import threading
+
+from flask import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# "orjson" (default when installed) or "json" for the standard library
+JSON_SERIALIZER = os.getenv("JSON_SERIALIZER", "orjson" if orjson is not None else "json")
+# Bodies smaller than this (bytes) are never compressed
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+if JSON_SERIALIZER == "orjson" and orjson is None:
+    raise RuntimeError("JSON_SERIALIZER is orjson but orjson is not installed.")
+
+
+def dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes with the configured serializer."""
+    if JSON_SERIALIZER == "orjson":
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # mtime=0 keeps the bytes stable across processes
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def available_encodings():
+    """Content codings this process can produce, best first."""
+    encodings = ["gzip", "identity"]
+    if brotli is not None:
+        encodings.insert(0, "br")
+    return encodings
+
+
+class EncodedResponse:
+    """
+    A JSON payload serialized once, with its compressed variants built on
+    first demand and kept, so that serving it again costs no encoding work.
+    """
+
+    def __init__(self, payload, status: int = 200):
+        self.payload = payload
+        self.status = status
+        self.body = dumps(payload)
+        self._variants = {"identity": self.body}
+        self._lock = threading.Lock()
+
+    def variant(self, encoding: str) -> bytes:
+        body = self._variants.get(encoding)
+        if body is None:
+            with self._lock:
+                body = self._variants.get(encoding)
+                if body is None:
+                    body = self._variants[encoding] = _compress(self.body, encoding)
+        return body
+
+    def to_response(self, accept_encodings) -> Response:
+        """Build a response in the best coding allowed by an Accept-Encoding header."""
+        encoding = "identity"
+        if len(self.body) >= COMPRESS_MIN_SIZE:
+            encoding = accept_encodings.best_match(available_encodings(), default="identity")
+
+        response = Response(self.variant(encoding), status=self.status, mimetype="application/json")
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        return response
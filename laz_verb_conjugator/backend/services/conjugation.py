@@ -1,6 +1,11 @@
+from backend.tense_modules import membership_for
+from backend.utils import collect_paradigm
+
+
 class ConjugationService:
-    def __init__(self, tense_modules, simplified_tense_mapping, simplified_aspect_mapping):
+    def __init__(self, tense_modules, simplified_tense_mapping, simplified_aspect_mapping, membership=None):
         self.tense_modules = tense_modules
+        self.membership = membership if membership is not None else membership_for(tense_modules)
         self.simplified_tense_mapping = simplified_tense_mapping
         self.simplified_aspect_mapping = simplified_aspect_mapping
         self.ordered_subjects = ['S1_Singular', 'S2_Singular', 'S3_Singular', 'S1_Plural', 'S2_Plural', 'S3_Plural']
@@ -11,15 +16,10 @@ class ConjugationService:
         conjugations = None
         
         # Check if it's a TVM verb
-        is_tvm_verb = False
-        for module_key, module in self.tense_modules.items():
-            if module_key == 'tvm_tense':
-                if hasattr(module, 'verbs') and params['infinitive'] in module.verbs:
-                    is_tvm_verb = True
-                    # If it's a TVM verb and there's an object, raise error
-                    if params['obj']:
-                        raise ValueError("This verb belongs to a verb group that cannot take an object / Bu fiil grubu nesne alamaz.")
-                    break
+        is_tvm_verb = 'tvm_tense' in self.membership.get(params['infinitive']).modules
+        # If it's a TVM verb and there's an object, raise error
+        if is_tvm_verb and params['obj']:
+            raise ValueError("This verb belongs to a verb group that cannot take an object / Bu fiil grubu nesne alamaz.")
 
         if params['neg_imperative']:
             if is_tvm_verb:
@@ -138,17 +138,34 @@ class ConjugationService:
         else:
             raise ValueError("Invalid module")
 
+    def _collect_paradigm(self, module, infinitive, subjects, objects, tense=None,
+                          applicative=False, causative=False, simple_causative=False, mood=None):
+        """{region: forms} for every subject and object, in one pass when the module can conjugate whole paradigms."""
+        if hasattr(module, 'conjugate_paradigm'):
+            return module.conjugate_paradigm(
+                infinitive, subjects, objects, tense=tense,
+                applicative=applicative, causative=causative, simple_causative=simple_causative, mood=mood
+            )
+        return collect_paradigm(
+            lambda subj, obj_item: self._call_conjugation_method(
+                module, infinitive, [subj], obj_item, tense,
+                applicative, causative, simple_causative, mood
+            ),
+            subjects, objects
+        )
+
     def process_imperative(self, infinitive, subject, obj, applicative, causative, simple_causative, region_filter):
         module = None
         mood = None
+        modules = self.membership.get(infinitive).modules
 
         # IVD imperative comes from PRESENT OPTATIVE
-        if 'ivd_present' in self.tense_modules and infinitive in self.tense_modules['ivd_present'].verbs:
+        if 'ivd_present' in modules:
             module = self.tense_modules['ivd_present']
             mood = 'optative'
 
         # TVE imperative (your existing behavior)
-        elif 'tve_past' in self.tense_modules and infinitive in self.tense_modules['tve_past'].verbs:
+        elif 'tve_past' in modules:
             module = self.tense_modules['tve_past']
             mood = None
 
@@ -159,16 +176,14 @@ class ConjugationService:
         objects = self.ordered_objects if obj == 'all' else [obj] if obj else [None]
         all_conjugations = {}
 
-        for subj in subjects:
-            for obj_item in objects:
-                result = self._call_conjugation_method(
-                    module, infinitive, [subj], obj_item,
-                    applicative=applicative, causative=causative, simple_causative=simple_causative, mood=mood
-                )
-                for region, forms in result.items():
-                    if region_filter and region not in region_filter.split(','):
-                        continue
-                    all_conjugations.setdefault(region, set()).update(forms)
+        result = self._collect_paradigm(
+            module, infinitive, subjects, objects,
+            applicative=applicative, causative=causative, simple_causative=simple_causative, mood=mood
+        )
+        for region, forms in result.items():
+            if region_filter and region not in region_filter.split(','):
+                continue
+            all_conjugations.setdefault(region, set()).update(forms)
 
         imperatives = module.extract_imperatives(all_conjugations, subjects)
         return self.format_conjugations(imperatives, module)
@@ -177,9 +192,10 @@ class ConjugationService:
     def process_negative_imperative(self, infinitive, subject, obj, applicative, causative, simple_causative, region_filter):
         """Process imperative conjugations."""
         module = None
-        if 'tve_present' in self.tense_modules and infinitive in self.tense_modules['tve_present'].verbs:
+        modules = self.membership.get(infinitive).modules
+        if 'tve_present' in modules:
             module = self.tense_modules['tve_present']
-        elif 'ivd_present' in self.tense_modules and infinitive in self.tense_modules['ivd_present'].verbs:
+        elif 'ivd_present' in modules:
             module = self.tense_modules['ivd_present']
 
         if not module:
@@ -190,19 +206,17 @@ class ConjugationService:
         objects = self.ordered_objects if obj == 'all' else [obj] if obj else [None]
         all_conjugations = {}
 
-        for subj in subjects:
-            for obj_item in objects:
-                result = self._call_conjugation_method(
-                    module, infinitive, [subj], obj_item,
-                    applicative=applicative, causative=causative, simple_causative=simple_causative
-                )
-                
-                for region, forms in result.items():
-                    if region_filter and region not in region_filter.split(','):
-                        continue
-                    if region not in all_conjugations:
-                        all_conjugations[region] = set()
-                    all_conjugations[region].update(forms)
+        result = self._collect_paradigm(
+            module, infinitive, subjects, objects,
+            applicative=applicative, causative=causative, simple_causative=simple_causative
+        )
+
+        for region, forms in result.items():
+            if region_filter and region not in region_filter.split(','):
+                continue
+            if region not in all_conjugations:
+                all_conjugations[region] = set()
+            all_conjugations[region].update(forms)
 
         neg_imperatives = module.extract_neg_imperatives(all_conjugations, subjects)
         return self.format_conjugations(neg_imperatives, module)
@@ -211,34 +225,32 @@ class ConjugationService:
     def process_tvm_imperative(self, infinitive, subject, obj, applicative, causative, simple_causative, 
                              region_filter, tense, is_negative):
         """Process TVM imperative conjugations using tvm_tense module."""
-        module = self.tense_modules.get('tvm_tense')
-        if not module or not hasattr(module, 'verbs') or infinitive not in module.verbs:
+        if 'tvm_tense' not in self.membership.get(infinitive).modules:
             return None
+        module = self.tense_modules['tvm_tense']
 
         subjects = ['S2_Singular', 'S2_Plural'] if subject == 'all' else [subject]
         objects = self.ordered_objects if obj == 'all' else [obj] if obj else [None]
         all_conjugations = {}
 
-        for subj in subjects:
-            for obj_item in objects:
-                result = self._call_conjugation_method(
-                    module, infinitive, [subj], obj_item, tense,
-                    applicative, causative, simple_causative,
-                )
-                
-                for region, forms in result.items():
-                    if region_filter and region not in region_filter.split(','):
-                        continue
-                    if region not in all_conjugations:
-                        all_conjugations[region] = set()
-                    for form in forms:
-                        # Add 'mot' prefix for negative imperatives
-                        if is_negative:
-                            neg_prefix = "mo" if region in ("HO", "AŞ") else "mot"
-                            modified_form = (form[0], form[1], f"{neg_prefix} {form[2]}")
-                            all_conjugations[region].add(modified_form)
-                        else:
-                            all_conjugations[region].add(form)
+        result = self._collect_paradigm(
+            module, infinitive, subjects, objects, tense,
+            applicative, causative, simple_causative,
+        )
+
+        for region, forms in result.items():
+            if region_filter and region not in region_filter.split(','):
+                continue
+            if region not in all_conjugations:
+                all_conjugations[region] = set()
+            for form in forms:
+                # Add 'mot' prefix for negative imperatives
+                if is_negative:
+                    neg_prefix = "mo" if region in ("HO", "AŞ") else "mot"
+                    modified_form = (form[0], form[1], f"{neg_prefix} {form[2]}")
+                    all_conjugations[region].add(modified_form)
+                else:
+                    all_conjugations[region].add(form)
 
         return self.format_conjugations(all_conjugations, module)
 
@@ -249,31 +261,30 @@ class ConjugationService:
         module_found = False
         used_module = None
 
+        modules = self.membership.get(infinitive).modules
         for actual_aspect in self.simplified_aspect_mapping[aspect]:
-            module = self.tense_modules.get(actual_aspect)
-            if not module or not hasattr(module, 'verbs') or infinitive not in module.verbs:
+            if actual_aspect not in modules:
                 continue
+            module = self.tense_modules[actual_aspect]
 
             mood = 'optative' if optative and 'tve' in actual_aspect else None
             subjects = ['S1_Singular', 'S2_Singular', 'S3_Singular', 'S1_Plural', 'S2_Plural', 'S3_Plural'] if subject == 'all' else [subject]
             objects = self.ordered_objects if obj == 'all' else [obj] if obj else [None]
 
             try:
-                for subj in subjects:
-                    for obj_item in objects:
-                        result = self._call_conjugation_method(
-                            module, infinitive, [subj], obj_item, tense,
-                            applicative, causative, simple_causative, mood
-                        )
-
-                        for region, forms in result.items():
-                            if region_filter and region not in region_filter.split(','):
-                                continue
-                            if region not in conjugations:
-                                conjugations[region] = set()
-                            conjugations[region].update(forms)
-                            used_module = module
-                            module_found = True
+                result = self._collect_paradigm(
+                    module, infinitive, subjects, objects, tense,
+                    applicative, causative, simple_causative, mood
+                )
+
+                for region, forms in result.items():
+                    if region_filter and region not in region_filter.split(','):
+                        continue
+                    if region not in conjugations:
+                        conjugations[region] = set()
+                    conjugations[region].update(forms)
+                    used_module = module
+                    module_found = True
 
             except ValueError as e:
                 raise ValueError(str(e))
@@ -289,6 +300,7 @@ class ConjugationService:
         conjugations = {}
         module_found = False
         used_module = None
+        modules = self.membership.get(infinitive).modules
 
         for mapping in self.simplified_tense_mapping[tense]:
             actual_tense, embedded_tense = mapping if isinstance(mapping, tuple) else (mapping, tense)
@@ -299,30 +311,28 @@ class ConjugationService:
             if actual_tense.startswith('tvm') and obj in self.ordered_objects:
                 continue
 
-            module = self.tense_modules.get(actual_tense)
-            if not module or not hasattr(module, 'verbs') or infinitive not in module.verbs:
+            if actual_tense not in modules:
                 continue
+            module = self.tense_modules[actual_tense]
 
             try:
                 subjects = ['S1_Singular', 'S2_Singular', 'S3_Singular', 'S1_Plural', 'S2_Plural', 'S3_Plural'] if subject == 'all' else [subject]
                 objects = self.ordered_objects if obj == 'all' else [obj] if obj else [None]
 
-                for subj in subjects:
-                    for obj_item in objects:
-                        result = self._call_conjugation_method(
-                            module, infinitive, [subj], obj_item,
-                            embedded_tense, applicative, causative, simple_causative,
-                            'optative' if optative else None
-                        )
-
-                        for region, forms in result.items():
-                            if region_filter and region not in region_filter.split(','):
-                                continue
-                            if region not in conjugations:
-                                conjugations[region] = set()
-                            conjugations[region].update(forms)
-                            used_module = module
-                            module_found = True
+                result = self._collect_paradigm(
+                    module, infinitive, subjects, objects,
+                    embedded_tense, applicative, causative, simple_causative,
+                    'optative' if optative else None
+                )
+
+                for region, forms in result.items():
+                    if region_filter and region not in region_filter.split(','):
+                        continue
+                    if region not in conjugations:
+                        conjugations[region] = set()
+                    conjugations[region].update(forms)
+                    used_module = module
+                    module_found = True
 
             except ValueError as e:
                 raise ValueError(str(e))
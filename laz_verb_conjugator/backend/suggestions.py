@@ -0,0 +1,105 @@
+import heapq
+import os
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+from backend.cache import LRUCache
+from backend.db_query import _normalize_reverse_input_strict
+
+# Suggestions precomputed for every prefix up to this many characters, where
+# the matching ranges are largest; longer prefixes scan their (short) range.
+REVERSE_SUGGEST_PRECOMPUTED_LENGTH = int(os.getenv("REVERSE_SUGGEST_PRECOMPUTED_LENGTH", "3"))
+# Suggestions kept per precomputed prefix (the endpoint asks for 8)
+REVERSE_SUGGEST_TOP_K = int(os.getenv("REVERSE_SUGGEST_TOP_K", "8"))
+# Answers kept per index, keyed by (query, limit)
+REVERSE_SUGGEST_CACHE_SIZE = int(os.getenv("REVERSE_SUGGEST_CACHE_SIZE", "4096"))
+
+# Sorts after every character a spelling can contain
+_PREFIX_END = "\U0010ffff"
+
+
+class _SortedKeys:
+    """Keys sorted for prefix range search, each with the rank of its spelling."""
+
+    def __init__(self, keyed_ranks, precomputed_length: int, top_k: int):
+        keyed_ranks = sorted(keyed_ranks)
+        self.keys = [key for key, _ in keyed_ranks]
+        self.ranks = array("i", (rank for _, rank in keyed_ranks))
+        self.top_k = top_k
+
+        self.top = {}
+        for key in dict.fromkeys(self.keys):
+            for length in range(1, min(len(key), precomputed_length) + 1):
+                prefix = key[:length]
+                if prefix not in self.top:
+                    self.top[prefix] = self._scan(prefix, top_k)
+
+    def _scan(self, prefix: str, limit: int):
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + _PREFIX_END, lo)
+        return tuple(heapq.nsmallest(limit, set(self.ranks[lo:hi])))
+
+    def best(self, prefix: str, limit: int):
+        """The `limit` best ranks among the keys starting with `prefix`."""
+        if limit <= self.top_k:
+            top = self.top.get(prefix)
+            if top is not None:
+                return top[:limit]
+        return self._scan(prefix, limit)
+
+
+class SuggestionIndex:
+    """
+    Type-ahead over distinct spellings. A query matches a spelling whose
+    lowercase form, or whose strict-normalized form (k'/ǩ, ts/ʒ, dz/ž, ...),
+    starts with the query's own; answers come back in rank order, which is
+    by `popularity` (highest first) and then alphabetical.
+    """
+
+    def __init__(self, spellings, popularity=None):
+        popularity = popularity or {}
+        self.spellings = sorted(set(spellings), key=lambda spelling: (-popularity.get(spelling, 0), spelling))
+
+        self.lower = _SortedKeys(
+            ((spelling.lower(), rank) for rank, spelling in enumerate(self.spellings)),
+            REVERSE_SUGGEST_PRECOMPUTED_LENGTH,
+            REVERSE_SUGGEST_TOP_K,
+        )
+        self.strict = _SortedKeys(
+            ((_normalize_reverse_input_strict(spelling), rank) for rank, spelling in enumerate(self.spellings)),
+            REVERSE_SUGGEST_PRECOMPUTED_LENGTH,
+            REVERSE_SUGGEST_TOP_K,
+        )
+        self.cache = LRUCache(REVERSE_SUGGEST_CACHE_SIZE)
+
+    def __len__(self):
+        return len(self.spellings)
+
+    def __getstate__(self):
+        # Pickled into the reverse index snapshot, without the answer cache
+        state = dict(self.__dict__)
+        del state["cache"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.cache = LRUCache(REVERSE_SUGGEST_CACHE_SIZE)
+
+    def suggest(self, query: str, limit: int = 8):
+        """[{"spelling": ...}] like db_query.reverse_suggestions, best first."""
+        key = (query, limit)
+        suggestions = self.cache.get(key)
+        if suggestions is not None:
+            return [{"spelling": spelling} for spelling in suggestions]
+
+        lower_query = unicodedata.normalize("NFC", (query or "").strip().lower())
+        strict_query = _normalize_reverse_input_strict(query)
+
+        ranks = set(self.lower.best(lower_query, limit))
+        if strict_query:
+            ranks.update(self.strict.best(strict_query, limit))
+
+        suggestions = tuple(self.spellings[rank] for rank in sorted(ranks)[:limit])
+        self.cache.set(key, suggestions)
+        return [{"spelling": spelling} for spelling in suggestions]
@@ -0,0 +1,256 @@
+import importlib
+import importlib.util
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from enum import IntFlag, auto
+from typing import NamedTuple
+
+from backend import dataloader
+
+logger = logging.getLogger(__name__)
+
+TENSE_MODULE_PACKAGE = "backend.notebooks"
+TENSE_MODULE_NAMES = (
+    "ivd_present",
+    "ivd_past",
+    "ivd_pastpro",
+    "ivd_future",
+    "tve_present",
+    "tve_past",
+    "tve_pastpro",
+    "tve_future",
+    "tvm_tense",
+    "tvm_tve_presentperf",
+    "tvm_tve_potential",
+    "tvm_tve_passive",
+)
+
+# Tense modules imported at boot, comma-separated ("all" for every one);
+# the others are imported on first use
+TENSE_MODULES_PREWARM = os.getenv("TENSE_MODULES_PREWARM", "")
+
+
+def prewarm_names(setting: str = None):
+    """The module names listed in a TENSE_MODULES_PREWARM value."""
+    setting = TENSE_MODULES_PREWARM if setting is None else setting
+    names = [name.strip() for name in setting.split(",") if name.strip()]
+    if "all" in names:
+        return list(TENSE_MODULE_NAMES)
+    unknown = [name for name in names if name not in TENSE_MODULE_NAMES]
+    if unknown:
+        raise ValueError(f"Unknown tense modules in TENSE_MODULES_PREWARM: {', '.join(unknown)}")
+    return names
+
+
+class VerbCategory(IntFlag):
+    IVD = auto()
+    TVE = auto()
+    TVM = auto()
+    TVM_TVE = auto()
+
+
+# The verb_data.json categories each module's verb list is drawn from
+_LEXICON_CATEGORIES = {
+    VerbCategory.IVD: ("IVD",),
+    VerbCategory.TVE: ("TVE",),
+    VerbCategory.TVM: ("TVM",),
+    VerbCategory.TVM_TVE: ("TVE", "TVM"),
+}
+
+
+def module_category(name: str) -> VerbCategory:
+    """The verb group a tense module conjugates, from its name."""
+    for prefix, category in (
+        ("tvm_tve_", VerbCategory.TVM_TVE),
+        ("ivd_", VerbCategory.IVD),
+        ("tve_", VerbCategory.TVE),
+        ("tvm", VerbCategory.TVM),
+    ):
+        if name.startswith(prefix):
+            return category
+    return VerbCategory(0)
+
+
+def normalize_infinitive(infinitive: str) -> str:
+    return (infinitive or "").lower().strip()
+
+
+class Membership(NamedTuple):
+    categories: VerbCategory
+    modules: frozenset  # names of the tense modules that list the verb
+
+
+_NOT_FOUND = Membership(VerbCategory(0), frozenset())
+
+
+class VerbMembership:
+    """
+    Normalized infinitive -> the verb groups it belongs to and the tense
+    modules that can conjugate it, built once so that every existence
+    check is one dict lookup instead of a scan of the modules' verb lists.
+    """
+
+    def __init__(self, verbs_by_module):
+        modules = {}
+        for name, verbs in verbs_by_module.items():
+            for infinitive in verbs:
+                modules.setdefault(normalize_infinitive(infinitive), set()).add(name)
+
+        self.entries = {}
+        for infinitive, names in modules.items():
+            categories = VerbCategory(0)
+            for name in names:
+                categories |= module_category(name)
+            self.entries[infinitive] = Membership(categories, frozenset(names))
+
+    @classmethod
+    def from_modules(cls, tense_modules):
+        """From the `verbs` of already imported modules (any name -> module mapping)."""
+        return cls({
+            name: module.verbs for name, module in tense_modules.items() if hasattr(module, "verbs")
+        })
+
+    @classmethod
+    def from_lexicon(cls, names, lexicon=None):
+        """From the lexicon views the modules load their verbs from, without importing them."""
+        lexicon = lexicon or dataloader.get_lexicon()
+        return cls({
+            name: lexicon.view(*_LEXICON_CATEGORIES[module_category(name)]).verbs
+            for name in names
+            if module_category(name)
+        })
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, infinitive: str) -> Membership:
+        return self.entries.get(normalize_infinitive(infinitive), _NOT_FOUND)
+
+
+def membership_for(tense_modules) -> VerbMembership:
+    """The membership of a registry, or one built from a plain dict of modules."""
+    membership = getattr(tense_modules, "membership", None)
+    return membership if membership is not None else VerbMembership.from_modules(tense_modules)
+
+
+class TenseModuleRegistry(Mapping):
+    """
+    The legacy tense modules (backend.notebooks) by name, imported on first
+    access. Each one loads its verb lists and preverb rules when its body
+    runs, so a worker only pays for the tenses it serves.
+
+    `in` and iteration only look at the names; indexing, get() and
+    items() import. Every import is timed in two parts: "import_seconds"
+    (finding the module and loading its code) and "init_seconds" (running
+    the module body, with the first import of whatever it depends on).
+    """
+
+    def __init__(self, names=TENSE_MODULE_NAMES, package: str = TENSE_MODULE_PACKAGE):
+        self.names = tuple(names)
+        self.package = package
+        self._modules = {}
+        self._timings = {}
+        self._errors = {}
+        self._membership = None
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name):
+        module = self._modules.get(name)
+        if module is not None:
+            return module
+        if name not in self.names:
+            raise KeyError(name)
+        with self._lock:
+            module = self._modules.get(name)
+            if module is None:
+                module = self._modules[name] = self._import(name)
+        return module
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def membership(self) -> VerbMembership:
+        """Which modules list each verb, read from the lexicon so no module is imported."""
+        if self._membership is None:
+            with self._lock:
+                if self._membership is None:
+                    self._membership = VerbMembership.from_lexicon(self.names)
+        return self._membership
+
+    def loaded(self):
+        return [name for name in self.names if name in self._modules]
+
+    def _import(self, name):
+        qualified = f"{self.package}.{name}"
+        module = sys.modules.get(qualified)
+        if module is not None:
+            self._timings[name] = {"import_seconds": 0.0, "init_seconds": 0.0, "already_imported": True}
+            return module
+
+        started = time.perf_counter()
+        try:
+            # importlib.import_module() in two steps (the loader's
+            # exec_module() is get_code() then exec()), to time them apart
+            spec = importlib.util.find_spec(qualified)
+            module = importlib.util.module_from_spec(spec)
+            code = spec.loader.get_code(qualified)
+            loaded = time.perf_counter()
+
+            sys.modules[qualified] = module
+            try:
+                exec(code, module.__dict__)
+            except BaseException:
+                sys.modules.pop(qualified, None)
+                raise
+        except Exception as e:
+            self._errors[name] = f"{type(e).__name__}: {e}"
+            logger.warning("Could not import tense module %s: %s", name, e)
+            raise
+        finished = time.perf_counter()
+
+        setattr(importlib.import_module(self.package), name, module)
+        self._errors.pop(name, None)
+        self._timings[name] = {
+            "import_seconds": round(loaded - started, 6),
+            "init_seconds": round(finished - loaded, 6),
+        }
+        return module
+
+    def prewarm(self, names=None):
+        """Import `names` (default: TENSE_MODULES_PREWARM) now; a module that fails is reported, not raised."""
+        for name in prewarm_names() if names is None else names:
+            try:
+                self[name]
+            except Exception:
+                pass
+
+    def report(self) -> dict:
+        """Which modules are imported and what each cost, for /api/stats and the boot log."""
+        modules = {}
+        for name in self.names:
+            entry = {"loaded": name in self._modules, **self._timings.get(name, {})}
+            if name in self._errors:
+                entry["error"] = self._errors[name]
+            modules[name] = entry
+        timings = [timing for name, timing in self._timings.items() if name in self._modules]
+        return {
+            "loaded": len(timings),
+            "total": len(self.names),
+            "import_seconds": round(sum(timing["import_seconds"] for timing in timings), 6),
+            "init_seconds": round(sum(timing["init_seconds"] for timing in timings), 6),
+            "modules": modules,
+        }
+
+
+tense_modules = TenseModuleRegistry()
@@ -0,0 +1,13 @@
+import os
+import shutil
+import tempfile
+
+# Keep the snapshots of index builds started by tests out of backend/logs.
+# Set before anything imports backend.reverse_index: app.py loads the
+# snapshot as it is imported, while test modules are collected.
+_snapshot_dir = tempfile.mkdtemp(prefix="reverse_index_")
+os.environ["REVERSE_INDEX_SNAPSHOT"] = os.path.join(_snapshot_dir, "reverse_index.pickle")
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_snapshot_dir, ignore_errors=True)
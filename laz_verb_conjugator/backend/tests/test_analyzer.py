@@ -0,0 +1,152 @@
+import functools
+
+import pytest
+from sqlalchemy import text
+
+from backend import db_query
+from backend.conjugation import PresentForm, present_forms
+from backend.conjugator.analyzer import (CATEGORY_VERB_TYPES, LexiconEntry,
+                                         MorphologicalAnalyzer)
+from backend.conjugator.common import Region
+from backend.dataloader import _load_verb_data
+from backend.db_query import DIALECT_CODES, spelling_normalizer
+from backend.tense_modules import tense_modules
+
+
+def _entry(infinitive, present_third, category, regions=tuple(Region)):
+    verb = CATEGORY_VERB_TYPES[category](infinitive=infinitive, present_third=present_third)
+    return LexiconEntry(infinitive, present_third, category, regions, None, None, verb)
+
+
+def _form(spelling, region="AŞ", subject="S1SG", object=None, frame="Ergative", mood="indicative"):
+    return PresentForm(spelling, region, frame, subject, object, mood, "none", False, False, False)
+
+
+# Hand-written paradigms, so that these tests do not depend on the tense modules
+PARADIGMS = {
+    "osinapu": [_form("visinapam"), _form("isinapaman", subject="S3PL"), _form("mo visinapam", mood="negative_imperative")],
+    "doguru": [_form("doviguramt", subject="S1PL")],
+    "ot̆axu": [_form("p̌t̆axum", region="FA")],
+    "çxomi oç̌opu": [_form("çxomi p̌ç̌opumt", region="FA", subject="S1PL")],
+    "oskidu": [_form("pskidur", frame="Nominative")],
+    # Nothing in the affix tables describes this stem
+    "oçu": [_form("vuçapam")],
+}
+
+
+@pytest.fixture
+def checked():
+    return []
+
+
+@pytest.fixture
+def analyzer(checked):
+    def paradigm(infinitive):
+        checked.append(infinitive)
+        return PARADIGMS.get(infinitive, [])
+
+    return MorphologicalAnalyzer([
+        _entry("osinapu", "isinapams", "TVE"),
+        _entry("doguru", "digurams", "TVE"),
+        _entry("ot̆axu", "t̆axums", "TVE"),
+        _entry("çxomi oç̌opu", "çxomi ç̌opums", "TVE"),
+        _entry("oskidu", "skidun", "TVM"),
+        _entry("oropu", "aoropen", "IVD"),
+        _entry("oçu", "oçums", "TVE"),
+    ], paradigm)
+
+
+@pytest.fixture(scope="module")
+def lexicon_analyzer():
+    return MorphologicalAnalyzer.from_verb_data(
+        _load_verb_data(),
+        functools.partial(present_forms, tense_modules=tense_modules),
+        spelling_normalizer.strict,
+    )
+
+
+@pytest.mark.parametrize("infinitive", PARADIGMS)
+def test_analyzes_the_forms_of_the_paradigm(analyzer, infinitive):
+    for form in PARADIGMS[infinitive]:
+        assert (infinitive, form) in {(a.entry.infinitive, a.form) for a in analyzer.analyze(form.spelling)}
+
+
+def test_affix_split_is_checked_first(analyzer, checked):
+    assert next(analyzer.candidates("visinapam")) == ["osinapu"]
+    assert [a.entry.infinitive for a in analyzer.analyze("  VISINAPAM ")] == ["osinapu"]
+    assert checked == ["osinapu"]
+
+
+def test_shared_bigrams_find_stems_the_tables_miss(analyzer):
+    assert [a.entry.infinitive for a in analyzer.analyze("vuçapam")] == ["oçu"]
+
+
+@pytest.mark.parametrize("form", ["", "xyz", "isinapamxyz", "mo"])
+def test_unknown_forms_have_no_analysis(analyzer, form):
+    assert analyzer.analyze(form) == []
+
+
+def test_checks_a_bounded_number_of_paradigms(analyzer, checked):
+    analyzer.max_candidates = 2
+
+    assert analyzer.analyze("isinapamxyz") == []
+    assert len(checked) <= 2
+
+
+def test_paradigms_are_computed_once(analyzer, checked):
+    analyzer.analyze("visinapam")
+    analyzer.analyze("isinapaman")
+
+    assert checked == ["osinapu"]
+
+
+def _present_rows(where, params, limit):
+    with db_query.engine.connect() as conn:
+        return conn.execute(text(f"""
+            SELECT vf.spelling, v.infinitive, v.dialect_id, vf.frame, vf.subject, vf.object,
+                   vf.mood, vf.derivation, vf.is_applicative, vf.is_causative, vf.is_double_causative
+            FROM verb_form vf
+            JOIN verb v ON v.verb_id = vf.verb_id
+            WHERE vf.tense = 'present'
+              AND vf.spelling NOT LIKE 'N/A%'
+              AND {where}
+            ORDER BY md5(vf.verb_form_id::text)
+            LIMIT :limit
+        """), {**params, "limit": limit}).mappings().all()
+
+
+def _as_present_form(row):
+    return PresentForm(
+        row["spelling"], DIALECT_CODES[row["dialect_id"]], row["frame"], row["subject"], row["object"],
+        row["mood"], row["derivation"], row["is_applicative"], row["is_causative"], row["is_double_causative"],
+    )
+
+
+@pytest.mark.parametrize("infinitive", ["obadu", "oçilu", "meǩoru", "dobalu", "oxelu"])
+def test_present_forms_are_the_seeded_rows(infinitive):
+    seeded = _present_rows("v.infinitive = :infinitive", {"infinitive": infinitive}, 100000)
+
+    assert seeded
+    assert set(present_forms(infinitive, tense_modules)) == {_as_present_form(row) for row in seeded}
+
+
+@pytest.mark.parametrize(
+    "spelling,infinitive",
+    [("ibaden", "obadu"), ("dombam", "dobalu"), ("vixeler", "oxelu"), ("viçilert", "oçilu")],
+)
+def test_analyzes_seeded_forms(lexicon_analyzer, spelling, infinitive):
+    assert infinitive in {a.entry.infinitive for a in lexicon_analyzer.analyze(spelling)}
+
+
+def test_recall_on_seeded_forms(lexicon_analyzer):
+    rows = _present_rows("TRUE", {}, 200)
+
+    found = [
+        any(
+            a.entry.infinitive == row["infinitive"] and a.form == _as_present_form(row)
+            for a in lexicon_analyzer.analyze(row["spelling"])
+        )
+        for row in rows
+    ]
+
+    assert sum(found) / len(rows) >= 0.9
@@ -0,0 +1,60 @@
+import pytest
+
+from backend.conjugation import ConjugationPlanner, conjugate_verb, planner_for
+from backend.tense_modules import TENSE_MODULE_NAMES, TenseModuleRegistry
+
+# tvm_tve_passive needs pandas
+NAMES = [name for name in TENSE_MODULE_NAMES if name != "tvm_tve_passive"]
+
+
+@pytest.fixture(scope="module")
+def tense_modules():
+    return TenseModuleRegistry(NAMES)
+
+
+def test_plans_are_memoized_per_routing_key(tense_modules):
+    planner = ConjugationPlanner(tense_modules)
+
+    plan = planner.plan(infinitive=" Oxenu ", tense="present")
+
+    assert planner.plan(infinitive="oxenu", tense="present") is plan
+    assert planner.plan(infinitive="oxenu", tense="past") is not plan
+    assert plan.exists == (False, True, False, True)
+    assert plan.ivd_route is None and plan.tvm_route is None
+    assert plan.tve_mapping["present"] == ["tve_present"]
+
+
+def test_routes_are_shared_between_plans(tense_modules):
+    planner = ConjugationPlanner(tense_modules)
+
+    oxenu = planner.plan(infinitive="oxenu", tense="present")
+    oçkinu = planner.plan(infinitive="oçkinu", tense="present")
+
+    assert oxenu.tve_route is planner.plan(infinitive="oxenu", tense="future").tve_route
+    assert oxenu.tve_route is not oçkinu.ivd_route
+    assert planner.plan(infinitive="oxenu", tense="presentperf").presentperf_route is \
+        planner.plan(infinitive="oçkinu", tense="presentperf").presentperf_route
+
+
+def test_static_errors_are_planned(tense_modules):
+    planner = ConjugationPlanner(tense_modules)
+
+    assert planner.plan(infinitive="oxenu", causative=True, simple_causative=True).error[1] == "conflicting_causatives"
+    assert planner.plan(infinitive="guri mentxu", tense="present").error[1] == "guri_mentxu_requires_potential"
+    assert planner.plan(infinitive="gexvamu", tense="present").error[1] == "marker_required"
+    assert planner.plan(infinitive="oxenu", tense="present", applicative=True).obj_error
+
+
+def test_conjugate_verb_reuses_the_planner(tense_modules):
+    planner = planner_for(tense_modules)
+
+    first = conjugate_verb(tense_modules=tense_modules, infinitive="oxenu", tense="present", subject="S1_Singular")
+    second = conjugate_verb(tense_modules=tense_modules, infinitive="oxenu", tense="present", subject="S3_Singular")
+
+    assert planner_for(tense_modules) is planner
+    assert planner.cache.stats()["hits"] >= 1
+    assert first["meta"]["selected"]["path"] == second["meta"]["selected"]["path"] == "tense"
+    assert first["result"] != second["result"]
+
+    missing = conjugate_verb(tense_modules=tense_modules, infinitive="oxenu", tense="present", applicative=True)
+    assert missing["meta"]["selected"] == {"reason": "marker_requires_obj"}
@@ -0,0 +1,79 @@
+import json
+import os
+
+import pytest
+
+from backend import dataloader
+from backend.dataloader import Lexicon
+
+ROWS = [
+    {"Laz Infinitive": "oxenu", "Category": "TVE", "Laz 3rd Person Singular Present": "ikums",
+     "Region": "PZ, AŞ"},
+    {"Laz Infinitive": "gyoç̌ǩomu", "Category": "TVE", "Laz 3rd Person Singular Present": "gyoç̌ǩomums",
+     "Laz 3rd Person Singular Present Alternative 1": "gyuç̌ǩomums", "Region": "FA", "Region Alternative 1": "HO"},
+    {"Laz Infinitive": "coxons", "Category": "TVM", "Laz 3rd Person Singular Present": "cuxons"},
+    {"Laz Infinitive": "oxolu", "Category": "IVD", "Laz 3rd Person Singular Present": "nuxolun"},
+]
+
+
+@pytest.fixture
+def verb_data(tmp_path):
+    path = tmp_path / "verb_data.json"
+    path.write_text(json.dumps(ROWS, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_views_group_verbs_by_category(verb_data):
+    lexicon = Lexicon.load(verb_data, snapshot="")
+    tve = lexicon.view("TVE")
+
+    assert dict(tve.verbs) == {
+        "oxenu": [("ikums", "PZ, AŞ")],
+        "gyoç̌ǩomu": [("gyoç̌ǩomums", "FA"), ("gyuç̌ǩomums", "HO")],
+    }
+    assert dict(tve.regions) == {"oxenu": ["PZ", "AŞ"], "gyoç̌ǩomu": ["FA", "HO"]}
+    assert tve.gyo_verbs == {"gyoç̌ǩomu"}
+    assert lexicon.view("TVM").regions["coxons"] == ["All"]
+    # TVM only counts "co", not "cu"; TVE counts both.
+    assert lexicon.view("TVM").co_verbs == frozenset()
+    assert list(lexicon.view("TVE", "TVM").verbs) == ["oxenu", "gyoç̌ǩomu", "coxons"]
+
+
+def test_views_are_shared_and_read_only(verb_data):
+    lexicon = Lexicon.load(verb_data, snapshot="")
+
+    assert lexicon.view("TVE") is lexicon.view("TVE")
+    with pytest.raises(TypeError):
+        lexicon.view("TVE").verbs["new"] = []
+
+
+def test_loaders_parse_the_file_once(monkeypatch):
+    monkeypatch.setitem(dataloader._lexicon_state, "lexicon", None)
+    loads = []
+    real_load = Lexicon.load.__func__
+    monkeypatch.setattr(Lexicon, "load", classmethod(lambda cls, *args: loads.append(1) or real_load(cls, *args)))
+
+    first = dataloader.load_tvm_tve_passive()
+    dataloader.load_tve_verbs()
+    dataloader.load_ivd_verbs()
+
+    assert loads == [1]
+    assert dataloader.load_tvm_tve_potential() == first
+    assert dataloader.load_tvm_tve_presentperf()[0] is first[0]
+
+
+def test_snapshot_follows_the_file(verb_data, tmp_path, monkeypatch):
+    snapshot = str(tmp_path / "lexicon.marshal")
+    assert Lexicon.load(verb_data, snapshot).rows == ROWS
+
+    # Unchanged file: the rows come from the snapshot.
+    monkeypatch.setattr(dataloader.json, "loads", lambda *args: pytest.fail("parsed again"))
+    assert Lexicon.load(verb_data, snapshot).rows == ROWS
+
+    # Touched but identical: matched by content hash.
+    os.utime(verb_data, ns=(0, 0))
+    assert Lexicon.load(verb_data, snapshot).rows == ROWS
+    monkeypatch.undo()
+
+    verb_data.write_text(json.dumps(ROWS[:1], ensure_ascii=False), encoding="utf-8")
+    assert Lexicon.load(verb_data, snapshot).rows == ROWS[:1]
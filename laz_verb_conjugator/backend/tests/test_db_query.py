@@ -0,0 +1,447 @@
+import itertools
+import json
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, text
+
+from backend import db_query, reverse_index
+from backend.app import app
+from backend.cache import LRUCache
+from backend.http_cache import response_cache
+
+
+@contextmanager
+def count_queries():
+    """Count the statements sent to the database inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_query.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db_query.engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.fixture
+def cold_cache():
+    """Empty the paradigm and response caches, with a freshly read dataset version."""
+    db_query.get_dataset_version()
+    db_query.paradigm_cache.clear()
+    response_cache.clear()
+    yield db_query.paradigm_cache
+    db_query.paradigm_cache.clear()
+    response_cache.clear()
+
+
+def _verb_ids(infinitive):
+    return [
+        verb_id
+        for verb_id in (
+            db_query.get_verb_id(infinitive, dialect_id) for dialect_id in db_query.DIALECT_CODES
+        )
+        if verb_id is not None
+    ]
+
+
+@pytest.fixture
+def refreshed_store():
+    """Make sure the materialized documents of the verbs under test are current."""
+    db_query.refresh_paradigms(_verb_ids("oxenu"))
+
+
+@pytest.mark.parametrize(
+    "query_string",
+    [
+        "infinitive=oxenu&tense=present",
+        "infinitive=oxenu&tense=past&subject=S1SG&obj=all",
+        "infinitive=oxenu&tense=present&region=FA,HO",
+        "infinitive=nonexistent&tense=present",
+    ],
+)
+def test_conjugate_uses_a_single_query(client, refreshed_store, cold_cache, query_string):
+    with count_queries() as statements:
+        response = client.get(f"/api/conjugate?{query_string}")
+
+    assert response.status_code in (200, 404)
+    assert len(statements) == 1
+
+    with count_queries() as statements:
+        cached_response = client.get(f"/api/conjugate?{query_string}")
+
+    assert cached_response.json == response.json
+    assert statements == []
+
+
+def test_paradigm_cache_counters(cold_cache):
+    args = ("oxenu", [1, 2], "present", "indicative", "none", db_query.Markers(), "all", "")
+
+    db_query.get_paradigm(*args)
+    db_query.get_paradigm(*args)
+    stats = cold_cache.stats()
+
+    assert stats["misses"] >= 1
+    assert stats["hits"] >= 1
+    assert stats["size"] == 1
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_dataset_version_change_clears_cache(cold_cache, monkeypatch):
+    cold_cache.set("key", "value")
+    monkeypatch.setattr(db_query, "_read_dataset_version", lambda: (("test", object()), None))
+    monkeypatch.setitem(db_query._version_state, "version", db_query._version_state["version"])
+    monkeypatch.setitem(db_query._version_state, "updated_at", db_query._version_state["updated_at"])
+    monkeypatch.setitem(db_query._version_state, "checked_at", 0.0)
+
+    db_query.get_dataset_version()
+
+    assert len(cold_cache) == 0
+
+
+def test_conjugate_result_shape(client):
+    response = client.get("/api/conjugate?infinitive=oxenu&tense=present&region=FA,HO")
+    data = response.json
+
+    assert response.status_code == 200
+    assert set(data["result"]) <= {"FA", "HO"}
+    for frames in data["result"].values():
+        assert list(frames) == db_query.FRAMES
+        for forms in frames.values():
+            for form in forms:
+                assert set(form) == {"subject", "object", "subject_code", "object_code", "conjugation"}
+
+
+@pytest.mark.parametrize("subject", ["all", "S1SG"])
+@pytest.mark.parametrize("obj", ["", "all", "O2SG"])
+def test_get_paradigm_matches_per_frame_queries(cold_cache, subject, obj):
+    markers = db_query.Markers()
+    paradigm = db_query.get_paradigm(
+        "oxenu", db_query.DIALECT_CODES.keys(), "present", "indicative", "none", markers, subject, obj
+    )
+
+    assert paradigm
+    for dialect_id, dialect_code in db_query.DIALECT_CODES.items():
+        verb_id = db_query.get_verb_id("oxenu", dialect_id)
+        if verb_id is None:
+            assert dialect_code not in paradigm
+            continue
+
+        for frame in db_query.FRAMES:
+            rows = db_query.get_conjugation_rows(
+                verb_id=verb_id,
+                tense="present",
+                frame=frame,
+                mood="indicative",
+                derivation="none",
+                is_applicative=False,
+                is_causative=False,
+                is_double_causative=False,
+                subject_filter=subject,
+                object_filter=obj,
+            )
+            assert [form["conjugation"] for form in paradigm[dialect_code][frame]] == [
+                row["spelling"] for row in rows
+            ]
+
+
+def test_stored_paradigm_matches_live_join(refreshed_store):
+    args = (["oxenu"], [1, 2, 3, 4], "present", "indicative", "none", db_query.Markers())
+
+    stored, stale = db_query._read_stored_paradigms(*args)
+
+    assert stale == set()
+    assert stored == db_query._fetch_paradigms(*args)
+
+
+def test_stale_store_falls_back_to_live_join(refreshed_store):
+    verb_ids = _verb_ids("oxenu")
+    args = (["oxenu"], [1, 2, 3, 4], "present", "indicative", "none", db_query.Markers())
+
+    with db_query.engine.begin() as conn:
+        conn.execute(
+            text("UPDATE verb_paradigm_refresh SET source_version = source_version - 1 WHERE verb_id = ANY(:ids)"),
+            {"ids": verb_ids},
+        )
+    try:
+        assert db_query._read_stored_paradigms(*args) == ({}, {"oxenu"})
+    finally:
+        db_query.refresh_paradigms(verb_ids)
+
+    assert db_query._read_stored_paradigms(*args)[1] == set()
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_conjugate_batch_matches_single_requests(client, cold_cache):
+    items = [
+        {"infinitive": "oxenu", "tense": "present"},
+        {"infinitive": "oxenu", "tense": "past", "subject": "S1SG", "obj": "all"},
+        {"infinitive": "oxenu", "tense": "present", "region": "FA,HO"},
+        {"infinitive": "nonexistent", "tense": "present"},
+        {"tense": "present"},
+    ]
+
+    response = client.post("/api/conjugate/batch", json=items)
+    lines = sorted(_ndjson(response), key=lambda line: line["index"])
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert [line["index"] for line in lines] == list(range(len(items)))
+    for item, line in zip(items, lines):
+        single = client.get("/api/conjugate", query_string=item)
+        status = line.pop("status")
+        line.pop("index")
+        assert status == single.status_code
+        assert line == single.json
+
+
+def test_conjugate_batch_queries_once_per_group(client, refreshed_store, cold_cache):
+    items = [
+        {"infinitive": "oxenu", "tense": "present"},
+        {"infinitive": "oxenu", "tense": "present", "subject": "S2SG"},
+        {"infinitive": "nonexistent", "tense": "present"},
+        {"infinitive": "oxenu", "tense": "past"},
+    ]
+
+    with count_queries() as statements:
+        response = client.post("/api/conjugate/batch", json={"requests": items})
+        lines = _ndjson(response)
+
+    assert len(lines) == len(items)
+    assert len(statements) == 2
+
+
+def test_conjugate_batch_rejects_invalid_items_alone(client, cold_cache):
+    items = [
+        {"infinitive": "oxenu", "tense": "bogus"},
+        {"infinitive": 5},
+        {"infinitive": "oxenu", "mood": "subjunctive"},
+        {"infinitive": "oxenu", "derivation": "reflexive", "applicative": 1},
+        {"infinitive": "oxenu", "tense": "present"},
+    ]
+
+    response = client.post("/api/conjugate/batch", json=items)
+    lines = {line["index"]: line for line in _ndjson(response)}
+
+    assert response.status_code == 200
+    assert sorted(lines) == list(range(len(items)))
+    for index in range(4):
+        assert lines[index]["status"] == 400
+        assert lines[index]["error"].startswith("Invalid ")
+    assert lines[4]["status"] == 200
+    assert client.get("/api/conjugate", query_string={"infinitive": "oxenu", "tense": "bogus"}).status_code == 400
+
+
+def test_conjugate_batch_rejects_non_list(client):
+    response = client.post("/api/conjugate/batch", json={"infinitive": "oxenu"})
+
+    assert response.status_code == 400
+
+
+def test_verb_paradigm_uses_a_single_query(client, cold_cache):
+    with count_queries() as statements:
+        response = client.get("/api/verbs/oxenu/paradigm?dialects=AŞ,PZ")
+
+    assert response.status_code == 200
+    assert set(response.json["result"]) <= {"AŞ", "PZ"}
+    assert len(statements) == 1
+
+    assert client.get("/api/verbs/nonexistent/paradigm").status_code == 404
+
+
+def test_full_paradigm_matches_get_paradigm(cold_cache):
+    full = db_query.get_full_paradigm("oxenu", db_query.DIALECT_CODES.keys())
+
+    assert full
+    for dialect_code, tenses in full.items():
+        dialect_id = next(i for i, code in db_query.DIALECT_CODES.items() if code == dialect_code)
+        for tense, moods in tenses.items():
+            for mood, derivations in moods.items():
+                for derivation, groups in derivations.items():
+                    for markers in itertools.product([False, True], repeat=3):
+                        markers = db_query.Markers(*markers)
+                        frames = groups.get(db_query.markers_key(markers), {})
+                        paradigm = db_query.get_paradigm(
+                            "oxenu", [dialect_id], tense, mood, derivation, markers, "all", "all"
+                        )
+                        for frame in db_query.FRAMES:
+                            assert [
+                                form["conjugation"]
+                                for form in frames.get(frame, [])
+                                if form["optional_prefix"] is None
+                            ] == [form["conjugation"] for form in paradigm[dialect_code][frame]]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/conjugate?infinitive=oxenu&tense=present",
+        "/api/reverse?spelling=ipxorum",
+        "/api/reverse/suggestions?q=ipx",
+    ],
+)
+def test_read_endpoints_answer_304_for_matching_etag(client, url):
+    response = client.get(url)
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+    assert "max-age" in response.headers["Cache-Control"]
+
+    with count_queries() as statements:
+        revalidated = client.get(url, headers={"If-None-Match": etag})
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.get_data() == b""
+    assert statements == []
+
+    other = client.get(url + "&page=2", headers={"If-None-Match": etag})
+    assert other.status_code == 200
+    assert other.headers["ETag"] != etag
+
+
+def test_etag_ignores_argument_order_and_padding(client):
+    first = client.get("/api/conjugate?infinitive=oxenu&tense=present")
+    second = client.get("/api/conjugate?tense=present&infinitive=%20oxenu")
+
+    assert first.headers["ETag"] == second.headers["ETag"]
+
+
+def test_last_modified_follows_data_version(client):
+    response = client.get("/api/conjugate?infinitive=oxenu&tense=present")
+    last_modified = response.headers["Last-Modified"]
+
+    revalidated = client.get(
+        "/api/conjugate?infinitive=oxenu&tense=present",
+        headers={"If-Modified-Since": last_modified},
+    )
+
+    assert revalidated.status_code == 304
+
+
+def test_pronoun_forms_match_pronoun_join():
+    with db_query.engine.connect() as conn:
+        expected = conn.execute(text("""
+            SELECT vf.verb_form_id, COALESCE(ps.form, vf.subject::text), COALESCE(po.form, vf.object::text)
+            FROM verb_form vf
+            JOIN verb v ON v.verb_id = vf.verb_id
+            LEFT JOIN pronoun ps ON ps.dialect_id = v.dialect_id AND ps.code = vf.subject AND ps.frame = vf.frame
+            LEFT JOIN pronoun po ON po.dialect_id = v.dialect_id AND po.code = vf.object AND po.frame = vf.frame
+            WHERE v.infinitive = 'oxenu'
+            ORDER BY vf.verb_form_id
+        """)).fetchall()
+        rows = conn.execute(text("""
+            SELECT vf.verb_form_id, v.dialect_id, vf.subject, vf.object, vf.frame
+            FROM verb_form vf
+            JOIN verb v ON v.verb_id = vf.verb_id
+            WHERE v.infinitive = 'oxenu'
+            ORDER BY vf.verb_form_id
+        """)).mappings().all()
+
+    pronouns = db_query.get_pronoun_forms()
+    decorated = [
+        (row["verb_form_id"], *db_query._decorate_pronouns(
+            {key: row[key] for key in ("dialect_id", "subject", "object", "frame")}, pronouns
+        ).values())
+        for row in rows
+    ]
+
+    assert expected
+    assert [tuple(row) for row in expected] == [row[:3] for row in decorated]
+
+
+def test_request_checks_out_one_connection(client, monkeypatch):
+    # The database path, even when a reverse index snapshot was loaded at startup
+    monkeypatch.setattr(reverse_index, "REVERSE_INDEX_ENABLED", False)
+    before = db_query.pool_stats()["checkouts"]
+
+    with count_queries() as statements:
+        response = client.get("/api/reverse?spelling=ipxorumxx")
+
+    assert response.status_code == 200
+    assert len(statements) > 1
+    assert db_query.pool_stats()["checkouts"] - before == 1
+
+
+@pytest.mark.parametrize("subject", ["all", "S1SG"])
+@pytest.mark.parametrize("obj", ["", "all", "O2SG"])
+def test_prepared_statements_match_plain_sql(subject, obj):
+    verb_id = db_query.get_verb_id("oxenu", 1)
+    args = (verb_id, "present", "Ergative", "indicative", "none", False, False, False, subject, obj)
+
+    with db_query.request_scope():
+        with db_query._connect() as conn:
+            assert db_query._GET_CONJUGATION_ROWS.name in conn.info["prepared"]
+        prepared = db_query.get_conjugation_rows(*args)
+
+        with db_query._connect() as conn:
+            names = conn.info.pop("prepared")
+        try:
+            with count_queries() as statements:
+                plain = db_query.get_conjugation_rows(*args)
+        finally:
+            conn.info["prepared"] = names
+
+    assert not statements[0].lstrip().startswith("EXECUTE")
+    assert prepared == plain
+
+
+def test_normalized_spelling_columns_follow_python_rules():
+    with db_query.engine.connect() as conn:
+        rows = conn.execute(text("""
+            SELECT spelling, spelling_lower, spelling_norm_strict, spelling_norm_broad
+            FROM verb_form
+            WHERE spelling ~ '[ǩp̌t̆ç̌žǯʒxhğcz]'
+            ORDER BY verb_form_id
+            LIMIT 2000
+        """)).fetchall()
+
+    assert rows
+    for spelling, lower, strict, broad in rows:
+        assert lower == spelling.lower()
+        assert strict == db_query._normalize_reverse_input_strict(spelling)
+        assert broad == db_query._normalize_reverse_input_broad(spelling)
+
+
+@pytest.mark.parametrize(
+    "query, match_types, statement_count",
+    [
+        ("ikum", {"exact"}, 1),
+        ("k'ilup", {"normalized_strict"}, 2),
+        ("kilup", set(), 3),
+    ],
+)
+def test_reverse_tiers_are_single_lookups(query, match_types, statement_count):
+    db_query.get_dataset_version()
+
+    with count_queries() as statements:
+        matches = db_query.reverse_lookup(query)
+
+    assert {row["match_type"] for row in matches} == match_types
+    assert len(statements) == statement_count
+
+    def key(row):
+        return json.dumps(row, sort_keys=True)
+
+    assert sorted(matches, key=key) == sorted(db_query._reverse_lookup_by_prefix(query), key=key)
@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from backend import db_query
+from backend.db_query import (
+    BROAD_NORMALIZATION_RULES,
+    STRICT_NORMALIZATION_RULES,
+    TOKEN_TO_CANONICAL,
+    _apply_rules,
+    _finalize_tokens,
+)
+from backend.normalization import SpellingNormalizer, words
+
+# Laz letters in all their spellings, their pieces, and characters whose
+# lowercasing or composition is unusual
+_ALPHABET = (
+    list("abcçdefgğhıijklmnoöprsştuüvxyz'3 ")
+    + list("KÇIİŞĞÖÜXZTPH{}")
+    + ["ǩ", "p̌", "t̆", "ç̌", "ž", "ǯ", "ʒ", "Ǩ", "Ž", "̌", "̆", "̇", "ẞ", "Σ", "ς"]
+)
+
+
+def _reference_strict(text):
+    return _finalize_tokens(_apply_rules(text, STRICT_NORMALIZATION_RULES))
+
+
+def _reference_broad(text):
+    t = _apply_rules(text, STRICT_NORMALIZATION_RULES)
+    return _finalize_tokens(_apply_rules(t, BROAD_NORMALIZATION_RULES))
+
+
+def _random_spellings(count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 12)))
+
+
+@pytest.fixture
+def normalizer():
+    return SpellingNormalizer(STRICT_NORMALIZATION_RULES, BROAD_NORMALIZATION_RULES, TOKEN_TO_CANONICAL, cache_size=0)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "   ", "ǩilup", "k'ilup", "KİLUP", "tsari", "dz3'x", "ç'ǩç̌k", "hek ", "{KCARON}"],
+)
+def test_matches_the_rule_by_rule_definition(normalizer, text):
+    assert normalizer.keys(text) == (_reference_strict(text), _reference_broad(text))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_the_rule_by_rule_definition_on_random_spellings(normalizer, seed):
+    for text in _random_spellings(20000, seed):
+        assert normalizer.keys(text) == (_reference_strict(text), _reference_broad(text)), repr(text)
+
+
+def _code_points_to_check(sample_size=5000, seed=0):
+    """Characters the rules read or write, in both cases, every combining mark, and a random sample."""
+    rule_characters = {
+        character
+        for src, target in STRICT_NORMALIZATION_RULES + BROAD_NORMALIZATION_RULES
+        for character in src + target
+    }
+    characters = rule_characters | {c.upper() for c in rule_characters}
+    # Combining marks (conjugator.phonemes.COMBINING_MARKS)
+    characters |= {chr(code_point) for code_point in range(0x300, 0x370)}
+    rng = random.Random(seed)
+    for _ in range(sample_size):
+        code_point = rng.randrange(0x110000)
+        if not 0xD800 <= code_point < 0xE000:
+            characters.add(chr(code_point))
+    return sorted(characters)
+
+
+def test_matches_on_rule_characters_marks_and_sampled_code_points(normalizer):
+    for character in _code_points_to_check():
+        text = f"a{character}k"
+        assert normalizer.keys(text) == (_reference_strict(text), _reference_broad(text)), repr(character)
+
+
+def test_module_functions_use_the_memoized_normalizer(monkeypatch):
+    # A fresh instance, since background index builds share the module's cache
+    normalizer = SpellingNormalizer(STRICT_NORMALIZATION_RULES, BROAD_NORMALIZATION_RULES, TOKEN_TO_CANONICAL)
+    monkeypatch.setattr(db_query, "spelling_normalizer", normalizer)
+
+    assert db_query._normalize_reverse_input_strict("k'ilup") == _reference_strict("k'ilup")
+    assert db_query._normalize_reverse_input_broad("k'ilup") == _reference_broad("k'ilup")
+    assert len(normalizer.cache) == 1
+
+
+def test_rejects_rules_that_cannot_run_in_one_pass():
+    with pytest.raises(ValueError):
+        SpellingNormalizer([("s", "{S}"), ("ts", "{TS}")], [], {})
+
+
+def test_words_keep_combining_marks_and_inner_apostrophes():
+    text = "Ma p̌ç̌opumt, k'ilup’ mo naç̌ven! 12 ǩoçi_"
+
+    assert words(text) == [
+        ("Ma", 0, 2),
+        ("p̌ç̌opumt", 3, 12),
+        ("k'ilup", 14, 20),
+        ("mo", 22, 24),
+        ("naç̌ven", 25, 32),
+        ("ǩoçi", 37, 41),
+    ]
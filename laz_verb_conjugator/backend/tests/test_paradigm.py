@@ -0,0 +1,55 @@
+import importlib
+
+import pytest
+
+from backend.utils import objects, subjects
+
+# module: (collect function, its tense)
+MODULES = {
+    "ivd_present": ("collect_conjugations", None),
+    "tve_past": ("collect_conjugations", None),
+    "tve_present": ("collect_conjugations", None),
+    "tvm_tense": ("collect_conjugations_all", "past"),
+    "tvm_tve_potential": ("collect_conjugations_all", "future"),
+}
+
+
+def per_cell(module, collect, infinitive, tense, objects, **markers):
+    paradigm = {}
+    for subject in subjects:
+        for obj in objects:
+            if tense is None:
+                result = getattr(module, collect)(infinitive, [subject], obj=obj, **markers)
+            else:
+                result = getattr(module, collect)(infinitive, [subject], tense=tense, obj=obj, **markers)
+            for region, forms in result.items():
+                paradigm.setdefault(region, set()).update(forms)
+    return paradigm
+
+
+@pytest.mark.parametrize("name", MODULES)
+def test_paradigm_matches_per_cell_conjugation(name):
+    module = importlib.import_module(f"backend.notebooks.{name}")
+    collect, tense = MODULES[name]
+    grid_objects = [None] if name.startswith("tvm") else [None, *objects]
+
+    for infinitive in list(module.verbs)[:5]:
+        assert module.conjugate_paradigm(infinitive, subjects, grid_objects, tense=tense) == \
+            per_cell(module, collect, infinitive, tense, grid_objects)
+        if not name.startswith("tvm"):
+            assert module.conjugate_paradigm(infinitive, subjects, objects, tense=tense, causative=True) == \
+                per_cell(module, collect, infinitive, tense, objects, causative=True)
+
+
+def test_paradigm_analyzes_the_verb_once(monkeypatch):
+    module = importlib.import_module("backend.notebooks.tve_present")
+    calls = []
+    analyze_verb = module.analyze_verb
+    monkeypatch.setattr(module, "analyze_verb", lambda *args: calls.append(args) or analyze_verb(*args))
+    infinitive = next(iter(module.verbs))
+
+    module.conjugate_paradigm(infinitive, subjects, [None, *objects])
+    assert calls == [(infinitive,)]
+
+    module.collect_conjugations(infinitive, subjects, obj="O3_Singular")
+    assert len(calls) == 1 + len(subjects)
@@ -0,0 +1,42 @@
+import pytest
+
+from backend.conjugator.common import (PROTHETIC_CONSONANTS_NO_OBJECT,
+                                       PROTHETIC_RULES_NO_OBJECT,
+                                       extract_initial_cluster, initial_phoneme)
+from backend.conjugator.phonemes import Phonemes, phonemes
+
+
+def test_letters_with_combining_marks_are_one_phoneme():
+    table = Phonemes()
+    ids = table.ids("p̌t̆axuǩ")
+
+    assert [table.grapheme(phoneme) for phoneme in ids] == ["p̌", "t̆", "a", "x", "u", "ǩ"]
+    assert table.text(ids) == "p̌t̆axuǩ"
+    assert table.ids("t̆") == (table.id("t̆"),)
+    assert table.id("t̆") != table.id("t")
+
+
+def test_ids_are_interned_and_memoized():
+    table = Phonemes(cache_size=1)
+
+    assert table.ids("ç̌ai") == table.ids("ç̌ai")
+    assert table.ids("aç̌")[1] == table.ids("ç̌ai")[0]
+    assert len(table.cache) == 1
+
+
+@pytest.mark.parametrize(
+    "form,cluster",
+    [("t̆axums", "t̆"), ("ç̌opums", "ç̌"), ("ǩorops", "ǩ"), ("p̌ç̌opums", "p̌"), ("skidun", "s"), ("gyoç̌ǩams", "oç̌ǩams")],
+)
+def test_initial_cluster(form, cluster):
+    assert extract_initial_cluster(form) == cluster
+
+
+def test_compiled_prothetic_rules_follow_the_tables():
+    for region, table in PROTHETIC_CONSONANTS_NO_OBJECT.items():
+        for letter in {letter for letters in table.values() for letter in letters}:
+            expected = next(segment for segment, letters in table.items() if letter in letters)
+
+            assert PROTHETIC_RULES_NO_OBJECT[region][initial_phoneme(letter + "a")] == expected
+    assert initial_phoneme("gyoç̌ǩams") is None
+    assert phonemes.first("") is None
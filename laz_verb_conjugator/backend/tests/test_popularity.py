@@ -0,0 +1,65 @@
+import json
+
+from backend import popularity
+from backend.popularity import (Popularity, aggregate, load_table, log_files,
+                                spelling_scores, write_table)
+
+
+def _line(entry):
+    return "2026-10-18 12:00:00,000 - " + json.dumps(entry, ensure_ascii=False) + "\n"
+
+
+def _reverse(spelling, *rows):
+    return {
+        "endpoint": "/api/reverse",
+        "request": {"spelling": spelling},
+        "response": {"matches": [{"conjugated_form": form, "infinitive": infinitive} for form, infinitive in rows]},
+    }
+
+
+def test_counts_spellings_and_verbs_people_look_up(tmp_path):
+    log = tmp_path / "request_response.log"
+    (tmp_path / "request_response.log.1").write_text(
+        _line(_reverse("ikum", ("ikum", "oxenu"), ("ikum", "oxenu"))), encoding="utf-8"
+    )
+    log.write_text(
+        _line(_reverse("IKUM", ("ikum", "oxenu")))
+        + _line(_reverse("xyz"))
+        + _line({**_reverse("ikum", ("ikum", "oxenu")), "request": {"spelling": "ikum", "cursor": "x"}})
+        + _line({"endpoint": "/api/reverse", "request": {"spelling": "k'ilup"},
+                 "response_size": 10, "response_hash": "0"})
+        + _line({"endpoint": "/api/conjugate", "request": {"infinitive": "oxenu"}, "response": {}})
+        + _line({"endpoint": "/api/reverse/suggestions", "request": {"q": "ik"}, "response": {}})
+        + _line({"endpoint": "/api/reverse/analyze", "request": {"size": 9},
+                 "response": {"matches": {"ǩilup": [{"infinitive": "oǩilu"}], "xyz": []}}})
+        + "not a log line\n"
+        + "2026-10-18 - {broken json\n",
+        encoding="utf-8",
+    )
+
+    counted = aggregate(log_files(str(log)), str.lower)
+
+    assert log_files(str(log)) == [str(tmp_path / "request_response.log.1"), str(log)]
+    assert counted.spellings == {"ikum": 2, "k'ilup": 1, "ǩilup": 1}
+    assert counted.infinitives == {"oxenu": 3, "oǩilu": 1}
+
+
+def test_table_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(popularity, "POPULARITY_TABLE", str(tmp_path / "popularity.json"))
+    counted = Popularity(popularity.Counter({"ikum": 3}), popularity.Counter({"oxenu": 1}))
+
+    assert load_table() is None
+    write_table(counted)
+
+    assert load_table() == counted
+
+
+def test_looked_up_spellings_outrank_their_verbs():
+    counted = Popularity(popularity.Counter({"ikum": 1}), popularity.Counter({"oxenu": 2, "oǩilu": 1}))
+
+    scores = spelling_scores(
+        counted, {"ikum": {"oxenu"}, "vikum": {"oxenu"}, "ǩilups": {"oǩilu"}, "dodgi": {"dodgu"}}, str.lower
+    )
+
+    assert scores == {"ikum": popularity.POPULARITY_SPELLING_WEIGHT + 2, "vikum": 2, "ǩilups": 1}
+    assert spelling_scores(None, {"ikum": {"oxenu"}}, str.lower) == {}
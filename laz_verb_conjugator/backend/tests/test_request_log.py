@@ -0,0 +1,118 @@
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from backend import request_log
+from backend.popularity import log_files
+from backend.request_log import RequestLogger
+
+
+@pytest.fixture
+def request_logger(tmp_path):
+    path = tmp_path / "request_response.log"
+    logger = RequestLogger(str(path), name="test_request_response")
+    yield logger, path
+    logger.stop()
+
+
+def _entries(path):
+    # Same parsing as Scripts/clean_log.py
+    return [json.loads(line.split(" - ", 1)[1]) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_full_mode_logs_request_and_response(request_logger):
+    logger, path = request_logger
+
+    logger.log({"infinitive": "oxenu"}, {"result": {"AŞ": {}}}, "/api/conjugate")
+    logger.flush()
+
+    assert _entries(path) == [{
+        "endpoint": "/api/conjugate",
+        "request": {"infinitive": "oxenu"},
+        "response": {"result": {"AŞ": {}}},
+    }]
+
+
+def test_summary_mode_logs_size_and_hash(request_logger, monkeypatch):
+    logger, path = request_logger
+    monkeypatch.setitem(request_log.REQUEST_LOG_MODES, "/api/verbs/paradigm", "summary")
+    response = {"result": {"AŞ": {"present": {}}}, "infinitive": "oxenu"}
+
+    logger.log({"infinitive": "oxenu"}, response, "/api/verbs/paradigm")
+    logger.flush()
+
+    body = json.dumps(response, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    assert _entries(path) == [{
+        "endpoint": "/api/verbs/paradigm",
+        "request": {"infinitive": "oxenu"},
+        "response_size": len(body),
+        "response_hash": hashlib.sha256(body).hexdigest()[:16],
+    }]
+
+
+def test_sampling_is_per_endpoint(request_logger, monkeypatch):
+    logger, path = request_logger
+    monkeypatch.setitem(request_log.REQUEST_LOG_SAMPLE_RATES, "/api/reverse/suggestions", 0.0)
+
+    logger.log({"q": "ipx"}, {"suggestions": []}, "/api/reverse/suggestions")
+    logger.log({"spelling": "ipxorum"}, {"matches": []}, "/api/reverse")
+    logger.flush()
+
+    assert [entry["endpoint"] for entry in _entries(path)] == ["/api/reverse"]
+
+
+def test_parse_endpoint_settings():
+    assert request_log._parse_endpoint_settings("/api/conjugate=0.1, /api/reverse = 1,,bad") == {
+        "/api/conjugate": "0.1",
+        "/api/reverse": "1",
+    }
+
+
+def test_reopens_the_log_after_external_rotation(request_logger):
+    logger, path = request_logger
+
+    logger.log({"spelling": "ipxorum"}, {"matches": []}, "/api/reverse")
+    logger.flush()
+    rotated = path.with_name(path.name + ".1")
+    path.rename(rotated)
+    logger.log({"q": "ipx"}, {"suggestions": []}, "/api/reverse/suggestions")
+    logger.flush()
+
+    assert [entry["endpoint"] for entry in _entries(rotated)] == ["/api/reverse"]
+    assert [entry["endpoint"] for entry in _entries(path)] == ["/api/reverse/suggestions"]
+
+
+def test_rotates_into_the_backups_popularity_reads(tmp_path):
+    path = tmp_path / "request_response.log"
+    logger = RequestLogger(str(path), name="test_rotating_request_response", max_bytes=1, backup_count=2)
+    try:
+        for spelling in ["ipxorum", "ibgar", "ompxorum"]:
+            logger.log({"spelling": spelling}, {"matches": []}, "/api/reverse")
+            logger.flush()
+    finally:
+        logger.stop()
+
+    assert [
+        [entry["request"]["spelling"] for entry in _entries(Path(log))] for log in log_files(str(path))
+    ] == [["ipxorum"], ["ibgar"], ["ompxorum"]]
+
+
+def test_follows_a_rotation_by_another_worker(tmp_path):
+    path = tmp_path / "request_response.log"
+    first = RequestLogger(str(path), name="test_first_worker")
+    second = RequestLogger(str(path), name="test_second_worker", max_bytes=1)
+    try:
+        first.log({"spelling": "ipxorum"}, {"matches": []}, "/api/reverse")
+        first.flush()
+        second.log({"spelling": "ibgar"}, {"matches": []}, "/api/reverse")
+        second.flush()
+        # The second worker rotated the file; the first appends to the new one
+        first.log({"spelling": "ompxorum"}, {"matches": []}, "/api/reverse")
+        first.flush()
+    finally:
+        first.stop()
+        second.stop()
+
+    assert [entry["request"]["spelling"] for entry in _entries(path)] == ["ibgar", "ompxorum"]
@@ -0,0 +1,451 @@
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from backend import db_query, http_cache, popularity, reverse_index
+from backend.app import REVERSE_PAGE_SIZE, app
+from backend.db_query import ReverseCursor
+from backend.reverse_index import ReverseIndex
+from backend.tests.test_db_query import count_queries
+
+
+@pytest.fixture(scope="module")
+def index():
+    return ReverseIndex.build()
+
+
+def _sample_spellings(limit=60):
+    with db_query.engine.connect() as conn:
+        return [
+            spelling
+            for (spelling,) in conn.execute(text("""
+                SELECT DISTINCT spelling
+                FROM verb_form
+                WHERE spelling ~ '[ǩp̌t̆ç̌žǯʒxhğcz]'
+                ORDER BY spelling
+                LIMIT :limit
+            """), {"limit": limit})
+        ]
+
+
+def _pin_dataset_version(monkeypatch, version):
+    """Pin the dataset version, including the names http_cache imported for ETags."""
+    monkeypatch.setattr(db_query, "get_dataset_version", lambda: version)
+    monkeypatch.setattr(http_cache, "get_dataset_version", lambda: version)
+    monkeypatch.setattr(http_cache, "get_dataset_updated_at", lambda: None)
+
+
+class _InlineThread:
+    def __init__(self, target, args, daemon):
+        self.target, self.args = target, args
+
+    def start(self):
+        self.target(*self.args)
+
+
+def _variants(spelling):
+    return [
+        spelling,
+        spelling.upper(),
+        spelling.replace("ǩ", "k'").replace("p̌", "p'").replace("t̆", "t'"),
+        spelling.replace("ǩ", "k").replace("ç̌", "ç").replace("ğ", "g"),
+    ]
+
+
+def test_index_holds_every_form(index):
+    with db_query.engine.connect() as conn:
+        count = conn.execute(text("SELECT COUNT(*) FROM verb_form")).scalar()
+
+    assert len(index) == count
+
+
+# "İKUM": Python lowercases İ to i + combining dot, SQL LOWER() to a plain i
+@pytest.mark.parametrize("query", ["ikum", "k'ilup", "kilup", "  IKUM ", "İKUM", "", "xyzxyz"])
+def test_lookup_matches_database(index, query):
+    assert index.lookup(query) == db_query.reverse_lookup(query)
+
+
+def test_lookup_matches_database_on_sampled_spellings(index):
+    queries = [variant for spelling in _sample_spellings() for variant in _variants(spelling)]
+
+    for query in queries:
+        assert index.lookup(query) == db_query.reverse_lookup(query), query
+
+
+def test_snapshot_round_trip(index, tmp_path):
+    path = str(tmp_path / "reverse_index.pickle")
+    index.save(path)
+    loaded = ReverseIndex.load(path)
+
+    assert loaded.version == index.version
+    assert loaded.lookup("k'ilup") == index.lookup("k'ilup")
+    assert loaded.lookup("ikumm", max_distance=1) == index.lookup("ikumm", max_distance=1)
+    assert loaded.suggest("ik") == index.suggest("ik")
+    assert loaded.popularity_mtime == index.popularity_mtime
+    assert ReverseIndex.load(str(tmp_path / "missing.pickle")) is None
+
+
+def test_reverse_endpoint_is_served_from_memory(index, monkeypatch):
+    db_query.get_dataset_version()
+    monkeypatch.setitem(reverse_index._index_state, "index", index)
+    _pin_dataset_version(monkeypatch, index.version)
+
+    with count_queries() as statements:
+        response = app.test_client().get("/api/reverse?spelling=ikum&nocache=index")
+
+    assert response.status_code == 200
+    assert response.json["matches"] == index.lookup("ikum")[:REVERSE_PAGE_SIZE]
+    assert statements == []
+
+
+def test_fallback_answers_are_not_served_once_the_index_is_ready(index, monkeypatch):
+    _pin_dataset_version(monkeypatch, index.version)
+    monkeypatch.setitem(reverse_index._index_state, "index", None)
+    monkeypatch.setitem(reverse_index._index_state, "building", True)
+    query = next(
+        query for query in map(_typo, _sample_spellings(20))
+        if query and not index.lookup(query) and index.lookup(query, max_distance=1)
+    )
+    client = app.test_client()
+
+    building = client.get("/api/reverse", query_string={"spelling": query})
+    monkeypatch.setitem(reverse_index._index_state, "index", index)
+    ready = client.get("/api/reverse", query_string={"spelling": query},
+                       headers={"If-None-Match": building.headers["ETag"]})
+
+    assert building.json["match_type"] != "fuzzy"
+    assert ready.status_code == 200
+    assert ready.headers["ETag"] != building.headers["ETag"]
+    assert ready.json["match_type"] == "fuzzy"
+
+
+def test_stale_index_falls_back_and_rebuilds(index, monkeypatch):
+    monkeypatch.setitem(reverse_index._index_state, "index", index)
+    monkeypatch.setitem(reverse_index._index_state, "building", False)
+    _pin_dataset_version(monkeypatch, ("test", "newer"))
+    builds = []
+    monkeypatch.setattr(reverse_index, "_build_current", builds.append)
+    monkeypatch.setattr(reverse_index, "threading", SimpleNamespace(Thread=_InlineThread))
+
+    assert reverse_index.ensure_reverse_index() is None
+    assert builds == [("test", "newer")]
+
+
+def test_workers_load_the_snapshot_instead_of_building(index, monkeypatch, tmp_path):
+    monkeypatch.setattr(reverse_index, "REVERSE_INDEX_SNAPSHOT", str(tmp_path / "reverse_index.pickle"))
+    _pin_dataset_version(monkeypatch, index.version)
+    monkeypatch.setitem(reverse_index._index_state, "index", None)
+    index.save(reverse_index.REVERSE_INDEX_SNAPSHOT)
+    monkeypatch.setattr(ReverseIndex, "build", pytest.fail)
+    # Nor rebuild the fuzzy and suggestion indexes
+    monkeypatch.setattr(reverse_index._DeletionIndex, "__init__", pytest.fail)
+    monkeypatch.setattr(ReverseIndex, "rank_suggestions", pytest.fail)
+
+    assert reverse_index.load_reverse_index()
+    assert len(reverse_index._index_state["index"]) == len(index)
+    reverse_index._build_current(index.version)
+    assert reverse_index._index_state["index"].version == index.version
+
+    _pin_dataset_version(monkeypatch, ("test", "newer"))
+    assert not reverse_index.load_reverse_index()
+
+
+def _typo(spelling):
+    """`spelling` with its last plain letter replaced by another one."""
+    for i in range(len(spelling) - 1, -1, -1):
+        if spelling[i] in "aeiou":
+            return spelling[:i] + ("a" if spelling[i] != "a" else "e") + spelling[i + 1:]
+    return None
+
+
+def test_analyzed_tier_answers_forms_missing_from_the_table(index, monkeypatch):
+    # A double causative, so that the markers are checked as well
+    form = next(
+        row for row in (
+            index.row(position) for position, flags in enumerate(index.columns["flags"]) if flags & 4
+        )
+        if row["tense"] == "present" and not row["conjugated_form"].startswith("N/A")
+    )
+    # As if verb_form held none of the forms
+    monkeypatch.setattr(index, "analyzed", reverse_index.analyzed_tier(reverse_index._Postings({})))
+    for tier in ("exact", "strict", "broad"):
+        monkeypatch.setattr(index, tier, reverse_index._Postings({}))
+    # Lookups never run the tense modules
+    monkeypatch.setattr(reverse_index, "present_forms", pytest.fail)
+
+    matches = index.lookup(form["conjugated_form"])
+
+    assert matches
+    assert {row["match_type"] for row in matches} == {"analyzed"}
+    # The same row verb_form holds, bar the meanings (read from verb_data.json)
+    same_fields = set(form) - {"meaning_english", "meaning_turkish"}
+    assert any({key: row[key] for key in same_fields} == {key: form[key] for key in same_fields} for row in matches)
+
+    monkeypatch.setattr(reverse_index, "REVERSE_ANALYZER_ENABLED", False)
+    assert reverse_index.analyzed_tier(reverse_index._Postings({})) == {}
+
+
+def test_fuzzy_tier_finds_one_letter_typos(index):
+    for spelling in _sample_spellings(20):
+        query = _typo(spelling)
+        if query is None or index.lookup(query):
+            continue
+
+        matches = index.lookup(query, max_distance=1)
+
+        assert matches, query
+        assert {row["match_type"] for row in matches} == {"fuzzy"}
+        assert spelling in {row["conjugated_form"] for row in matches}
+        assert all(row["edit_distance"] == 1 for row in matches)
+
+
+def test_fuzzy_tier_ranks_by_distance(index):
+    matches = index.lookup("ikumaa", max_distance=2)
+    distances = [row["edit_distance"] for row in matches]
+
+    assert distances == sorted(distances)
+    assert index.lookup("ikumaa") == []
+
+
+def test_fuzzy_tier_compares_a_bounded_number_of_candidates(index, monkeypatch):
+    monkeypatch.setattr(reverse_index, "REVERSE_FUZZY_MAX_CANDIDATES", 1)
+
+    matches = index.lookup("ikun", max_distance=1)
+
+    assert len({db_query._normalize_reverse_input_broad(row["conjugated_form"]) for row in matches}) <= 1
+
+
+def test_edit_distance():
+    assert reverse_index._edit_distance("oxenu", "oxenu", 1) == 0
+    assert reverse_index._edit_distance("oxenu", "oxneu", 1) == 1
+    assert reverse_index._edit_distance("ikum", "ikums", 1) == 1
+    assert reverse_index._edit_distance("ikum", "oxenu", 1) == 2
+
+
+@pytest.mark.parametrize("query", ["ik", "mo", "o"])
+def test_suggestions_start_with_the_query(index, query):
+    suggestions = [row["spelling"] for row in index.suggest(query)]
+    from_database = [row["spelling"] for row in db_query.reverse_suggestions(query, limit=1000)]
+
+    assert suggestions == sorted(from_database)[:8]
+
+
+def test_suggestions_follow_alternate_spellings(index):
+    canonical = {row["spelling"] for row in index.suggest("ǩi", limit=1000)}
+    elder = {row["spelling"] for row in index.suggest("k'i", limit=1000)}
+
+    assert canonical
+    assert canonical == elder
+    assert all(
+        db_query._normalize_reverse_input_strict(spelling).startswith("ǩi") for spelling in elder
+    )
+
+
+def test_suggestions_rank_looked_up_spellings_first(index, tmp_path, monkeypatch):
+    monkeypatch.setattr(popularity, "POPULARITY_TABLE", str(tmp_path / "popularity.json"))
+    alphabetical = index.suggest("i", limit=1000)
+    favourite = alphabetical[-1]["spelling"]
+    popularity.write_table(popularity.Popularity(
+        Counter({db_query._normalize_reverse_input_strict(favourite): 1}), Counter()
+    ))
+
+    try:
+        index.rank_suggestions()
+        ranked = index.suggest("i", limit=8)
+    finally:
+        monkeypatch.undo()
+        index.rank_suggestions()
+
+    strict = db_query._normalize_reverse_input_strict
+    assert strict(ranked[0]["spelling"]) == strict(favourite)
+    assert ranked != alphabetical[:8]
+
+
+def test_suggestions_are_served_from_memory(index, monkeypatch):
+    monkeypatch.setitem(reverse_index._index_state, "index", index)
+    _pin_dataset_version(monkeypatch, index.version)
+
+    with count_queries() as statements:
+        response = app.test_client().get("/api/reverse/suggestions?q=ipx&nocache=index")
+
+    assert response.status_code == 200
+    assert response.json["suggestions"] == index.suggest("ipx")
+    assert statements == []
+
+
+def test_new_popularity_table_changes_cached_suggestions(index, tmp_path, monkeypatch):
+    monkeypatch.setitem(reverse_index._index_state, "index", index)
+    _pin_dataset_version(monkeypatch, index.version)
+    monkeypatch.setattr(popularity, "POPULARITY_TABLE", str(tmp_path / "popularity.json"))
+    monkeypatch.setattr(reverse_index, "POPULARITY_CHECK_SECONDS", 0)
+    monkeypatch.setattr(reverse_index, "threading", SimpleNamespace(Thread=_InlineThread))
+    client = app.test_client()
+    strict = db_query._normalize_reverse_input_strict
+
+    try:
+        index.rank_suggestions()
+        before = client.get("/api/reverse/suggestions?q=i")
+        favourite = index.suggest("i", limit=1000)[-1]["spelling"]
+        popularity.write_table(popularity.Popularity(Counter({strict(favourite): 1}), Counter()))
+
+        # Neither the 304 nor the cached response may hold the old order back.
+        after = client.get("/api/reverse/suggestions?q=i", headers={"If-None-Match": before.headers["ETag"]})
+    finally:
+        monkeypatch.undo()
+        index.rank_suggestions()
+
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert strict(after.json["suggestions"][0]["spelling"]) == strict(favourite)
+
+
+def test_lookup_many_matches_single_lookups(monkeypatch):
+    queries = [variant for spelling in _sample_spellings(30) for variant in _variants(spelling)]
+    queries += ["xyzxyz", "ikum"]
+    # A dataset version re-read (DATASET_VERSION_TTL) would count as a statement.
+    _pin_dataset_version(monkeypatch, db_query.get_dataset_version())
+
+    with count_queries() as statements:
+        found = db_query.reverse_lookup_many(queries)
+
+    assert len(statements) == 1
+    for query in queries:
+        assert found[query.strip()] == db_query.reverse_lookup(query), query
+
+
+def test_passage_keeps_compound_forms_together(index, monkeypatch):
+    monkeypatch.setitem(reverse_index._index_state, "index", index)
+    _pin_dataset_version(monkeypatch, index.version)
+    compound = next(spelling for spelling in index.columns["spelling"] if spelling.count(" ") == 1)
+    first, second = compound.split(" ")
+
+    tokens, matches = reverse_index.analyze_passage(f"{compound}. {first}, {second} xyzxyz")
+
+    assert [token["token"] for token in tokens] == [compound, first, second, "xyzxyz"]
+    assert tokens[0] == {"token": compound, "start": 0, "end": len(compound), "match_type": "exact"}
+    assert tokens[-1]["match_type"] == "none"
+    assert matches[compound] == index.lookup(compound)
+    assert matches["xyzxyz"] == []
+
+
+def test_analyze_endpoint_resolves_a_passage_in_one_round_trip(monkeypatch):
+    monkeypatch.setattr(reverse_index, "REVERSE_INDEX_ENABLED", False)
+    spellings = _sample_spellings(200)
+    passage = " ".join(spellings + spellings)
+
+    with count_queries() as statements:
+        response = app.test_client().post("/api/reverse/analyze", json={"text": passage})
+
+    assert response.status_code == 200
+    assert len(response.json["tokens"]) >= len(spellings)
+    assert set(response.json["matches"]) >= {token["token"] for token in response.json["tokens"]}
+    assert len([sql for sql in statements if "verb_form" in sql]) == 1
+
+
+def test_analyze_endpoint_rejects_bad_bodies():
+    client = app.test_client()
+
+    assert client.post("/api/reverse/analyze", json=["ikum"]).status_code == 400
+    assert client.post("/api/reverse/analyze", data="ikum").status_code == 400
+
+
+def _paged_spelling():
+    """A spelling with a few dozen forms across several dialects: several pages, quick to read whole."""
+    with db_query.engine.connect() as conn:
+        return conn.execute(text("""
+            SELECT LOWER(vf.spelling)
+            FROM verb_form vf
+            JOIN verb v ON v.verb_id = vf.verb_id
+            WHERE vf.spelling NOT LIKE 'N/A%'
+            GROUP BY LOWER(vf.spelling)
+            HAVING COUNT(*) BETWEEN 20 AND 60 AND COUNT(DISTINCT v.dialect_id) > 1
+            ORDER BY COUNT(*) DESC, LOWER(vf.spelling)
+            LIMIT 1
+        """)).scalar()
+
+
+def _all_pages(lookup_page, query, limit):
+    pages = [lookup_page(query, limit)]
+    while pages[-1].next_cursor is not None:
+        # Cursors survive the round trip through the query string.
+        pages.append(lookup_page(query, limit, ReverseCursor.decode(pages[-1].next_cursor.encode())))
+    return pages
+
+
+# Page sizes relative to the number of matches: one row per page, pages that
+# divide it, a short last page, one page exactly, and a page larger than it.
+_PAGE_SIZES = {
+    "one": lambda total: 1,
+    "divisor": lambda total: next(size for size in range(2, total) if total % size == 0),
+    "short_last_page": lambda total: total - 1,
+    "exact": lambda total: total,
+    "larger": lambda total: total + 1,
+}
+
+
+@pytest.mark.parametrize("page_size", _PAGE_SIZES)
+def test_pages_cover_every_match(index, page_size):
+    query = _paged_spelling()
+    matches = index.lookup(query)
+    limit = _PAGE_SIZES[page_size](len(matches))
+
+    pages = _all_pages(index.lookup_page, query, limit)
+
+    assert [len(page.matches) for page in pages[:-1]] == [limit] * (len(pages) - 1)
+    assert 0 < len(pages[-1].matches) <= limit
+    assert len(pages) == -(-len(matches) // limit)
+    assert {page.total for page in pages} == {len(matches)}
+    assert [row for page in pages for row in page.matches] == matches
+
+
+@pytest.mark.parametrize("page_size", _PAGE_SIZES)
+def test_database_pages_match_index_pages(index, page_size):
+    for query in [_paged_spelling(), "k'ilup", "kilup", "xyzxyz"]:
+        limit = _PAGE_SIZES[page_size](max(len(index.lookup(query)), 4))
+        from_index = _all_pages(index.lookup_page, query, limit)
+        from_database = _all_pages(db_query.reverse_lookup_page, query, limit)
+
+        assert [page.matches for page in from_database] == [page.matches for page in from_index], query
+        assert [page.total for page in from_database] == [page.total for page in from_index], query
+        assert [page.next_cursor for page in from_database][-1] is None, query
+
+
+def test_database_counts_a_tier_on_its_first_page_only(monkeypatch):
+    query = _paged_spelling()
+    _pin_dataset_version(monkeypatch, db_query.get_dataset_version())
+    first = db_query.reverse_lookup_page(query, 5)
+
+    with count_queries() as statements:
+        second = db_query.reverse_lookup_page(query, 5, ReverseCursor.decode(first.next_cursor.encode()))
+
+    assert second.total == first.total == first.next_cursor.total
+    # Either the prepared statement of later pages or its SQL; never the counting one.
+    assert len(statements) == 1
+    assert "first_page" not in statements[0] and "COUNT(" not in statements[0]
+
+
+def test_reverse_endpoint_pages_and_groups(index, monkeypatch):
+    monkeypatch.setitem(reverse_index._index_state, "index", index)
+    _pin_dataset_version(monkeypatch, index.version)
+    query = _paged_spelling()
+    client = app.test_client()
+
+    first = client.get(f"/api/reverse?spelling={query}&limit=2").json
+    second = client.get(f"/api/reverse?spelling={query}&limit=2&cursor={first['next_cursor']}").json
+
+    assert first["matches"] + second["matches"] == index.lookup(query)[:4]
+    assert first["total"] == len(index.lookup(query))
+    assert sum(group["count"] for group in first["groups"]) == len(first["matches"])
+    assert client.get("/api/reverse?spelling=ikum&cursor=nonsense").status_code == 400
+    assert client.get("/api/reverse?spelling=ikum&limit=many").status_code == 400
+
+
+def test_cursor_round_trip():
+    cursor = ReverseCursor("normalized_strict", 50, (2, "ǩoçi", 1234), 120)
+
+    assert ReverseCursor.decode(cursor.encode()) == cursor
+    assert ReverseCursor.decode(ReverseCursor("fuzzy", 3).encode()) == ReverseCursor("fuzzy", 3)
+    with pytest.raises(ValueError):
+        ReverseCursor.decode("WyJleGFjdCIsLTFd")
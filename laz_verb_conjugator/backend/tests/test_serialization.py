@@ -0,0 +1,67 @@
+import gzip
+import json
+
+import pytest
+from werkzeug.datastructures import Accept
+
+from backend import serialization
+from backend.app import app
+from backend.http_cache import response_cache
+from backend.serialization import EncodedResponse
+
+PAYLOAD = {
+    "result": {"AŞ": {"Ergative": [{"subject": "şǩu", "conjugation": "vikumt", "object": None}]}},
+    "meta": {"selected": {"regions": [], "is_applicative": False}},
+}
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.mark.parametrize("serializer", ["json", "orjson"])
+def test_serializers_produce_the_same_bytes(monkeypatch, serializer):
+    if serializer == "orjson":
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(serialization, "JSON_SERIALIZER", serializer)
+
+    assert serialization.dumps(PAYLOAD) == json.dumps(
+        PAYLOAD, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def test_compressed_variants_are_built_once(monkeypatch):
+    monkeypatch.setattr(serialization, "COMPRESS_MIN_SIZE", 0)
+    encoded = EncodedResponse(PAYLOAD)
+
+    first = encoded.to_response(Accept([("gzip", 1)]))
+    second = encoded.to_response(Accept([("gzip", 1)]))
+
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(first.get_data()) == encoded.body
+    assert encoded.variant("gzip") is encoded.variant("gzip")
+    assert second.get_data() == first.get_data()
+
+
+def test_small_bodies_are_not_compressed():
+    response = EncodedResponse({"suggestions": []}).to_response(Accept([("gzip", 1)]))
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_conjugate_is_served_gzipped_from_the_response_cache(client):
+    url = "/api/conjugate?infinitive=oxenu&tense=present&obj=all"
+    response_cache.clear()
+
+    plain = client.get(url)
+    zipped = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in zipped.headers["Vary"]
+    assert zipped.headers["ETag"] != plain.headers["ETag"]
+    assert json.loads(gzip.decompress(zipped.get_data())) == plain.json
+    assert response_cache.stats()["hits"] >= 1
+
+    revalidated = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["ETag"]})
+    assert revalidated.status_code == 304
@@ -0,0 +1,84 @@
+import sys
+
+import pytest
+
+from backend.conjugation import check_verb_existence
+from backend.tense_modules import (
+    TENSE_MODULE_NAMES,
+    TenseModuleRegistry,
+    VerbCategory,
+    VerbMembership,
+    prewarm_names,
+)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # Fresh imports, so the timings are those of a cold worker
+    for name in TENSE_MODULE_NAMES:
+        monkeypatch.delitem(sys.modules, f"backend.notebooks.{name}", raising=False)
+    return TenseModuleRegistry()
+
+
+def test_modules_are_imported_on_first_use(registry):
+    assert "tve_present" in registry
+    assert list(registry) == list(TENSE_MODULE_NAMES)
+    assert registry.loaded() == []
+
+    module = registry["tve_present"]
+
+    assert registry.loaded() == ["tve_present"]
+    assert registry.get("tve_present") is module
+    assert module.verbs
+    assert registry.get("no_such_tense") is None
+
+
+def test_report_times_imported_modules(registry):
+    registry.prewarm(["ivd_present", "tvm_tense"])
+    report = registry.report()
+
+    assert report["loaded"] == 2
+    assert report["total"] == len(TENSE_MODULE_NAMES)
+    assert report["modules"]["tve_past"] == {"loaded": False}
+    timing = report["modules"]["tvm_tense"]
+    assert timing["loaded"] and timing["import_seconds"] >= 0 and timing["init_seconds"] > 0
+    assert report["init_seconds"] >= timing["init_seconds"]
+
+
+def test_failed_import_is_reported(registry, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pandas", None)
+
+    registry.prewarm(["tvm_tve_passive"])
+
+    entry = registry.report()["modules"]["tvm_tve_passive"]
+    assert not entry["loaded"] and "pandas" in entry["error"]
+    assert "backend.notebooks.tvm_tve_passive" not in sys.modules
+
+
+def test_prewarm_names():
+    assert prewarm_names("") == []
+    assert prewarm_names(" tve_present, tvm_tense ") == ["tve_present", "tvm_tense"]
+    assert prewarm_names("all") == list(TENSE_MODULE_NAMES)
+    with pytest.raises(ValueError):
+        prewarm_names("tve_presnt")
+
+
+def test_membership_maps_infinitives_to_groups_and_modules(registry):
+    membership = registry.membership
+
+    assert registry.loaded() == []
+    oxenu = membership.get(" Oxenu ")
+    assert oxenu.categories == VerbCategory.TVE | VerbCategory.TVM_TVE
+    assert {"tve_present", "tvm_tve_potential"} <= oxenu.modules
+    assert not oxenu.modules & {"ivd_present", "tvm_tense"}
+    assert membership.get("nonexistent").categories == VerbCategory(0)
+    assert check_verb_existence("oxenu", registry) == (False, True, False, True)
+
+
+def test_membership_from_lexicon_matches_imported_modules(registry):
+    names = ["ivd_past", "tve_future", "tvm_tense", "tvm_tve_presentperf"]
+    registry.prewarm(names)
+
+    from_modules = VerbMembership.from_modules({name: registry[name] for name in names})
+
+    assert VerbMembership.from_lexicon(names).entries == from_modules.entries
@@ -1,14 +1,13 @@
+from backend.conjugator.common import extract_initial_cluster
+
+
 def process_compound_verb(verb):
     """Process compound verbs and return the latter part."""
     return ' '.join(verb.split()[1:]) if len(verb.split()) > 1 else verb
 
 def get_first_letter(root):
     """Handle special letters in roots."""
-    if len(root) > 1 and root[:2] in ['t̆', 'ç̌', 'ǩ', 'p̌', 'ǯ']:
-        return root[:2]
-    elif root.startswith('gyoç̌ǩams'):
-        return root[2:]
-    return root[0]
+    return extract_initial_cluster(root)
 
 def get_first_word(verb):
     """Get the first word of a compound verb."""
@@ -67,6 +66,15 @@ subjects = ['S1_Singular', 'S2_Singular', 'S3_Singular', 'S1_Plural', 'S2_Plural
 objects = ['O1_Singular', 'O2_Singular', 'O3_Singular', 'O1_Plural', 'O2_Plural', 'O3_Plural']
 ordered_objects = ['O1_Singular', 'O2_Singular', 'O3_Singular', 'O1_Plural', 'O2_Plural', 'O3_Plural']
 
+def collect_paradigm(collect, subjects, objects):
+    """Merge collect(subject, obj) ({region: forms}) over every subject and object into one {region: set}."""
+    paradigm = {}
+    for subject in subjects:
+        for obj in objects:
+            for region, forms in collect(subject, obj).items():
+                paradigm.setdefault(region, set()).update(forms)
+    return paradigm
+
 def get_phonetic_rules(region: str, is_tvm: bool = False) -> tuple:
     """Get phonetic rules for a given region and verb type."""
     if is_tvm:
@@ -1,6 +1,10 @@
+from backend.tense_modules import VerbCategory, membership_for
+
+
 class ConjugationValidator:
-    def __init__(self, tense_modules, simplified_tense_mapping, simplified_aspect_mapping):
+    def __init__(self, tense_modules, simplified_tense_mapping, simplified_aspect_mapping, membership=None):
         self.tense_modules = tense_modules
+        self.membership = membership if membership is not None else membership_for(tense_modules)
         self.simplified_tense_mapping = simplified_tense_mapping
         self.simplified_aspect_mapping = simplified_aspect_mapping
         self.special_verb_errors = {
@@ -89,21 +93,10 @@ class ConjugationValidator:
         if not obj:  # If no object, no need to validate
             return None
             
-        # Check if verb exists in any non-TVM module
-        exists_in_other_modules = False
-        for module_key, module in self.tense_modules.items():
-            if not module_key.startswith('tvm'):
-                if hasattr(module, 'verbs') and infinitive in module.verbs:
-                    exists_in_other_modules = True
-                    break
-
-        # Check if verb exists in TVM modules
-        exists_in_tvm = False
-        for module_key, module in self.tense_modules.items():
-            if module_key.startswith('tvm'):
-                if hasattr(module, 'verbs') and infinitive in module.verbs:
-                    exists_in_tvm = True
-                    break
+        # Check if verb exists in any non-TVM module, and in any TVM module
+        categories = self.membership.get(infinitive).categories
+        exists_in_other_modules = bool(categories & (VerbCategory.IVD | VerbCategory.TVE))
+        exists_in_tvm = bool(categories & (VerbCategory.TVM | VerbCategory.TVM_TVE))
 
         # Only return error if verb is TVM-only (exists in TVM but not in other modules)
         if exists_in_tvm and not exists_in_other_modules: